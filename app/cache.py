@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import hashlib
 import pickle
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
 
-CACHE_VERSION = "reference-loader-v3"
+CACHE_VERSION = "reference-loader-v4"
 CACHE_DIR = Path(__file__).parent.parent / ".cache" / "dpmptsp-report-generator"
 
 
@@ -61,10 +62,28 @@ def load_or_build(
     elapsed = time.perf_counter() - start
 
     if data is not None:
+        _store(cache_path, data)
+
+    return CacheLoadResult(data=data, status="parsed", elapsed_seconds=elapsed, path=cache_path)
+
+
+def _store(cache_path: Path, data: Any) -> None:
+    """
+    Pickle data to cache_path via a temp file unique to this writer.
+
+    Concurrent builds of the same key (thread pools in the loaders) each
+    write their own temp file; the last replace wins. A failed write or
+    replace only leaves the entry uncached.
+    """
+    tmp_path = None
+    try:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        tmp_path = cache_path.with_suffix(".tmp")
-        with tmp_path.open("wb") as handle:
+        with tempfile.NamedTemporaryFile(
+            dir=CACHE_DIR, prefix=f"{cache_path.stem}-", suffix=".tmp", delete=False
+        ) as handle:
+            tmp_path = Path(handle.name)
             pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
         tmp_path.replace(cache_path)
-
-    return CacheLoadResult(data=data, status="parsed", elapsed_seconds=elapsed, path=cache_path)
+    except OSError:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
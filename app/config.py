@@ -1,7 +1,9 @@
 # DPMPTSP Automated Reporting System - Configuration
 
+import sys
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 # Base paths
 BASE_DIR = Path(__file__).parent.parent
@@ -13,7 +15,7 @@ STORAGE_DIR = BASE_DIR / "storage" / "uploads"
 LOGO_PATH = DATA_DIR / "logo.webp"
 
 # Kabupaten/Kota di Provinsi Lampung
-KABUPATEN_KOTA: List[str] = [
+KABUPATEN_KOTA: Tuple[str, ...] = tuple(sys.intern(nama) for nama in [
     "Kab. Lampung Barat",
     "Kab. Lampung Selatan", 
     "Kab. Lampung Tengah",
@@ -29,10 +31,10 @@ KABUPATEN_KOTA: List[str] = [
     "Kab. Way Kanan",
     "Kota Bandar Lampung",
     "Kota Metro",
-]
+])
 
 # Mapping bulan ke Triwulan
-BULAN_KE_TRIWULAN: Dict[str, str] = {
+BULAN_KE_TRIWULAN: Mapping[str, str] = MappingProxyType({
     "Januari": "TW I",
     "Februari": "TW I", 
     "Maret": "TW I",
@@ -45,10 +47,10 @@ BULAN_KE_TRIWULAN: Dict[str, str] = {
     "Oktober": "TW IV",
     "November": "TW IV",
     "Desember": "TW IV",
-}
+})
 
 # Mapping bulan ke Semester
-BULAN_KE_SEMESTER: Dict[str, str] = {
+BULAN_KE_SEMESTER: Mapping[str, str] = MappingProxyType({
     "Januari": "Semester I",
     "Februari": "Semester I",
     "Maret": "Semester I",
@@ -61,21 +63,30 @@ BULAN_KE_SEMESTER: Dict[str, str] = {
     "Oktober": "Semester II",
     "November": "Semester II",
     "Desember": "Semester II",
-}
+})
 
 # Triwulan ke bulan
-TRIWULAN_KE_BULAN: Dict[str, List[str]] = {
-    "TW I": ["Januari", "Februari", "Maret"],
-    "TW II": ["April", "Mei", "Juni"],
-    "TW III": ["Juli", "Agustus", "September"],
-    "TW IV": ["Oktober", "November", "Desember"],
+TRIWULAN_KE_BULAN: Dict[str, Tuple[str, ...]] = {
+    "TW I": ("Januari", "Februari", "Maret"),
+    "TW II": ("April", "Mei", "Juni"),
+    "TW III": ("Juli", "Agustus", "September"),
+    "TW IV": ("Oktober", "November", "Desember"),
 }
 
-# Nama bulan dalam Bahasa Indonesia
-NAMA_BULAN: List[str] = [
+# Semester ke bulan
+SEMESTER_KE_BULAN: Dict[str, Tuple[str, ...]] = {
+    "Semester I": TRIWULAN_KE_BULAN["TW I"] + TRIWULAN_KE_BULAN["TW II"],
+    "Semester II": TRIWULAN_KE_BULAN["TW III"] + TRIWULAN_KE_BULAN["TW IV"],
+}
+
+# Nama bulan dalam Bahasa Indonesia (urut)
+NAMA_BULAN: Tuple[str, ...] = (
     "Januari", "Februari", "Maret", "April", "Mei", "Juni",
     "Juli", "Agustus", "September", "Oktober", "November", "Desember"
-]
+)
+
+# Indeks bulan (0-11)
+BULAN_INDEX: Mapping[str, int] = MappingProxyType({m: i for i, m in enumerate(NAMA_BULAN)})
 
 # Skala Usaha
 SKALA_USAHA: List[str] = [
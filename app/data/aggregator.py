@@ -7,27 +7,102 @@ This module handles aggregation of NIB data for different periods:
 - Tahunan (Annual): Full year
 """
 
+import copy
+import heapq
+import io
+import logging
+import os
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
 
+from app.config import (
+    BULAN_INDEX,
+    NAMA_BULAN,
+    SEMESTER_KE_BULAN as SEMESTER_MONTHS,
+    TRIWULAN_KE_BULAN as TRIWULAN_MONTHS,
+)
 from .loader import DataLoader, NIBData
 
 
-@dataclass 
+logger = logging.getLogger(__name__)
+
+# Count columns of the per-month NIB frames, in AggregatedNIBData.counts order
+COUNT_COLUMNS = [
+    'pma', 'pmdn', 'usaha_mikro', 'usaha_kecil', 'usaha_menengah', 'usaha_besar', 'total'
+]
+
+# Triwulan -> (previous triwulan, year offset)
+PREV_TRIWULAN_OFFSET: Dict[str, Tuple[str, int]] = {
+    "TW I": ("TW IV", -1),
+    "TW II": ("TW I", 0),
+    "TW III": ("TW II", 0),
+    "TW IV": ("TW III", 0),
+}
+
+
+# Leading columns of DataAggregator.to_dataframe, before the monthly breakdown
+DATAFRAME_BASE_COLUMNS = [
+    'Kabupaten/Kota', 'PMA', 'PMDN', 'Usaha Mikro', 'Usaha Kecil',
+    'Usaha Menengah', 'Usaha Besar', 'UMK', 'NON-UMK', 'Total'
+]
+
+# Generated to_dataframe row builders, keyed by the months they emit
+_ROW_BUILDERS: Dict[Tuple[str, ...], Callable[[str, "AggregatedNIBData"], tuple]] = {}
+
+
+def _row_builder(months: Tuple[str, ...]) -> Callable[[str, "AggregatedNIBData"], tuple]:
+    """
+    Return a function producing one to_dataframe row for the given months.
+    
+    The monthly lookups are unrolled into straight-line code once per months
+    tuple, so building a row needs no inner loop over the months.
+    """
+    builder = _ROW_BUILDERS.get(months)
+    if builder is None:
+        month_values = "".join(f", period_data.get({month!r}, 0)" for month in months)
+        source = (
+            "def build(kab_kota, agg):\n"
+            "    period_data = agg.period_data\n"
+            "    return (kab_kota, agg.pma_total, agg.pmdn_total, agg.usaha_mikro_total,"
+            " agg.usaha_kecil_total, agg.usaha_menengah_total, agg.usaha_besar_total,"
+            f" agg.umk_total, agg.non_umk_total, agg.grand_total{month_values})\n"
+        )
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, f"<to_dataframe row builder {len(months)} months>", "exec"), namespace)
+        builder = _ROW_BUILDERS[months] = namespace["build"]
+    return builder
+
+
+def _counter(index: int) -> property:
+    """Expose one slot of AggregatedNIBData.counts as an int attribute."""
+    def getter(self) -> int:
+        return int(self.counts[index])
+    
+    def setter(self, value: int) -> None:
+        self.counts[index] = value
+    
+    return property(getter, setter)
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class AggregatedNIBData:
     """Aggregated NIB data for a specific period"""
     kabupaten_kota: str
     period_data: Dict[str, int] = field(default_factory=dict)  # month -> total
-    pma_total: int = 0
-    pmdn_total: int = 0
-    usaha_mikro_total: int = 0
-    usaha_kecil_total: int = 0
-    usaha_menengah_total: int = 0
-    usaha_besar_total: int = 0
-    grand_total: int = 0
+    # Counters in COUNT_COLUMNS order
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(len(COUNT_COLUMNS), dtype=np.int32))
+    
+    pma_total = _counter(0)
+    pmdn_total = _counter(1)
+    usaha_mikro_total = _counter(2)
+    usaha_kecil_total = _counter(3)
+    usaha_menengah_total = _counter(4)
+    usaha_besar_total = _counter(5)
+    grand_total = _counter(6)
     
     @property
     def umk_total(self) -> int:
@@ -38,16 +113,13 @@ class AggregatedNIBData:
         return self.usaha_menengah_total + self.usaha_besar_total
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class PeriodReport:
     """Complete report data for a specific period"""
     period_type: str  # "Triwulan", "Semester", "Tahunan"
     period_name: str  # "TW I", "TW II", etc.
     year: int
-    months_included: List[str]
-    
-    # Aggregated data by Kabupaten/Kota
-    data_by_location: Dict[str, AggregatedNIBData] = field(default_factory=dict)
+    months_included: Sequence[str]
     
     # Summary totals
     total_nib: int = 0
@@ -56,12 +128,35 @@ class PeriodReport:
     total_umk: int = 0
     total_non_umk: int = 0
     
-    # Monthly breakdown
-    monthly_totals: Dict[str, int] = field(default_factory=dict)
-    
     # Comparison with previous period (if available)
     prev_period_total: Optional[int] = None
     change_percentage: Optional[float] = None
+    
+    # Backing dicts, allocated on first access (empty reports never need them)
+    _data_by_location: Optional[Dict[str, AggregatedNIBData]] = field(default=None, init=False)
+    _monthly_totals: Optional[Dict[str, int]] = field(default=None, init=False)
+    
+    @property
+    def data_by_location(self) -> Dict[str, AggregatedNIBData]:
+        """Aggregated data by Kabupaten/Kota"""
+        if self._data_by_location is None:
+            self._data_by_location = {}
+        return self._data_by_location
+    
+    @data_by_location.setter
+    def data_by_location(self, value: Dict[str, AggregatedNIBData]) -> None:
+        self._data_by_location = value
+    
+    @property
+    def monthly_totals(self) -> Dict[str, int]:
+        """Monthly breakdown (month -> total)"""
+        if self._monthly_totals is None:
+            self._monthly_totals = {}
+        return self._monthly_totals
+    
+    @monthly_totals.setter
+    def monthly_totals(self, value: Dict[str, int]) -> None:
+        self._monthly_totals = value
 
 
 class DataAggregator:
@@ -75,50 +170,71 @@ class DataAggregator:
     - Quarter-over-Quarter (Q-o-Q) comparison
     """
     
-    TRIWULAN_MONTHS = {
-        "TW I": ["Januari", "Februari", "Maret"],
-        "TW II": ["April", "Mei", "Juni"],
-        "TW III": ["Juli", "Agustus", "September"],
-        "TW IV": ["Oktober", "November", "Desember"],
-    }
-    
-    SEMESTER_MONTHS = {
-        "Semester I": ["Januari", "Februari", "Maret", "April", "Mei", "Juni"],
-        "Semester II": ["Juli", "Agustus", "September", "Oktober", "November", "Desember"],
-    }
-    
     def __init__(self):
         self.loader = DataLoader()
         self.loaded_data: Dict[str, Dict] = {}  # month -> data
+        # (period_type, period_name, year) -> report; reset whenever loaded_data changes
+        self._report_cache: Dict[Tuple[str, str, int], PeriodReport] = {}
+    
+    def clear_cache(self) -> None:
+        """Drop memoized period reports (call after editing loaded_data directly)."""
+        self._report_cache.clear()
     
     def load_files(self, file_inputs: List[Any]) -> None:
         """
         Load multiple Excel files and store their data.
         
+        Files are parsed concurrently; results are merged into
+        ``loaded_data`` on the calling thread.
+        
         Args:
             file_inputs: List of file paths or Streamlit UploadedFile objects
         """
-        for file_input in file_inputs:
-            try:
-                # Handle Streamlit UploadedFile
-                if hasattr(file_input, 'getvalue') and hasattr(file_input, 'name'):
-                    data = self.loader.load_monthly_data(file_input.getvalue(), filename=file_input.name)
-                    filename_for_log = file_input.name
-                # Handle Path or str
-                else:
-                    data = self.loader.load_monthly_data(file_input)
-                    filename_for_log = str(file_input)
-                
-                month = data.get('month')
-                year = data.get('year')
-                if month and year:
-                    key = f"{month}_{year}"
-                    self.loaded_data[key] = data
-                    print(f"Loaded: {filename_for_log} -> {key}")
-                elif month: # Fallback if year missing
-                     self.loaded_data[month] = data # Warning: unsafe
-            except Exception as e:
-                print(f"Error loading {file_input}: {e}")
+        if not file_inputs:
+            return
+        
+        max_workers = min(12, os.cpu_count() or 1, len(file_inputs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._load_one, file_inputs))
+        
+        for result in results:
+            if result is not None:
+                key, data = result
+                self.loaded_data[key] = data
+        
+        self.clear_cache()
+    
+    def _load_one(self, file_input: Any) -> Optional[Tuple[str, Dict]]:
+        """
+        Parse a single monthly file.
+        
+        Args:
+            file_input: File path or Streamlit UploadedFile object
+            
+        Returns:
+            Tuple of (loaded_data key, parsed data), or None if unusable
+        """
+        try:
+            # Handle Streamlit UploadedFile
+            if hasattr(file_input, 'getvalue') and hasattr(file_input, 'name'):
+                data = self.loader.load_from_bytes(io.BytesIO(file_input.getvalue()), file_input.name)
+                filename_for_log = file_input.name
+            # Handle Path or str
+            else:
+                data = self.loader.load_monthly_data(file_input)
+                filename_for_log = str(file_input)
+            
+            month = data.get('month')
+            year = data.get('year')
+            if month and year:
+                key = f"{month}_{year}"
+                logger.info("Loaded: %s -> %s", filename_for_log, key)
+                return key, data
+            elif month: # Fallback if year missing
+                return month, data # Warning: unsafe
+        except Exception:
+            logger.exception("Error loading %s", file_input)
+        return None
     
     def aggregate_triwulan(self, triwulan: str, year: int) -> PeriodReport:
         """
@@ -131,7 +247,7 @@ class DataAggregator:
         Returns:
             PeriodReport for the quarter
         """
-        months = self.TRIWULAN_MONTHS.get(triwulan, [])
+        months = TRIWULAN_MONTHS.get(triwulan, ())
         return self._aggregate_period(
             period_type="Triwulan",
             period_name=triwulan,
@@ -150,7 +266,7 @@ class DataAggregator:
         Returns:
             PeriodReport for the semester
         """
-        months = self.SEMESTER_MONTHS.get(semester, [])
+        months = SEMESTER_MONTHS.get(semester, ())
         return self._aggregate_period(
             period_type="Semester",
             period_name=semester,
@@ -168,15 +284,11 @@ class DataAggregator:
         Returns:
             PeriodReport for the year
         """
-        all_months = [
-            "Januari", "Februari", "Maret", "April", "Mei", "Juni",
-            "Juli", "Agustus", "September", "Oktober", "November", "Desember"
-        ]
         return self._aggregate_period(
             period_type="Tahunan",
             period_name=str(year),
             year=year,
-            months=all_months
+            months=NAMA_BULAN
         )
     
     def _aggregate_period(
@@ -184,7 +296,7 @@ class DataAggregator:
         period_type: str, 
         period_name: str, 
         year: int, 
-        months: List[str]
+        months: Sequence[str]
     ) -> PeriodReport:
         """
         Internal method to aggregate data for any period.
@@ -198,6 +310,11 @@ class DataAggregator:
         Returns:
             PeriodReport with aggregated data
         """
+        cache_key = (period_type, period_name, year)
+        cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         report = PeriodReport(
             period_type=period_type,
             period_name=period_name,
@@ -205,11 +322,8 @@ class DataAggregator:
             months_included=months
         )
         
-        # Aggregate data by location
-        location_data: Dict[str, AggregatedNIBData] = defaultdict(
-            lambda: AggregatedNIBData(kabupaten_kota="")
-        )
-        
+        # Collect the per-month NIB frames for the period
+        frames = []
         for month in months:
             # Try specific year first
             key = f"{month}_{year}"
@@ -222,42 +336,63 @@ class DataAggregator:
             if not month_data:
                 continue
             
-            nib_list = month_data.get('nib', [])
-            month_total = 0
+            frame = month_data.get('nib_frame')
+            if frame is None:
+                frame = self.loader.build_nib_frame(month_data.get('nib', []), month)
+            frames.append(frame)
+            report.monthly_totals[month] = 0
+        
+        location_data: Dict[str, AggregatedNIBData] = {}
+        
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+            # A handful of labels repeat across every month: dictionary-encode
+            # them once so both groupbys below work on small integer codes
+            df['kabupaten_kota'] = df['kabupaten_kota'].astype('category')
+            locations = df['kabupaten_kota'].unique()
+            
+            # Rows with no activity add nothing; drop them before grouping
+            df = df[df[COUNT_COLUMNS].to_numpy().any(axis=1)]
             
-            for nib in nib_list:
-                kab_kota = nib.kabupaten_kota
-                
-                if kab_kota not in location_data:
-                    location_data[kab_kota] = AggregatedNIBData(
-                        kabupaten_kota=kab_kota
-                    )
-                
-                agg = location_data[kab_kota]
-                agg.period_data[month] = nib.total
-                agg.pma_total += nib.pma
-                agg.pmdn_total += nib.pmdn
-                agg.usaha_mikro_total += nib.usaha_mikro
-                agg.usaha_kecil_total += nib.usaha_kecil
-                agg.usaha_menengah_total += nib.usaha_menengah
-                agg.usaha_besar_total += nib.usaha_besar
-                agg.grand_total += nib.total
-                
-                month_total += nib.total
+            # Reduce all rows of the period in one pass per grouping, keeping
+            # locations that had no activity at all as zero rows
+            agg_df = (
+                df.groupby('kabupaten_kota', sort=False, observed=True)[COUNT_COLUMNS].sum()
+                .reindex(locations, fill_value=0)
+            )
+            location_counts = agg_df.to_numpy(dtype=np.int32)
+            for kab_kota, counts in zip(agg_df.index, location_counts):
+                location_data[kab_kota] = AggregatedNIBData(kabupaten_kota=kab_kota, counts=counts)
             
-            report.monthly_totals[month] = month_total
+            period_totals = df.groupby(['kabupaten_kota', 'month'], sort=False, observed=True)['total'].sum()
+            for (kab_kota, month), total in period_totals.items():
+                location_data[kab_kota].period_data[month] = int(total)
+            
+            # Bucket monthly totals by calendar index instead of grouping on names
+            month_sums = np.bincount(
+                df['month'].map(BULAN_INDEX).to_numpy(dtype=np.intp),
+                weights=df['total'].to_numpy(),
+                minlength=len(BULAN_INDEX),
+            )
+            for month in report.monthly_totals:
+                report.monthly_totals[month] = int(month_sums[BULAN_INDEX[month]])
         
         # Store aggregated data
-        report.data_by_location = dict(location_data)
+        if location_data:
+            report.data_by_location = location_data
         
         # Calculate summary totals
-        for agg in location_data.values():
-            report.total_nib += agg.grand_total
-            report.total_pma += agg.pma_total
-            report.total_pmdn += agg.pmdn_total
-            report.total_umk += agg.umk_total
-            report.total_non_umk += agg.non_umk_total
+        if location_data:
+            pma, pmdn, mikro, kecil, menengah, besar, total = (
+                int(value) for value in location_counts.sum(axis=0, dtype=np.int64)
+            )
+            report.total_nib = total
+            report.total_pma = pma
+            report.total_pmdn = pmdn
+            report.total_umk = mikro + kecil
+            report.total_non_umk = menengah + besar
         
+        self._report_cache[cache_key] = report
         return report
     
     def get_qoq_comparison(
@@ -275,19 +410,18 @@ class DataAggregator:
         Returns:
             Tuple of (current_report, previous_report, change_percentage)
         """
-        triwulan_order = ["TW I", "TW II", "TW III", "TW IV"]
-        
         current_report = self.aggregate_triwulan(current_triwulan, year)
         
-        # Determine previous quarter
-        current_idx = triwulan_order.index(current_triwulan)
-        if current_idx == 0:
-            # TW I -> previous is TW IV of last year
-            prev_triwulan = "TW IV"
-            prev_year = year - 1
-        else:
-            prev_triwulan = triwulan_order[current_idx - 1]
-            prev_year = year
+        # Determine previous quarter (TW I -> TW IV of last year)
+        prev_triwulan, year_offset = PREV_TRIWULAN_OFFSET[current_triwulan]
+        prev_year = year + year_offset
+        
+        # Skip the aggregation pass when none of the previous quarter's months are loaded
+        if not any(
+            f"{month}_{prev_year}" in self.loaded_data or month in self.loaded_data
+            for month in TRIWULAN_MONTHS[prev_triwulan]
+        ):
+            return current_report, None, None
         
         # Try to get previous quarter data
         try:
@@ -298,9 +432,11 @@ class DataAggregator:
                     (current_report.total_nib - prev_report.total_nib) 
                     / prev_report.total_nib * 100
                 )
-                current_report.prev_period_total = prev_report.total_nib
-                current_report.change_percentage = change_pct
-                return current_report, prev_report, change_pct
+                # Comparison fields go on a copy: current_report is shared via _report_cache
+                compared = copy.copy(current_report)
+                compared.prev_period_total = prev_report.total_nib
+                compared.change_percentage = change_pct
+                return compared, prev_report, change_pct
         except Exception:
             pass
         
@@ -316,32 +452,14 @@ class DataAggregator:
         Returns:
             DataFrame with aggregated data
         """
-        data = []
-        for kab_kota, agg in report.data_by_location.items():
-            row = {
-                'Kabupaten/Kota': kab_kota,
-                'PMA': agg.pma_total,
-                'PMDN': agg.pmdn_total,
-                'Usaha Mikro': agg.usaha_mikro_total,
-                'Usaha Kecil': agg.usaha_kecil_total,
-                'Usaha Menengah': agg.usaha_menengah_total,
-                'Usaha Besar': agg.usaha_besar_total,
-                'UMK': agg.umk_total,
-                'NON-UMK': agg.non_umk_total,
-                'Total': agg.grand_total,
-            }
-            
-            # Add monthly breakdown
-            for month in report.months_included:
-                row[month] = agg.period_data.get(month, 0)
-            
-            data.append(row)
-        
-        df = pd.DataFrame(data)
+        months = tuple(dict.fromkeys(report.months_included))
+        build_row = _row_builder(months)
+        rows = [build_row(kab_kota, agg) for kab_kota, agg in report.data_by_location.items()]
+        df = pd.DataFrame(rows, columns=[*DATAFRAME_BASE_COLUMNS, *months])
         
         # Sort by total descending
-        if not df.empty and 'Total' in df.columns:
-            df = df.sort_values('Total', ascending=False).reset_index(drop=True)
+        if not df.empty:
+            df = df.sort_values('Total', ascending=False, ignore_index=True)
         
         return df
     
@@ -355,13 +473,17 @@ class DataAggregator:
         Returns:
             Dictionary with summary statistics
         """
-        df = self.to_dataframe(report)
-        
-        if df.empty:
+        if not report.data_by_location:
             return {}
         
         # Top 5 locations by total
-        top_5 = df.nlargest(5, 'Total')[['Kabupaten/Kota', 'Total']].to_dict('records')
+        top_locations = heapq.nlargest(
+            5, report.data_by_location.items(), key=lambda item: item[1].grand_total
+        )
+        top_5 = [
+            {'Kabupaten/Kota': kab_kota, 'Total': agg.grand_total}
+            for kab_kota, agg in top_locations
+        ]
         
         # PM distribution - use PMA+PMDN as base for percentage calculation
         pm_total = report.total_pma + report.total_pmdn
@@ -5,12 +5,67 @@ This module handles reading and parsing Excel files containing
 NIB (Nomor Induk Berusaha) data from DPMPTSP Provinsi Lampung.
 """
 
+import numpy as np
 import pandas as pd
 import re
 import io
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+from app.cache import load_or_build
+
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# pandas accepts engine="calamine" from 2.2 on; older versions reject it as unknown
+PANDAS_HAS_CALAMINE = tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+
+# Rust-based calamine reader when installed and supported; otherwise pandas'
+# default openpyxl reader, which already opens workbooks read-only with cached values
+EXCEL_ENGINE: Optional[str] = "calamine" if CALAMINE_AVAILABLE and PANDAS_HAS_CALAMINE else None
+
+logger = logging.getLogger(__name__)
+
+
+# Pulls one NIBData row in NIB_FRAME_COLUMNS order in a single call
+_NIB_GETTER = attrgetter(
+    'kabupaten_kota', 'pma', 'pmdn', 'usaha_mikro', 'usaha_kecil',
+    'usaha_menengah', 'usaha_besar', 'total'
+)
+
+# Display column -> SektorResikoData attribute, in get_sektor_resiko_dataframe order
+_SEKTOR_RESIKO_COLUMNS = {
+    'Kabupaten/Kota': 'kabupaten_kota',
+    'Risiko Rendah': 'risiko_rendah',
+    'Risiko Menengah Rendah': 'risiko_menengah_rendah',
+    'Risiko Menengah Tinggi': 'risiko_menengah_tinggi',
+    'Risiko Tinggi': 'risiko_tinggi',
+    'Energi': 'sektor_energi',
+    'Kelautan': 'sektor_kelautan',
+    'Kesehatan': 'sektor_kesehatan',
+    'Komunikasi': 'sektor_komunikasi',
+    'Pariwisata': 'sektor_pariwisata',
+    'Perhubungan': 'sektor_perhubungan',
+    'Perindustrian': 'sektor_perindustrian',
+    'Pertanian': 'sektor_pertanian',
+    'Total': 'total',
+}
+_SEKTOR_RESIKO_GETTER = attrgetter(*_SEKTOR_RESIKO_COLUMNS.values())
+
+
+def _isna(value) -> bool:
+    """Scalar missing-value check for per-cell loops (None or float NaN), without pandas dispatch."""
+    return value is None or (isinstance(value, float) and value != value)
 
 
 @dataclass
@@ -36,7 +91,7 @@ class NIBData:
         return self.usaha_menengah + self.usaha_besar
 
 
-@dataclass
+@dataclass(slots=True)
 class SektorResikoData:
     """Data structure for risk-based permit data per Kabupaten/Kota"""
     kabupaten_kota: str
@@ -62,7 +117,7 @@ class SektorResikoData:
         return self.risiko_rendah + self.risiko_menengah_rendah + self.risiko_menengah_tinggi + self.risiko_tinggi
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestmentData:
     """Data structure for investment realization data per Wilayah/Sektor"""
     name: str  # Wilayah or Sektor name
@@ -99,32 +154,20 @@ class InvestmentReport:
     year: int
     # PMA data
     pma_total: float = 0  # Total PMA value in Rupiah
-    pma_by_wilayah: list = None  # List[InvestmentData]
-    pma_by_sektor: list = None  # List[InvestmentData]
+    pma_by_wilayah: List[InvestmentData] = field(default_factory=list)
+    pma_by_sektor: List[InvestmentData] = field(default_factory=list)
     pma_proyek: int = 0
     pma_tki: int = 0
     pma_tka: int = 0
     # PMDN data
     pmdn_total: float = 0  # Total PMDN value in Rupiah
-    pmdn_by_wilayah: list = None  # List[InvestmentData]
-    pmdn_by_sektor: list = None  # List[InvestmentData]
+    pmdn_by_wilayah: List[InvestmentData] = field(default_factory=list)
+    pmdn_by_sektor: List[InvestmentData] = field(default_factory=list)
     pmdn_proyek: int = 0
     pmdn_tki: int = 0
     pmdn_tka: int = 0
     # By country (for PMA)
-    by_country: list = None  # List[InvestmentData]
-    
-    def __post_init__(self):
-        if self.pma_by_wilayah is None:
-            self.pma_by_wilayah = []
-        if self.pma_by_sektor is None:
-            self.pma_by_sektor = []
-        if self.pmdn_by_wilayah is None:
-            self.pmdn_by_wilayah = []
-        if self.pmdn_by_sektor is None:
-            self.pmdn_by_sektor = []
-        if self.by_country is None:
-            self.by_country = []
+    by_country: List[InvestmentData] = field(default_factory=list)
     
     @property
     def total_investasi(self) -> float:
@@ -168,6 +211,15 @@ class DataLoader:
         'total': 8
     }
     
+    # Kab/Kota labels that mean "no location" (compared upper-case)
+    NULL_LOCATION_LABELS = ["NULL", "NONE", "NAN", "-", ""]
+    
+    # Columns of the per-month frame used for period aggregation
+    NIB_FRAME_COLUMNS = [
+        'kabupaten_kota', 'pma', 'pmdn', 'usaha_mikro', 'usaha_kecil',
+        'usaha_menengah', 'usaha_besar', 'total'
+    ]
+    
     # Known sheet names patterns
     MONTHLY_SHEET_PATTERNS = [
         r"PERIZINAN BERUSAHA (\w+)",
@@ -175,7 +227,47 @@ class DataLoader:
         r"SEKTOR & RESIKO (\w+)",
         r"SEKTOR RESIKO (\w+)"
     ]
+    # Upper-case Indonesian month names as they appear in sheet and file names
+    MONTH_NAME_RE = re.compile(
+        "JANUARI|FEBRUARI|MARET|APRIL|MEI|JUNI|JULI|AGUSTUS|SEPTEMBER|OKTOBER|NOVEMBER|DESEMBER"
+    )
     
+    # First four-digit run in a filename is the report year
+    YEAR_RE = re.compile(r'(\d{4})')
+    
+    # All patterns in one compiled regex; the month is the last matched group
+    MONTHLY_SHEET_RE = re.compile("|".join(MONTHLY_SHEET_PATTERNS), re.IGNORECASE)
+    
+    # Sheet names that hold NIB data in monthly files (matched on upper-case names)
+    NIB_SHEET_RE = re.compile("NIB|SKALA NIB|SKALA|DATA NIB")
+    
+    # Header/summary row labels skipped by each parser (matched on upper-case labels)
+    NIB_SKIP_RE = re.compile("JUMLAH|TOTAL|GRAND|STATUS PM|SKALA USAHA|KABUPATEN|NO")
+    PB_SKIP_RE = re.compile("JUMLAH|TOTAL|GRAND|STATUS PM|KABUPATEN|NO|URAIAN")
+    SEKTOR_RESIKO_SKIP_RE = re.compile("JUMLAH|TOTAL|GRAND|RISIKO|SEKTOR|NO")
+    INVESTMENT_SKIP_RE = re.compile("JUMLAH|TOTAL|GRAND|NO")
+    
+    # Triwulan of a REALISASI INVESTASI sheet, matched on the name without spaces
+    TRIWULAN_SHEET_RE = re.compile("TW(IV|III|II|I)")
+    
+    # (investor, breakdown) of a REALISASI INVESTASI sheet ->
+    # (InvestmentReport list attribute, totals prefix, whether it sets the totals)
+    INVESTMENT_SHEET_KINDS = {
+        ("PMA", "SEKTOR"): ("pma_by_sektor", "pma", True),
+        ("PMA", "WILAYAH"): ("pma_by_wilayah", "pma", False),
+        ("PMDN", "SEKTOR"): ("pmdn_by_sektor", "pmdn", True),
+        ("PMDN", "WILAYAH"): ("pmdn_by_wilayah", "pmdn", False),
+    }
+
+    # Version of the cached load_realisasi_investasi reports. The cache key is
+    # only the workbook bytes and this version, so bump it whenever a change
+    # would alter the parsed reports: _build_realisasi_investasi,
+    # _parse_investment_rows and the helpers it calls (_location_labels,
+    # _float_block, _numeric_block), INVESTMENT_SHEET_KINDS, INVESTMENT_SKIP_RE,
+    # TRIWULAN_SHEET_RE / _sheet_triwulan, or the InvestmentReport and
+    # InvestmentData fields.
+    INVESTMENT_CACHE_VERSION = "realisasi-investasi-v1"
+
     def __init__(self):
         self.data_cache: Dict[str, pd.DataFrame] = {}
     
@@ -193,17 +285,7 @@ class DataLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        xl = pd.ExcelFile(file_path)
-        sheets = {}
-        
-        for sheet_name in xl.sheet_names:
-            try:
-                df = pd.read_excel(xl, sheet_name=sheet_name, header=None, keep_default_na=False, na_values=[''])
-                sheets[sheet_name] = df
-            except Exception as e:
-                print(f"Warning: Could not load sheet '{sheet_name}': {e}")
-        
-        return sheets
+        return self._read_sheets(file_path)
     
     def load_file_from_bytes(self, file_bytes, filename: str = "") -> Dict[str, pd.DataFrame]:
         """
@@ -216,18 +298,91 @@ class DataLoader:
         Returns:
             Dictionary mapping sheet names to DataFrames
         """
-        xl = pd.ExcelFile(file_bytes)
+        return self._load_cached_sheets(file_bytes, filename)
+    
+    def _load_cached_sheets(
+        self,
+        file_bytes,
+        filename: str = "",
+        scope: str = "sheets",
+        sheet_filter: Optional[Callable[[str], Any]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Read workbook sheets from bytes through the on-disk parse cache.
+        
+        Parsed sheets are cached by content hash, so re-uploads of the same
+        workbook skip Excel parsing.
+        
+        Args:
+            file_bytes: BytesIO object containing the Excel file
+            filename: Original filename for reference
+            scope: Cache namespace of the sheet subset; one per sheet_filter
+            sheet_filter: Only read sheets whose name it accepts
+            
+        Returns:
+            Dictionary mapping sheet names to DataFrames
+        """
+        content = file_bytes.getvalue() if hasattr(file_bytes, 'getvalue') else file_bytes.read()
+        result = load_or_build(
+            f"loader-{scope}-{EXCEL_ENGINE or 'openpyxl'}",
+            content,
+            filename,
+            0,  # Sheets do not depend on the report year
+            lambda data, _filename, _year: self._read_sheets(io.BytesIO(data), sheet_filter),
+        )
+        return result.data
+    
+    def _read_sheets(self, source, sheet_filter: Optional[Callable[[str], Any]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Read the sheets of a workbook as header-less DataFrames.
+        
+        Args:
+            source: Path or file-like object of the Excel file
+            sheet_filter: Skip sheets whose name it rejects (summary tabs,
+                charts) without parsing them
+            
+        Returns:
+            Dictionary mapping sheet names to DataFrames
+        """
         sheets = {}
         
-        for sheet_name in xl.sheet_names:
-            try:
-                df = pd.read_excel(xl, sheet_name=sheet_name, header=None, keep_default_na=False, na_values=[''])
-                sheets[sheet_name] = df
-            except Exception as e:
-                print(f"Warning: Could not load sheet '{sheet_name}': {e}")
+        with pd.ExcelFile(source, engine=EXCEL_ENGINE) as xl:
+            for sheet_name in xl.sheet_names:
+                if sheet_filter is not None and not sheet_filter(sheet_name):
+                    continue
+                try:
+                    df = pd.read_excel(xl, sheet_name=sheet_name, header=None, keep_default_na=False, na_values=[''])
+                    sheets[sheet_name] = df
+                except Exception as e:
+                    logger.warning("Could not load sheet '%s': %s", sheet_name, e)
         
         return sheets
     
+    def _is_month_sheet(self, sheet_name: str) -> bool:
+        """Whether a sheet name contains a month (quarterly NIB files)."""
+        return self.MONTH_NAME_RE.search(sheet_name.upper()) is not None
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _sheet_triwulan(sheet_name: str) -> Optional[str]:
+        """
+        Triwulan of a REALISASI INVESTASI sheet ("TW I" or "TWI" -> "TW I"), or None.
+        
+        Memoized per name: the sheet filter and the parse loop both ask, and
+        the same names recur in every upload of a workbook.
+        """
+        # Longest numerals first so TW I never matches TW II, TW III, TW IV
+        match = DataLoader.TRIWULAN_SHEET_RE.search(sheet_name.upper().replace(" ", ""))
+        return f"TW {match.group(1)}" if match else None
+    
+    def _is_investment_summary_sheet(self, sheet_name: str) -> bool:
+        """Whether a sheet is a REALISASI INVESTASI summary (e.g. "REALISASI INVESTASI 2025")."""
+        sheet_upper = sheet_name.upper()
+        return (
+            ('REALISASI INVESTASI' in sheet_upper and any(c.isdigit() for c in sheet_name))
+            or sheet_upper.startswith('REALISASI INVESTASI')
+        )
+    
     def load_from_bytes(self, file_bytes, filename: str) -> Dict[str, List]:
         """
         Load a monthly data file from bytes and extract NIB data.
@@ -239,46 +394,65 @@ class DataLoader:
         Returns:
             Dictionary with 'nib' key containing list of NIBData
         """
-        sheets = self.load_file_from_bytes(file_bytes, filename)
         result = {}
         
+        # Quarterly files named as such only need their month sheets
+        if self._is_quarterly_file(filename, ()):
+            sheets = self._load_cached_sheets(file_bytes, filename, "month-sheets", self._is_month_sheet)
+        else:
+            sheets = self.load_file_from_bytes(file_bytes, filename)
+        
         # Check if this is a quarterly file (has multiple months in sheet names)
         is_quarterly = self._is_quarterly_file(filename, sheets)
         
         if is_quarterly:
-            # Return special marker to indicate quarterly file processing needed
+            # Mark as quarterly and parse the month sheets already in hand,
+            # instead of making callers re-open the file
             result['is_quarterly'] = True
             result['sheets'] = sheets
             result['year'] = self.extract_year_from_filename(filename)
+            result['monthly_data'] = self._parse_quarterly_sheets(sheets, result['year'])
             return result
         
         # Regular monthly file processing
-        # Possible NIB sheet names (case-insensitive search)
-        nib_sheet_names = ["NIB", "SKALA NIB", "SKALA", "DATA NIB"]
-        
-        # Find and parse NIB sheet
-        for sheet_name, df in sheets.items():
-            sheet_upper = sheet_name.upper().strip()
-            if any(nib_name in sheet_upper for nib_name in nib_sheet_names):
-                result['nib'] = self.parse_nib_sheet(df)
-                break
-        
-        # If no NIB sheet found, try first sheet that has appropriate structure
-        if 'nib' not in result:
-            for sheet_name, df in sheets.items():
-                nib_data = self.parse_nib_sheet(df)
-                if nib_data:  # If we got valid data
-                    result['nib'] = nib_data
-                    break
+        nib_frame = self._parse_monthly_nib_frame(sheets)
+        if nib_frame is not None:
+            result['nib'] = self.nib_from_frame(nib_frame)
         
         # Extract metadata from filename
         result['month'] = self.extract_month_from_filename(filename)
         result['year'] = self.extract_year_from_filename(filename)
+        result['nib_frame'] = self._with_month(nib_frame, result['month'])
         
         return result
     
-    def _is_quarterly_file(self, filename: str, sheets: Dict) -> bool:
-        """Check if file is a quarterly aggregate file with multiple months."""
+    def _parse_monthly_nib_frame(self, sheets: Dict[str, pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Find and parse the NIB sheet of a monthly file.
+        
+        Returns:
+            NIB frame (NIB_FRAME_COLUMNS), or None if no sheet holds NIB data
+        """
+        # Find and parse NIB sheet (case-insensitive search)
+        for sheet_name, df in sheets.items():
+            if self.NIB_SHEET_RE.search(sheet_name.upper()):
+                return self.parse_nib_frame(df)
+        
+        # If no NIB sheet found, try first sheet that has appropriate structure
+        for sheet_name, df in sheets.items():
+            nib_frame = self.parse_nib_frame(df)
+            if not nib_frame.empty:  # If we got valid data
+                return nib_frame
+        
+        return None
+    
+    def _is_quarterly_file(self, filename: str, sheet_names) -> bool:
+        """
+        Check if file is a quarterly aggregate file with multiple months.
+        
+        Only the filename and sheet names are inspected; ``sheet_names`` may
+        be any iterable of names (a dict of sheets works too).
+        """
         # Check filename for quarterly indicators
         filename_upper = filename.upper()
         if "TW " in filename_upper or "TRIWULAN" in filename_upper:
@@ -286,14 +460,8 @@ class DataLoader:
         
         # Check if sheets have month names (indicating multiple months in one file)
         months_found = set()
-        month_names = ["JANUARI", "FEBRUARI", "MARET", "APRIL", "MEI", "JUNI",
-                       "JULI", "AGUSTUS", "SEPTEMBER", "OKTOBER", "NOVEMBER", "DESEMBER"]
-        
-        for sheet_name in sheets.keys():
-            sheet_upper = sheet_name.upper()
-            for month in month_names:
-                if month in sheet_upper:
-                    months_found.add(month)
+        for sheet_name in sheet_names:
+            months_found.update(self.MONTH_NAME_RE.findall(sheet_name.upper()))
         
         # If more than one month found, it's a quarterly file
         return len(months_found) > 1
@@ -303,207 +471,181 @@ class DataLoader:
         Detect content type based on headers.
         Returns: 'PB', 'SEKTOR_RESIKO', or 'UNKNOWN'
         """
-        # Scan first few rows for keywords
-        for idx in range(min(20, len(df))):
-            row_str = str(df.iloc[idx].values).upper()
-            if "RESIKO" in row_str or "RISIKO" in row_str or "SEKTOR" in row_str:
-                return 'SEKTOR_RESIKO'
-            if "PMA" in row_str and "PMDN" in row_str:
-                return 'PB'
-        return 'UNKNOWN'
+        # Scan first few rows for keywords, all header cells at once
+        header = np.char.upper(df.iloc[:20].to_numpy(dtype=str))
+        
+        def row_has(keyword: str) -> np.ndarray:
+            return (np.char.find(header, keyword) >= 0).any(axis=1)
+        
+        is_sektor_resiko = row_has("RESIKO") | row_has("RISIKO") | row_has("SEKTOR")
+        is_pb = row_has("PMA") & row_has("PMDN")
+        
+        # The first matching row decides, as before
+        matches = np.flatnonzero(is_sektor_resiko | is_pb)
+        if matches.size == 0:
+            return 'UNKNOWN'
+        return 'SEKTOR_RESIKO' if is_sektor_resiko[matches[0]] else 'PB'
 
     def load_quarterly_file(self, file_bytes, filename: str) -> Dict[str, Dict]:
         """
         Load a quarterly file and return data organized by month.
         """
-        sheets = self.load_file_from_bytes(file_bytes, filename)
-        year = self.extract_year_from_filename(filename)
-        
+        sheets = self._load_cached_sheets(file_bytes, filename, "month-sheets", self._is_month_sheet)
+        return self._parse_quarterly_sheets(sheets, self.extract_year_from_filename(filename))
+    
+    def _parse_quarterly_sheets(self, sheets: Dict[str, pd.DataFrame], year: Optional[int]) -> Dict[str, Dict]:
+        """
+        Parse the month sheets of a quarterly file into data organized by month.
+        """
         monthly_data = {}
-        month_names = ["JANUARI", "FEBRUARI", "MARET", "APRIL", "MEI", "JUNI",
-                       "JULI", "AGUSTUS", "SEPTEMBER", "OKTOBER", "NOVEMBER", "DESEMBER"]
         
         # Temporary storage to gather all potential data for each month
-        # Structure: {MonthName: {'pb': List[NIBData], 'sr': List[SektorResikoData]}}
+        # Structure: {MonthName: {'pb': List[pd.DataFrame], 'sr': List[SektorResikoData]}}
         temp_month_data = {}
+        month_sheets = []
 
         for sheet_name, df in sheets.items():
             sheet_upper = sheet_name.upper()
             
             # Find which month this sheet belongs to
-            found_month = None
-            for month in month_names:
-                if month in sheet_upper:
-                    found_month = month.capitalize()
-                    break
-            
-            if not found_month:
+            month_match = self.MONTH_NAME_RE.search(sheet_upper)
+            if not month_match:
                 continue
-                
+            
+            found_month = month_match.group().capitalize()
             if found_month not in temp_month_data:
                 temp_month_data[found_month] = {'pb': [], 'sr': []}
+            month_sheets.append((found_month, sheet_upper, df))
+        
+        # Sheets are independent and parsed in vectorized pandas/numpy code,
+        # so parse them concurrently; map() keeps the original sheet order
+        if month_sheets:
+            max_workers = min(os.cpu_count() or 1, len(month_sheets))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(executor.map(
+                    lambda item: self._parse_quarterly_sheet(item[1], item[2]), month_sheets
+                ))
             
-            # Detect content type
-            content_type = self._detect_sheet_content_type(df)
-            
-            # Parse based on content type, regardless of sheet name
-            if content_type == 'SEKTOR_RESIKO':
-                sr_data = self.parse_sektor_resiko_sheet(df)
-                if sr_data:
-                    temp_month_data[found_month]['sr'].extend(sr_data)
-            
-            elif content_type == 'PB':
-                pb_data = self.parse_perizinan_berusaha_sheet(df)
-                if pb_data:
-                    temp_month_data[found_month]['pb'].extend(pb_data)
-            
-            else:
-                # Fallback to name-based detection if content is ambiguous
-                if "RESIKO" in sheet_upper or "RISIKO" in sheet_upper or "SEKTOR" in sheet_upper:
-                    sr_data = self.parse_sektor_resiko_sheet(df)
-                    if sr_data:
-                        temp_month_data[found_month]['sr'].extend(sr_data)
-                elif "PB" in sheet_upper or "PERIZINAN" in sheet_upper or "NIB" in sheet_upper:
-                    pb_data = self.parse_perizinan_berusaha_sheet(df)
-                    if pb_data:
-                        temp_month_data[found_month]['pb'].extend(pb_data)
+            for (found_month, _, _), (kind, data) in zip(month_sheets, parsed):
+                if kind == 'sr':
+                    temp_month_data[found_month]['sr'].extend(data)
+                elif kind == 'pb':
+                    temp_month_data[found_month]['pb'].append(data)
 
         # Finalize data for each month
         for month_name, data in temp_month_data.items():
-            final_nib_data = []
+            nib_frame = None
             
             # Priority 1: Use PB data (contains PMA/PMDN breakdown)
             if data['pb']:
-                final_nib_data = data['pb']
+                nib_frame = pd.concat(data['pb'], ignore_index=True)
             
-            # Priority 2: Use SR data (Convert to NIBData, contains valid Total)
+            # Priority 2: Use SR data (Convert to NIB rows, contains valid Total)
             # Only if PB data is missing. 
             # This handles the case where "Perizinan Berusaha Mei" actually contains Risk data
             elif data['sr']:
-                print(f"Using Sektor Resiko data as fallback for {month_name}")
-                final_nib_data = [
-                    NIBData(
-                        kabupaten_kota=item.kabupaten_kota,
-                        total=item.total,
-                        # Unfortunately we lose PMA/PMDN distinction here, set to 0
-                        pma=0, pmdn=0,
-                        usaha_mikro=0, usaha_kecil=0, usaha_menengah=0, usaha_besar=0
-                    )
-                    for item in data['sr']
-                ]
+                logger.info("Using Sektor Resiko data as fallback for %s", month_name)
+                # Unfortunately we lose PMA/PMDN distinction here, other counts stay 0
+                nib_frame = self._nib_frame(
+                    [item.kabupaten_kota for item in data['sr']],
+                    total=[item.total for item in data['sr']],
+                )
             
-            if final_nib_data:
+            if nib_frame is not None:
                 monthly_data[month_name] = {
                     'month': month_name,
                     'year': year,
-                    'nib': final_nib_data
+                    'nib': self.nib_from_frame(nib_frame),
+                    'nib_frame': self._with_month(nib_frame, month_name)
                 }
         
         return monthly_data
     
+    def _parse_quarterly_sheet(self, sheet_upper: str, df: pd.DataFrame) -> Tuple[Optional[str], Any]:
+        """
+        Parse one month sheet of a quarterly file.
+        
+        Returns:
+            ('sr', List[SektorResikoData]) or ('pb', NIB frame) when the sheet
+            holds data, otherwise (None, None)
+        """
+        # Detect content type
+        content_type = self._detect_sheet_content_type(df)
+        
+        # Parse based on content type, regardless of sheet name;
+        # fall back to name-based detection if content is ambiguous
+        if content_type == 'UNKNOWN':
+            if "RESIKO" in sheet_upper or "RISIKO" in sheet_upper or "SEKTOR" in sheet_upper:
+                content_type = 'SEKTOR_RESIKO'
+            elif "PB" in sheet_upper or "PERIZINAN" in sheet_upper or "NIB" in sheet_upper:
+                content_type = 'PB'
+        
+        if content_type == 'SEKTOR_RESIKO':
+            sr_data = self.parse_sektor_resiko_sheet(df)
+            if sr_data:
+                return 'sr', sr_data
+        
+        elif content_type == 'PB':
+            pb_frame = self.parse_perizinan_berusaha_frame(df)
+            if not pb_frame.empty:
+                return 'pb', pb_frame
+        
+        return None, None
+    
     def parse_perizinan_berusaha_sheet(self, df: pd.DataFrame) -> List[NIBData]:
         """
         Parse a PERIZINAN BERUSAHA sheet from quarterly files.
         Structure: Kab/Kota, PMA, PMDN, [other cols], JUMLAH (last col)
         """
-        results = []
-        
+        return self.nib_from_frame(self.parse_perizinan_berusaha_frame(df))
+    
+    def parse_perizinan_berusaha_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse a PERIZINAN BERUSAHA sheet into a NIB frame (NIB_FRAME_COLUMNS).
+        """
         # Find the data start row
         data_start_row, kab_col_idx = self._find_data_start_row(df)
         
         if data_start_row is None:
-            return results
+            return self._nib_frame([])
         
         # Offsets relative to Kab: PMA(+1), PMDN(+2)
-        # Total is ALWAYS in the LAST column (varies by sheet)
-        off_pma = 1
-        off_pmdn = 2
-        
-        for idx in range(data_start_row, len(df)):
-            row = df.iloc[idx]
-            
-            # Access Kab/Kota dynamically
-            raw_kab_kota = row.iloc[kab_col_idx] if len(row) > kab_col_idx and pd.notna(row.iloc[kab_col_idx]) else None
-            kab_kota_str = str(raw_kab_kota).strip() if raw_kab_kota is not None else ""
-            
-            is_valid_row = False
-            
-            # Check if it's a valid location or "Null" category with data
-            # IMPORTANT: "Null" is a valid category label, not missing data!
-            null_indicators = ["null", "none", "nan", "-", ""]
-            is_null_loc = kab_kota_str.lower() in null_indicators
-            
-            # Safe access helper
-            def get_val(offset):
-                return self._safe_int(row.iloc[kab_col_idx + offset]) if len(row) > kab_col_idx + offset else 0
-            
-            # Get Total from LAST column (this is the reliable source)
-            total_from_last_col = self._safe_int(row.iloc[-1]) if len(row) > 0 else 0
-            
-            if is_null_loc:
-                # For "Null" labeled rows, include if they have data
-                pma_check = get_val(off_pma)
-                pmdn_check = get_val(off_pmdn)
-                
-                if pma_check + pmdn_check > 0 or total_from_last_col > 0:
-                    kab_kota_str = "Tanpa Lokasi"  # Relabel for display
-                    is_valid_row = True
-            else:
-                # Skip summary/total rows
-                skip_keywords = ["JUMLAH", "TOTAL", "GRAND", "STATUS PM", "KABUPATEN", "NO", "URAIAN"]
-                if any(x in kab_kota_str.upper() for x in skip_keywords):
-                    is_valid_row = False
-                else:
-                    is_valid_row = True
-            
-            if not is_valid_row:
-                continue
-            
-            # Extract values
-            pma = get_val(off_pma)
-            pmdn = get_val(off_pmdn)
-            
-            # Use last column for Total (most reliable)
-            # Only fallback to PMA+PMDN if last column is empty
-            final_total = total_from_last_col if total_from_last_col > 0 else (pma + pmdn)
-            
-            nib_data = NIBData(
-                kabupaten_kota=kab_kota_str,
-                pma=pma,
-                pmdn=pmdn,
-                usaha_mikro=0,
-                usaha_kecil=0,
-                usaha_menengah=0,
-                usaha_besar=0,
-                total=final_total
-            )
-            
-            results.append(nib_data)
-        
-        return results
+        # Total is ALWAYS in the LAST column (varies by sheet); trailing
+        # columns that are entirely empty (stray formatting) do not count
+        body = df.iloc[data_start_row:]
+        kab_kota = self._location_labels(body, kab_col_idx)
+        pma, pmdn = self._numeric_block(body, kab_col_idx + 1, 2).T
+        filled_cols = np.flatnonzero(df.notna().to_numpy().any(axis=0))
+        last_col_idx = filled_cols[-1] if filled_cols.size else df.shape[1] - 1
+        total_from_last_col = self._numeric_block(body, last_col_idx, 1)[:, 0]
+        
+        # "Null" is a valid category label, not missing data: keep those rows
+        # (relabelled for display) when they have data; skip summary/total rows
+        has_data = (pma + pmdn > 0) | (total_from_last_col > 0)
+        kab_kota, valid = self._classify_rows(
+            kab_kota, has_data, self.PB_SKIP_RE
+        )
+        
+        # Use last column for Total (most reliable)
+        # Only fallback to PMA+PMDN if last column is empty
+        final_total = np.where(total_from_last_col > 0, total_from_last_col, pma + pmdn)
+        
+        return self._nib_frame(
+            kab_kota[valid],
+            pma=pma[valid],
+            pmdn=pmdn[valid],
+            total=final_total[valid],
+        )
     
     def _merge_nib_data(self, existing: List[NIBData], new: List[NIBData]) -> List[NIBData]:
         """Merge two lists of NIBData by Kabupaten/Kota."""
-        merged = {d.kabupaten_kota: d for d in existing}
-        
-        for item in new:
-            if item.kabupaten_kota in merged:
-                # Add values
-                old = merged[item.kabupaten_kota]
-                merged[item.kabupaten_kota] = NIBData(
-                    kabupaten_kota=item.kabupaten_kota,
-                    pma=old.pma + item.pma,
-                    pmdn=old.pmdn + item.pmdn,
-                    usaha_mikro=old.usaha_mikro + item.usaha_mikro,
-                    usaha_kecil=old.usaha_kecil + item.usaha_kecil,
-                    usaha_menengah=old.usaha_menengah + item.usaha_menengah,
-                    usaha_besar=old.usaha_besar + item.usaha_besar,
-                    total=old.total + item.total
-                )
-            else:
-                merged[item.kabupaten_kota] = item
+        if not new:
+            return list(existing)
         
-        return list(merged.values())
+        # One grouped sum over both lists; sort=False keeps first-seen location order
+        frame = self.build_nib_frame([*existing, *new], None).drop(columns='month')
+        merged = frame.groupby('kabupaten_kota', sort=False, as_index=False).sum()
+        return self.nib_from_frame(merged)
     
     def extract_month_from_filename(self, filename: str) -> Optional[str]:
         """
@@ -513,21 +655,14 @@ class DataLoader:
             "OLAH DATA OSS BULAN JULI 2025.xlsx" -> "Juli"
             "OLAH DATA OSS BULAN SEPTEMBER 2025.xlsx" -> "September"
         """
-        months = [
-            "JANUARI", "FEBRUARI", "MARET", "APRIL", "MEI", "JUNI",
-            "JULI", "AGUSTUS", "SEPTEMBER", "OKTOBER", "NOVEMBER", "DESEMBER"
-        ]
-        
-        filename_upper = filename.upper()
-        for month in months:
-            if month in filename_upper:
-                return month.capitalize()
-        
+        match = self.MONTH_NAME_RE.search(filename.upper())
+        if match:
+            return match.group().capitalize()
         return None
     
     def extract_year_from_filename(self, filename: str) -> Optional[int]:
         """Extract year from filename."""
-        match = re.search(r'(\d{4})', filename)
+        match = self.YEAR_RE.search(filename)
         if match:
             return int(match.group(1))
         return None
@@ -536,127 +671,136 @@ class DataLoader:
         """
         Parse the NIB sheet to extract data per Kabupaten/Kota.
         """
-        results = []
-        
+        return self.nib_from_frame(self.parse_nib_frame(df))
+    
+    def parse_nib_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse the NIB sheet into a NIB frame (NIB_FRAME_COLUMNS).
+        """
         # Find the data start row (after headers) and column index for Kab/Kota
         data_start_row, kab_col_idx = self._find_data_start_row(df)
         
         if data_start_row is None:
-            return results
-        
-        # Determine column offsets assuming standard relative structure
-        # Standard: Kab(0), PMA(1), PMDN(2), UB(3), UK(4), UM(5), UMi(6), Total(7)
-        # Offsets relative to Kab: +1, +2, etc.
-        off_pma = 1
-        off_pmdn = 2
-        off_ub = 3
-        off_uk = 4
-        off_um = 5
-        off_umi = 6
-        off_total = 7
-        
-        # Process each data row
-        for idx in range(data_start_row, len(df)):
-            row = df.iloc[idx]
-            
-            # Handle potential None/NaN values safely
-            raw_kab_kota = row.iloc[kab_col_idx] if len(row) > kab_col_idx and pd.notna(row.iloc[kab_col_idx]) else None
-            kab_kota_str = str(raw_kab_kota).strip() if raw_kab_kota is not None else ""
-            
-            is_valid_row = False
-            kab_kota = kab_kota_str
-            
-            # Check if it's a valid location or "Null"/"Empty" with data
-            null_indicators = ["null", "none", "nan", "-", ""]
-            is_null_loc = kab_kota_str.lower() in null_indicators
-            
-            if is_null_loc:
-                # Calculate sum of components to check if row has data
-                comp_sum = 0
-                comp_sum += self._safe_int(row.iloc[kab_col_idx + off_pma]) if len(row) > kab_col_idx + off_pma else 0
-                comp_sum += self._safe_int(row.iloc[kab_col_idx + off_pmdn]) if len(row) > kab_col_idx + off_pmdn else 0
-                comp_sum += self._safe_int(row.iloc[kab_col_idx + off_ub]) if len(row) > kab_col_idx + off_ub else 0
-                comp_sum += self._safe_int(row.iloc[kab_col_idx + off_uk]) if len(row) > kab_col_idx + off_uk else 0
-                comp_sum += self._safe_int(row.iloc[kab_col_idx + off_um]) if len(row) > kab_col_idx + off_um else 0
-                comp_sum += self._safe_int(row.iloc[kab_col_idx + off_umi]) if len(row) > kab_col_idx + off_umi else 0
-                
-                # Also check explicit total column
-                explicit_total = self._safe_int(row.iloc[kab_col_idx + off_total]) if len(row) > kab_col_idx + off_total else 0
-                
-                if comp_sum > 0 or explicit_total > 0:
-                    kab_kota = "Tanpa Lokasi"
-                    is_valid_row = True
-            else:
-                # Normal location
-                skip_keywords = ["JUMLAH", "TOTAL", "GRAND", "STATUS PM", "SKALA USAHA", "KABUPATEN", "NO"]
-                if any(x in kab_kota_str.upper() for x in skip_keywords):
-                    is_valid_row = False
-                else:
-                    is_valid_row = True
-            
-            if not is_valid_row:
-                continue
-            
-            # Extract values with safe conversion
-            pma = self._safe_int(row.iloc[kab_col_idx + off_pma]) if len(row) > kab_col_idx + off_pma else 0
-            pmdn = self._safe_int(row.iloc[kab_col_idx + off_pmdn]) if len(row) > kab_col_idx + off_pmdn else 0
-            u_besar = self._safe_int(row.iloc[kab_col_idx + off_ub]) if len(row) > kab_col_idx + off_ub else 0
-            u_kecil = self._safe_int(row.iloc[kab_col_idx + off_uk]) if len(row) > kab_col_idx + off_uk else 0
-            u_menengah = self._safe_int(row.iloc[kab_col_idx + off_um]) if len(row) > kab_col_idx + off_um else 0
-            u_mikro = self._safe_int(row.iloc[kab_col_idx + off_umi]) if len(row) > kab_col_idx + off_umi else 0
-            explicit_total = self._safe_int(row.iloc[kab_col_idx + off_total]) if len(row) > kab_col_idx + off_total else 0
-            
-            final_total = explicit_total if explicit_total > 0 else (pma + pmdn)
-            
-            nib_data = NIBData(
-                kabupaten_kota=kab_kota,
-                pma=pma,
-                pmdn=pmdn,
-                usaha_besar=u_besar,
-                usaha_kecil=u_kecil,
-                usaha_menengah=u_menengah,
-                usaha_mikro=u_mikro,
-                total=final_total
-            )
-            
-            results.append(nib_data)
-        
-        return results
+            return self._nib_frame([])
+        
+        # Standard column structure relative to Kab/Kota:
+        # Kab(0), PMA(1), PMDN(2), UB(3), UK(4), UM(5), UMi(6), Total(7)
+        body = df.iloc[data_start_row:]
+        kab_kota = self._location_labels(body, kab_col_idx)
+        values = self._numeric_block(body, kab_col_idx + 1, 7)
+        pma, pmdn = values[:, 0], values[:, 1]
+        explicit_total = values[:, 6]
+        
+        # "Null"/empty locations count only when they carry data;
+        # named rows are skipped when they are headers or summaries
+        has_data = (values[:, :6].sum(axis=1) > 0) | (explicit_total > 0)
+        kab_kota, valid = self._classify_rows(
+            kab_kota, has_data, self.NIB_SKIP_RE
+        )
+        
+        final_total = np.where(explicit_total > 0, explicit_total, pma + pmdn)
+        
+        values = values[valid]
+        return self._nib_frame(
+            kab_kota[valid],
+            pma=values[:, 0],
+            pmdn=values[:, 1],
+            usaha_besar=values[:, 2],
+            usaha_kecil=values[:, 3],
+            usaha_menengah=values[:, 4],
+            usaha_mikro=values[:, 5],
+            total=final_total[valid],
+        )
     
     def _find_data_start_row(self, df: pd.DataFrame) -> Tuple[Optional[int], int]:
         """
         Find the row where actual data starts and the column index of Kabupaten/Kota.
         Returns (row_idx, col_idx). Returns (None, -1) if not found.
         """
+        # Only columns 0 and 1 can hold Kab/Kota; convert them to text once
+        # (row-major order, so the first hit matches the old row-by-row scan)
+        cells = np.char.strip(df.iloc[:, :2].to_numpy(dtype=str))
+        if cells.size == 0:
+            return None, -1
+        
         # Strategy 1: Header search (dynamic column)
-        for idx in range(min(50, len(df))):
-            row = df.iloc[idx]
-            # Check col 0 and 1
-            for col_idx in [0, 1]:
-                if col_idx < len(row):
-                    cell = str(row.iloc[col_idx]).upper().strip()
-                    if "KABUPATEN" in cell or "KAB/KOTA" in cell or "KAB. / KOTA" in cell:
-                        return idx + 1, col_idx
+        header = np.char.upper(cells[:50])
+        is_header = (
+            (np.char.find(header, "KABUPATEN") >= 0)
+            | (np.char.find(header, "KAB/KOTA") >= 0)
+            | (np.char.find(header, "KAB. / KOTA") >= 0)
+        )
+        if is_header.any():
+            idx, col_idx = np.unravel_index(np.argmax(is_header), is_header.shape)
+            return int(idx) + 1, int(col_idx)
         
         # Strategy 2: Fallback - First data row
-        for idx in range(len(df)):
-            row = df.iloc[idx]
-            for col_idx in [0, 1]:
-                if col_idx < len(row) and pd.notna(row.iloc[col_idx]):
-                    cell = str(row.iloc[col_idx]).strip()
-                    if (cell.startswith("Kab.") or cell.startswith("Kota") or 
-                        cell.startswith("KAB.") or cell.startswith("KOTA")):
-                        return idx, col_idx
+        is_location = np.zeros(cells.shape, dtype=bool)
+        for prefix in ("Kab.", "Kota", "KAB.", "KOTA"):
+            is_location |= np.char.startswith(cells, prefix)
+        is_location &= df.iloc[:, :2].notna().to_numpy()
+        if is_location.any():
+            idx, col_idx = np.unravel_index(np.argmax(is_location), is_location.shape)
+            return int(idx), int(col_idx)
         return None, -1
     
-    def _safe_int(self, value) -> int:
-        """Safely convert a value to integer."""
-        if pd.isna(value):
-            return 0
-        try:
-            return int(float(value))
-        except (ValueError, TypeError):
-            return 0
+    def _float_block(self, body: pd.DataFrame, start_col: int, width: int) -> np.ndarray:
+        """
+        Convert ``width`` columns starting at ``start_col`` to a float64 matrix.
+        
+        Missing or non-numeric cells become 0. Columns beyond the sheet's
+        width are filled with 0. Conversion is per column, so columns pandas
+        already read as numbers pass through without being boxed into
+        Python objects.
+        """
+        values = np.zeros((len(body), width), dtype=np.float64)
+        block = body.iloc[:, start_col:start_col + width]
+        if block.size:
+            numbers = block.apply(pd.to_numeric, errors='coerce').fillna(0)
+            values[:, :block.shape[1]] = numbers.to_numpy(dtype=np.float64)
+        return values
+    
+    def _numeric_block(self, body: pd.DataFrame, start_col: int, width: int) -> np.ndarray:
+        """
+        Convert ``width`` columns starting at ``start_col`` to an int64 matrix.
+        
+        Same rules as _float_block, with floats truncated toward zero.
+        """
+        return np.trunc(self._float_block(body, start_col, width)).astype(np.int64)
+    
+    def _location_labels(self, body: pd.DataFrame, kab_col_idx: int) -> pd.Series:
+        """
+        Return the stripped Kab/Kota label of each row.
+        """
+        if kab_col_idx >= body.shape[1]:
+            labels = pd.Series("", index=body.index)
+        else:
+            raw = body.iloc[:, kab_col_idx]
+            labels = raw.where(raw.notna(), "").astype(str).str.strip()
+        return labels
+    
+    def _classify_rows(
+        self,
+        labels: pd.Series,
+        has_data: np.ndarray,
+        skip_pattern: re.Pattern,
+    ) -> Tuple[pd.Series, np.ndarray]:
+        """
+        Decide which parsed rows are data rows, for all rows at once.
+        
+        "Null" locations (null, none, nan, -, or blank) are kept (relabelled
+        "Tanpa Lokasi") only when they carry data; named rows are kept unless
+        they match the skip pattern (headers, JUMLAH/TOTAL summary rows, ...).
+        Both checks share one upper-cased copy of the labels.
+        
+        Returns:
+            Tuple of (display labels, boolean mask of rows to keep)
+        """
+        upper = labels.str.upper()
+        is_null_loc = upper.isin(self.NULL_LOCATION_LABELS).to_numpy()
+        is_summary = upper.str.contains(skip_pattern).to_numpy()
+        valid = np.where(is_null_loc, has_data, ~is_summary)
+        return labels.mask(is_null_loc, "Tanpa Lokasi"), valid
     
     def load_monthly_data(self, file_path: Path) -> Dict[str, List[NIBData]]:
         """
@@ -671,28 +815,15 @@ class DataLoader:
         sheets = self.load_file(file_path)
         result = {}
         
-        # Possible NIB sheet names (case-insensitive search)
-        nib_sheet_names = ["NIB", "SKALA NIB", "SKALA", "DATA NIB"]
-        
-        # Find and parse NIB sheet
-        for sheet_name, df in sheets.items():
-            sheet_upper = sheet_name.upper().strip()
-            if any(nib_name in sheet_upper for nib_name in nib_sheet_names):
-                result['nib'] = self.parse_nib_sheet(df)
-                break
-        
-        # If no NIB sheet found, try first sheet that has appropriate structure
-        if 'nib' not in result:
-            for sheet_name, df in sheets.items():
-                nib_data = self.parse_nib_sheet(df)
-                if nib_data:  # If we got valid data
-                    result['nib'] = nib_data
-                    break
+        nib_frame = self._parse_monthly_nib_frame(sheets)
+        if nib_frame is not None:
+            result['nib'] = self.nib_from_frame(nib_frame)
         
         # Extract metadata
         filename = Path(file_path).name
         result['month'] = self.extract_month_from_filename(filename)
         result['year'] = self.extract_year_from_filename(filename)
+        result['nib_frame'] = self._with_month(nib_frame, result['month'])
         
         return result
     
@@ -717,11 +848,9 @@ class DataLoader:
         # Group sheets by month
         months_found = set()
         for sheet_name in sheets.keys():
-            for pattern in self.MONTHLY_SHEET_PATTERNS:
-                match = re.search(pattern, sheet_name, re.IGNORECASE)
-                if match:
-                    month = match.group(1).capitalize()
-                    months_found.add(month)
+            for match in self.MONTHLY_SHEET_RE.finditer(sheet_name):
+                month = match.group(match.lastindex).capitalize()
+                months_found.add(month)
         
         # For each month found, try to find and parse the NIB data
         # Note: Quarterly files might have different structure
@@ -733,6 +862,63 @@ class DataLoader:
         
         return result
     
+    def build_nib_frame(self, nib_data_list: List[NIBData], month: Optional[str]) -> pd.DataFrame:
+        """
+        Convert a month's NIBData rows to the columnar frame used for aggregation.
+        
+        Args:
+            nib_data_list: List of NIBData objects for one month
+            month: Month name stored in the 'month' column
+            
+        Returns:
+            DataFrame with NIB_FRAME_COLUMNS plus 'month'
+        """
+        frame = pd.DataFrame(
+            list(map(_NIB_GETTER, nib_data_list)),
+            columns=self.NIB_FRAME_COLUMNS,
+        )
+        # Per-month counts are far below 2**31; int32 halves the bytes the groupby moves
+        frame = frame.astype({col: 'int32' for col in self.NIB_FRAME_COLUMNS[1:]})
+        frame['month'] = month
+        return frame
+    
+    def _nib_frame(self, locations, **counts) -> pd.DataFrame:
+        """
+        Build a NIB frame (NIB_FRAME_COLUMNS) from column arrays.
+        
+        Args:
+            locations: Kab/Kota label per row
+            **counts: Count arrays keyed by NIB_FRAME_COLUMNS name; omitted columns are 0
+            
+        Returns:
+            DataFrame with interned location labels and int32 counts
+        """
+        labels = [sys.intern(str(label)) for label in locations]
+        frame = {'kabupaten_kota': labels}
+        for col in self.NIB_FRAME_COLUMNS[1:]:
+            values = counts.get(col)
+            frame[col] = np.zeros(len(labels), dtype=np.int32) if values is None else np.asarray(values, dtype=np.int32)
+        return pd.DataFrame(frame, columns=self.NIB_FRAME_COLUMNS)
+    
+    def _with_month(self, nib_frame: Optional[pd.DataFrame], month: Optional[str]) -> pd.DataFrame:
+        """Return the NIB frame tagged with its month, as used for aggregation."""
+        if nib_frame is None:
+            nib_frame = self._nib_frame([])
+        return nib_frame.assign(month=month)
+    
+    def nib_from_frame(self, nib_frame: pd.DataFrame) -> List[NIBData]:
+        """
+        Convert a NIB frame back to NIBData rows for legacy callers.
+        
+        Args:
+            nib_frame: DataFrame with NIB_FRAME_COLUMNS
+            
+        Returns:
+            List of NIBData, one per frame row
+        """
+        columns = [nib_frame[col].tolist() for col in self.NIB_FRAME_COLUMNS]
+        return [NIBData(*row) for row in zip(*columns)]
+    
     def get_nib_dataframe(self, nib_data_list: List[NIBData]) -> pd.DataFrame:
         """
         Convert list of NIBData to a pandas DataFrame.
@@ -746,22 +932,19 @@ class DataLoader:
         if not nib_data_list:
             return pd.DataFrame()
         
-        data = []
-        for nib in nib_data_list:
-            data.append({
-                'Kabupaten/Kota': nib.kabupaten_kota,
-                'PMA': nib.pma,
-                'PMDN': nib.pmdn,
-                'Usaha Mikro': nib.usaha_mikro,
-                'Usaha Kecil': nib.usaha_kecil,
-                'Usaha Menengah': nib.usaha_menengah,
-                'Usaha Besar': nib.usaha_besar,
-                'UMK': nib.umk,
-                'NON-UMK': nib.non_umk,
-                'Total': nib.total,
-            })
-        
-        return pd.DataFrame(data)
+        frame = self.build_nib_frame(nib_data_list, None)
+        return pd.DataFrame({
+            'Kabupaten/Kota': frame['kabupaten_kota'],
+            'PMA': frame['pma'],
+            'PMDN': frame['pmdn'],
+            'Usaha Mikro': frame['usaha_mikro'],
+            'Usaha Kecil': frame['usaha_kecil'],
+            'Usaha Menengah': frame['usaha_menengah'],
+            'Usaha Besar': frame['usaha_besar'],
+            'UMK': frame['usaha_mikro'] + frame['usaha_kecil'],
+            'NON-UMK': frame['usaha_menengah'] + frame['usaha_besar'],
+            'Total': frame['total'],
+        })
     
     def parse_sektor_resiko_sheet(self, df: pd.DataFrame) -> List[SektorResikoData]:
         """
@@ -775,62 +958,33 @@ class DataLoader:
         
         # Standard Sektor Resiko Offsets relative to Kab column
         # Based on: Kab(0), MR(1), MT(2), R(3), T(4), Eng(5)... Total(13)
-        # So offsets: +1, +2, ... +13
-        
-        for idx in range(data_start_row, len(df)):
-            row = df.iloc[idx]
-            
-            raw_kab_kota = row.iloc[kab_col_idx] if len(row) > kab_col_idx and pd.notna(row.iloc[kab_col_idx]) else None
-            kab_kota_str = str(raw_kab_kota).strip() if raw_kab_kota is not None else ""
-            
-            is_valid_row = False
-            kab_kota = kab_kota_str
-            
-            null_indicators = ["null", "none", "nan", "-", ""]
-            is_null_loc = kab_kota_str.lower() in null_indicators
-            
-            # Safe row access Helper
-            def get_val(offset):
-                return self._safe_int(row.iloc[kab_col_idx + offset]) if len(row) > kab_col_idx + offset else 0
-            
-            if is_null_loc:
-                # Check for total data (last column ~offset 13) or components
-                # Check first few risk columns (offsets 1-4)
-                risk_sum = get_val(1) + get_val(2) + get_val(3) + get_val(4)
-                total_val = get_val(13)
-                
-                if total_val > 0 or risk_sum > 0:
-                    kab_kota = "Tanpa Lokasi"
-                    is_valid_row = True
-            else:
-                skip_keywords = ["JUMLAH", "TOTAL", "GRAND", "RISIKO", "SEKTOR", "NO"]
-                if any(x in kab_kota_str.upper() for x in skip_keywords):
-                    is_valid_row = False
-                else:
-                    is_valid_row = True
-            
-            if not is_valid_row:
-                continue
-            
-            # Using offsets
-            sektor_data = SektorResikoData(
-                kabupaten_kota=str(kab_kota).strip(),
-                risiko_menengah_rendah=get_val(1),
-                risiko_menengah_tinggi=get_val(2),
-                risiko_rendah=get_val(3),
-                risiko_tinggi=get_val(4),
-                sektor_energi=get_val(5),
-                sektor_kelautan=get_val(6),
-                sektor_kesehatan=get_val(7),
-                sektor_komunikasi=get_val(8),
-                sektor_pariwisata=get_val(9),
-                sektor_perhubungan=get_val(10),
-                sektor_perindustrian=get_val(11),
-                sektor_pertanian=get_val(12),
-                total=get_val(13),
-            )
-            
-            results.append(sektor_data)
+        body = df.iloc[data_start_row:]
+        kab_kota = self._location_labels(body, kab_col_idx)
+        values = self._numeric_block(body, kab_col_idx + 1, 13)
+        
+        # "Null" rows count when the total (offset 13) or a risk column (offsets 1-4) has data
+        has_data = (values[:, 12] > 0) | (values[:, :4].sum(axis=1) > 0)
+        kab_kota, valid = self._classify_rows(
+            kab_kota, has_data, self.SEKTOR_RESIKO_SKIP_RE
+        )
+        
+        for kab, row in zip(kab_kota[valid].tolist(), values[valid].tolist()):
+            results.append(SektorResikoData(
+                kabupaten_kota=sys.intern(kab),
+                risiko_menengah_rendah=row[0],
+                risiko_menengah_tinggi=row[1],
+                risiko_rendah=row[2],
+                risiko_tinggi=row[3],
+                sektor_energi=row[4],
+                sektor_kelautan=row[5],
+                sektor_kesehatan=row[6],
+                sektor_komunikasi=row[7],
+                sektor_pariwisata=row[8],
+                sektor_perhubungan=row[9],
+                sektor_perindustrian=row[10],
+                sektor_pertanian=row[11],
+                total=row[12],
+            ))
         
         return results
     
@@ -847,26 +1001,8 @@ class DataLoader:
         if not sektor_data_list:
             return pd.DataFrame()
         
-        data = []
-        for item in sektor_data_list:
-            data.append({
-                'Kabupaten/Kota': item.kabupaten_kota,
-                'Risiko Rendah': item.risiko_rendah,
-                'Risiko Menengah Rendah': item.risiko_menengah_rendah,
-                'Risiko Menengah Tinggi': item.risiko_menengah_tinggi,
-                'Risiko Tinggi': item.risiko_tinggi,
-                'Energi': item.sektor_energi,
-                'Kelautan': item.sektor_kelautan,
-                'Kesehatan': item.sektor_kesehatan,
-                'Komunikasi': item.sektor_komunikasi,
-                'Pariwisata': item.sektor_pariwisata,
-                'Perhubungan': item.sektor_perhubungan,
-                'Perindustrian': item.sektor_perindustrian,
-                'Pertanian': item.sektor_pertanian,
-                'Total': item.total,
-            })
-        
-        return pd.DataFrame(data)
+        rows = list(map(_SEKTOR_RESIKO_GETTER, sektor_data_list))
+        return pd.DataFrame(rows, columns=list(_SEKTOR_RESIKO_COLUMNS))
     
     def load_realisasi_investasi(self, file_bytes, filename: str = "") -> Dict[str, InvestmentReport]:
         """
@@ -882,8 +1018,26 @@ class DataLoader:
         Returns:
             Dictionary mapping Triwulan name to InvestmentReport
         """
-        sheets = self.load_file_from_bytes(file_bytes, filename)
-        year = self.extract_year_from_filename(filename) or 2025
+        # Parsed reports are cached by content hash, so warm calls on the
+        # same workbook skip both the Excel read and the sheet parsing
+        content = file_bytes.getvalue() if hasattr(file_bytes, 'getvalue') else file_bytes.read()
+        result = load_or_build(
+            f"loader-realisasi-investasi-{EXCEL_ENGINE or 'openpyxl'}",
+            content,
+            filename,
+            self.extract_year_from_filename(filename) or 2025,
+            self._build_realisasi_investasi,
+            version=self.INVESTMENT_CACHE_VERSION,
+        )
+        return result.data
+    
+    def _build_realisasi_investasi(self, content: bytes, filename: str, year: int) -> Dict[str, InvestmentReport]:
+        """
+        Parse the Triwulan sheets of a REALISASI INVESTASI workbook.
+        """
+        # Only Triwulan sheets are parsed; the summary and other tabs are skipped.
+        # Read directly: the parsed reports are what load_realisasi_investasi caches.
+        sheets = self._read_sheets(io.BytesIO(content), self._sheet_triwulan)
         
         # Initialize reports for each Triwulan
         reports = {}
@@ -892,77 +1046,69 @@ class DataLoader:
         for tw in triwulan_list:
             reports[tw] = InvestmentReport(triwulan=tw, year=year)
         
-        # Parse each sheet
+        # Determine which Triwulan and sheet type each sheet belongs to
+        investment_sheets = []
         for sheet_name, df in sheets.items():
             sheet_upper = sheet_name.upper()
             
-            # Determine which Triwulan this sheet belongs to
-            # Use regex to match exact triwulan (avoid TW I matching TW II, TW III, TW IV)
-            tw = None
-            # Check TW IV first (most specific), then TW III, TW II, TW I
-            for t in ["TW IV", "TW III", "TW II", "TW I"]:
-                # Pattern variations: "TW I", "TWI", "TW1"
-                tw_clean = t.replace(" ", "")  # TWI, TWII, TWIII, TWIV
-                tw_roman = t  # TW I, TW II, TW III, TW IV
-                
-                if tw_clean in sheet_upper.replace(" ", ""):
-                    tw = t
-                    break
-                if tw_roman in sheet_upper:
-                    tw = t
-                    break
-            
+            tw = self._sheet_triwulan(sheet_name)
             if tw is None:
                 continue
             
-            # Determine sheet type and parse
-            if "PMA" in sheet_upper and "SEKTOR" in sheet_upper:
-                reports[tw].pma_by_sektor = self._parse_investment_sheet(df)
-                reports[tw].pma_total = sum(d.jumlah_rp for d in reports[tw].pma_by_sektor)
-                reports[tw].pma_proyek = sum(d.proyek for d in reports[tw].pma_by_sektor)
-                reports[tw].pma_tki = sum(d.tki for d in reports[tw].pma_by_sektor)
-                reports[tw].pma_tka = sum(d.tka for d in reports[tw].pma_by_sektor)
-                
-            elif "PMA" in sheet_upper and "WILAYAH" in sheet_upper:
-                reports[tw].pma_by_wilayah = self._parse_investment_sheet(df)
-                # If totals not set from sektor sheet, use wilayah data
-                if reports[tw].pma_total == 0:
-                    reports[tw].pma_total = sum(d.jumlah_rp for d in reports[tw].pma_by_wilayah)
-                    reports[tw].pma_proyek = sum(d.proyek for d in reports[tw].pma_by_wilayah)
-                    reports[tw].pma_tki = sum(d.tki for d in reports[tw].pma_by_wilayah)
-                    reports[tw].pma_tka = sum(d.tka for d in reports[tw].pma_by_wilayah)
-                    
-            elif "PMDN" in sheet_upper and "SEKTOR" in sheet_upper:
-                reports[tw].pmdn_by_sektor = self._parse_investment_sheet(df)
-                reports[tw].pmdn_total = sum(d.jumlah_rp for d in reports[tw].pmdn_by_sektor)
-                reports[tw].pmdn_proyek = sum(d.proyek for d in reports[tw].pmdn_by_sektor)
-                reports[tw].pmdn_tki = sum(d.tki for d in reports[tw].pmdn_by_sektor)
-                reports[tw].pmdn_tka = sum(d.tka for d in reports[tw].pmdn_by_sektor)
-                
-            elif "PMDN" in sheet_upper and "WILAYAH" in sheet_upper:
-                reports[tw].pmdn_by_wilayah = self._parse_investment_sheet(df)
-                if reports[tw].pmdn_total == 0:
-                    reports[tw].pmdn_total = sum(d.jumlah_rp for d in reports[tw].pmdn_by_wilayah)
-                    reports[tw].pmdn_proyek = sum(d.proyek for d in reports[tw].pmdn_by_wilayah)
-                    reports[tw].pmdn_tki = sum(d.tki for d in reports[tw].pmdn_by_wilayah)
-                    reports[tw].pmdn_tka = sum(d.tka for d in reports[tw].pmdn_by_wilayah)
-                    
-            elif "NEGARA" in sheet_upper:
-                reports[tw].by_country = self._parse_investment_sheet(df)
-        
-        # Filter out empty reports
-        reports = {tw: r for tw, r in reports.items() 
-                   if r.pma_total > 0 or r.pmdn_total > 0 or r.pma_by_wilayah or r.pmdn_by_wilayah}
+            investor = "PMA" if "PMA" in sheet_upper else "PMDN" if "PMDN" in sheet_upper else None
+            breakdown = "SEKTOR" if "SEKTOR" in sheet_upper else "WILAYAH" if "WILAYAH" in sheet_upper else None
+            kind = self.INVESTMENT_SHEET_KINDS.get((investor, breakdown))
+            if kind is None:
+                if "NEGARA" not in sheet_upper:
+                    continue
+                kind = ("by_country", None, False)
+            investment_sheets.append((tw, kind, df))
+        
+        # Sheets are parsed independently, so parse them concurrently;
+        # map() keeps the sheet order the totals below depend on
+        parsed = []
+        if investment_sheets:
+            max_workers = min(os.cpu_count() or 1, len(investment_sheets))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(executor.map(lambda item: self._parse_investment_rows(item[2]), investment_sheets))
+        
+        for (tw, kind, _), (rows, (jumlah_rp, proyek, tki, tka)) in zip(investment_sheets, parsed):
+            list_attr, prefix, sets_totals = kind
+            setattr(reports[tw], list_attr, rows)
+            if prefix is None:
+                continue
+            # Sektor sheets set the totals; wilayah sheets only when not set yet
+            if sets_totals or getattr(reports[tw], f"{prefix}_total") == 0:
+                setattr(reports[tw], f"{prefix}_total", jumlah_rp)
+                setattr(reports[tw], f"{prefix}_proyek", proyek)
+                setattr(reports[tw], f"{prefix}_tki", tki)
+                setattr(reports[tw], f"{prefix}_tka", tka)
+        
+        # Filter out empty reports, in place
+        for tw in list(reports):
+            r = reports[tw]
+            if not (r.pma_total > 0 or r.pmdn_total > 0 or r.pma_by_wilayah or r.pmdn_by_wilayah):
+                del reports[tw]
         
         return reports
     
     def _parse_investment_sheet(self, df: pd.DataFrame) -> List[InvestmentData]:
         """
         Parse an investment sheet (PMA/PMDN by wilayah or sektor).
+        """
+        return self._parse_investment_rows(df)[0]
+    
+    def _parse_investment_rows(self, df: pd.DataFrame) -> Tuple[List[InvestmentData], Tuple[float, int, int, int]]:
+        """
+        Parse an investment sheet (PMA/PMDN by wilayah or sektor) together
+        with the column totals of the parsed rows.
         
         Standard structure:
         NO | WILAYAH/SEKTOR | JUMLAH | PROYEK | TKI | TKA
                             (Rp.)
+        
+        Returns:
+            Tuple of (rows, (jumlah_rp, proyek, tki, tka) totals)
         """
         results = []
         
@@ -971,85 +1117,49 @@ class DataLoader:
         header_row = None
         name_col = None
         
-        for idx in range(min(20, len(df))):
-            row = df.iloc[idx]
-            row_str = ' '.join(str(v).upper() for v in row)
-            
-            # Look for row that has both "NO" and "WILAYAH" or "SEKTOR" - this is the true header
-            has_no = any(str(v).upper().strip() == "NO" for v in row)
-            has_wilayah_or_sektor = any("WILAYAH" in str(v).upper() or "SEKTOR" in str(v).upper() for v in row)
-            
-            if has_no and has_wilayah_or_sektor:
-                header_row = idx
-                # Find the column with WILAYAH or SEKTOR
-                for col_idx, val in enumerate(row):
-                    val_str = str(val).upper().strip()
-                    if "WILAYAH" in val_str or "SEKTOR" in val_str:
-                        name_col = col_idx
-                        break
-                break
+        # Upper-cased header region, stringified in one bulk pass
+        header = np.char.upper(df.iloc[:20].to_numpy(dtype=str))
+        is_name_cell = (np.char.find(header, "WILAYAH") >= 0) | (np.char.find(header, "SEKTOR") >= 0)
+        
+        # Look for row that has both "NO" and "WILAYAH" or "SEKTOR" - this is the true header
+        is_header = (np.char.strip(header) == "NO").any(axis=1) & is_name_cell.any(axis=1)
+        if is_header.any():
+            header_row = int(np.argmax(is_header))
+            # Find the column with WILAYAH or SEKTOR
+            name_col = int(np.argmax(is_name_cell[header_row]))
         
         if header_row is None or name_col is None:
-            return results
+            return results, (0, 0, 0, 0)
         
         # Determine column positions based on the same row as header
         # Structure: NO(0), WILAYAH(1), JUMLAH(2), PROYEK(3), TKI(4), TKA(5)
         # name_col is WILAYAH position, so:
         jumlah_col = name_col + 1  # JUMLAH is right after WILAYAH
-        proyek_col = name_col + 2  # PROYEK is next
-        tki_col = name_col + 3     # TKI
-        tka_col = name_col + 4     # TKA
+        proyek_col = name_col + 2  # PROYEK, TKI, TKA follow
         
         # Skip to data rows (header row + 2 to skip the subheader with "(Rp.)")
         data_start = header_row + 2
         
-        # Parse data rows
-        for idx in range(data_start, len(df)):
-            row = df.iloc[idx]
-            
-            # Get name
-            raw_name = row.iloc[name_col] if name_col is not None and len(row) > name_col else None
-            if pd.isna(raw_name):
-                continue
-            name = str(raw_name).strip()
-            
-            # Skip summary rows
-            skip_keywords = ["JUMLAH", "TOTAL", "GRAND", "NO"]
-            if any(x in name.upper() for x in skip_keywords) or not name:
-                continue
-            
-            # Get values
-            def safe_float(val):
-                if pd.isna(val):
-                    return 0.0
-                try:
-                    return float(val)
-                except (ValueError, TypeError):
-                    return 0.0
-            
-            def safe_int(val):
-                if pd.isna(val):
-                    return 0
-                try:
-                    return int(float(val))
-                except (ValueError, TypeError):
-                    return 0
-            
-            jumlah = safe_float(row.iloc[jumlah_col]) if jumlah_col is not None and len(row) > jumlah_col else 0.0
-            proyek = safe_int(row.iloc[proyek_col]) if proyek_col is not None and len(row) > proyek_col else 0
-            tki = safe_int(row.iloc[tki_col]) if tki_col is not None and len(row) > tki_col else 0
-            tka = safe_int(row.iloc[tka_col]) if tka_col is not None and len(row) > tka_col else 0
-            
-            if jumlah > 0 or proyek > 0:
-                results.append(InvestmentData(
-                    name=name,
-                    jumlah_rp=jumlah,
-                    proyek=proyek,
-                    tki=tki,
-                    tka=tka
-                ))
+        # Parse all data rows at once
+        body = df.iloc[data_start:]
+        names = self._location_labels(body, name_col)
+        jumlah = self._float_block(body, jumlah_col, 1)[:, 0]
+        proyek, tki, tka = self._numeric_block(body, proyek_col, 3).T
         
-        return results
+        # Skip empty names and summary rows; keep rows with value or projects
+        is_summary = names.str.upper().str.contains(self.INVESTMENT_SKIP_RE).to_numpy()
+        valid = (names.to_numpy() != "") & ~is_summary & ((jumlah > 0) | (proyek > 0))
+        
+        columns = [
+            column.tolist()
+            for column in (names[valid], jumlah[valid], proyek[valid], tki[valid], tka[valid])
+        ]
+        for row in zip(*columns):
+            results.append(InvestmentData(*row))
+        
+        # Totals of the kept rows, from the column lists already built
+        totals = (sum(columns[1]), sum(columns[2]), sum(columns[3]), sum(columns[4]))
+        return results, totals
     
     def parse_investment_summary(self, file_bytes: io.BytesIO, filename: str = "") -> Dict[str, TWSummary]:
         """
@@ -1066,122 +1176,76 @@ class DataLoader:
         results = {}
         
         # Detect year from filename
-        year = 2025
-        import re
-        year_match = re.search(r'(\d{4})', filename)
-        if year_match:
-            year = int(year_match.group(1))
+        year = self.extract_year_from_filename(filename) or 2025
         
+        # Read only summary sheets (pattern: REALISASI INVESTASI YYYY or similar); the first is used
         try:
-            xl = pd.ExcelFile(file_bytes)
+            sheets = self._load_cached_sheets(
+                file_bytes, filename, "investment-summary", self._is_investment_summary_sheet
+            )
         except Exception as e:
-            print(f"Error reading Excel file: {e}")
+            logger.error("Error reading Excel file: %s", e)
             return results
         
-        # Find summary sheet (pattern: REALISASI INVESTASI YYYY or similar)
-        summary_sheet = None
-        for sheet in xl.sheet_names:
-            if 'REALISASI INVESTASI' in sheet.upper() and any(c.isdigit() for c in sheet):
-                summary_sheet = sheet
-                break
-            elif sheet.upper().startswith('REALISASI INVESTASI'):
-                summary_sheet = sheet
-                break
-        
-        if not summary_sheet:
-            return results
-        
-        try:
-            df = pd.read_excel(xl, sheet_name=summary_sheet, header=None)
-        except Exception as e:
-            print(f"Error reading summary sheet: {e}")
+        if not sheets:
             return results
+        df = next(iter(sheets.values()))
         
         # Find target value (usually in row with TARGET)
         target_rp = 0
-        for idx in range(min(10, len(df))):
-            row = df.iloc[idx]
-            for col_idx, val in enumerate(row):
-                if pd.notna(val) and 'TARGET' in str(val).upper():
-                    # Target value is usually in column 1
-                    try:
-                        target_rp = float(df.iloc[idx, 1]) if pd.notna(df.iloc[idx, 1]) else 0
-                    except (ValueError, TypeError):
-                        pass
-                    break
+        head = df.iloc[:10]
+        has_target = (np.char.find(np.char.upper(head.to_numpy(dtype=str)), 'TARGET') >= 0).any(axis=1)
+        for row in head.to_numpy(dtype=object)[has_target]:
+            # Target value is usually in column 1
+            try:
+                target_rp = float(row[1]) if not _isna(row[1]) else 0
+            except (ValueError, TypeError):
+                pass
         
         # Parse TW rows
         # Structure: PERIODE column has TW I, TW II, etc.
         # Columns: NO, TARGET, PERIODE, PMA(Rp.), PMDN(Rp.), JUMLAH(Rp.), %, PROYEK, TKI, TKA
         tw_patterns = ["TW I", "TW II", "TW III", "TW IV"]
         
-        for idx in range(len(df)):
-            row = df.iloc[idx]
-            row_str = ' '.join(str(v).upper().strip() for v in row if pd.notna(v))
+        # Every cell coerced to a number once (non-numeric -> 0), padded with
+        # zero columns so the value offsets after PERIODE stay in bounds
+        numbers = self._float_block(df, 0, df.shape[1] + 7)
+        
+        # Plain tuples per row: no Series is built for each summary row
+        for row_idx, row in enumerate(df.itertuples(index=False, name=None)):
+            # First column of each cell label, in one pass over the row
+            # (no joined row string); the earliest TW label present wins
+            first_col = {}
+            for col_idx, val in enumerate(row):
+                if not _isna(val):
+                    first_col.setdefault(str(val).upper().strip(), col_idx)
             
-            for tw in tw_patterns:
-                # Check if this row contains exactly this TW (not as part of another)
-                if tw.upper() in row_str:
-                    # Find which cell has the TW value
-                    periode_col = None
-                    for col_idx, val in enumerate(row):
-                        if pd.notna(val) and tw.upper() == str(val).upper().strip():
-                            periode_col = col_idx
-                            break
-                    
-                    if periode_col is None:
-                        continue
-                    
-                    # Extract values based on column positions relative to PERIODE
-                    # Usually: PERIODE(2), PMA(3), PMDN(4), JUMLAH(5), %(6), PROYEK(7), TKI(8), TKA(9)
-                    def safe_float(val):
-                        if pd.isna(val):
-                            return 0.0
-                        try:
-                            return float(val)
-                        except (ValueError, TypeError):
-                            return 0.0
-                    
-                    def safe_int(val):
-                        if pd.isna(val):
-                            return 0
-                        try:
-                            return int(float(val))
-                        except (ValueError, TypeError):
-                            return 0
-                    
-                    # Get values - adjust indices based on actual structure
-                    pma_col = periode_col + 1
-                    pmdn_col = periode_col + 2
-                    total_col = periode_col + 3
-                    pct_col = periode_col + 4
-                    proyek_col = periode_col + 5
-                    tki_col = periode_col + 6
-                    tka_col = periode_col + 7
-                    
-                    pma_rp = safe_float(row.iloc[pma_col]) if len(row) > pma_col else 0
-                    pmdn_rp = safe_float(row.iloc[pmdn_col]) if len(row) > pmdn_col else 0
-                    total_rp = safe_float(row.iloc[total_col]) if len(row) > total_col else 0
-                    percentage = safe_float(row.iloc[pct_col]) if len(row) > pct_col else 0
-                    proyek = safe_int(row.iloc[proyek_col]) if len(row) > proyek_col else 0
-                    tki = safe_int(row.iloc[tki_col]) if len(row) > tki_col else 0
-                    tka = safe_int(row.iloc[tka_col]) if len(row) > tka_col else 0
-                    
-                    # Only add if we have meaningful data
-                    if pma_rp > 0 or pmdn_rp > 0 or proyek > 0:
-                        results[tw] = TWSummary(
-                            triwulan=tw,
-                            year=year,
-                            pma_rp=pma_rp,
-                            pmdn_rp=pmdn_rp,
-                            total_rp=total_rp if total_rp > 0 else (pma_rp + pmdn_rp),
-                            proyek=proyek,
-                            tki=tki,
-                            tka=tka,
-                            target_rp=target_rp,
-                            percentage=percentage
-                        )
-                    break  # Found this TW, move to next row
+            tw = next((tw for tw in tw_patterns if tw in first_col), None)
+            if tw is None:
+                continue
+            periode_col = first_col[tw]
+            
+            # Extract values based on column positions relative to PERIODE
+            # Usually: PERIODE(2), PMA(3), PMDN(4), JUMLAH(5), %(6), PROYEK(7), TKI(8), TKA(9)
+            pma_rp, pmdn_rp, total_rp, percentage, proyek, tki, tka = (
+                numbers[row_idx, periode_col + 1:periode_col + 8].tolist()
+            )
+            proyek, tki, tka = int(proyek), int(tki), int(tka)
+            
+            # Only add if we have meaningful data
+            if pma_rp > 0 or pmdn_rp > 0 or proyek > 0:
+                results[tw] = TWSummary(
+                    triwulan=tw,
+                    year=year,
+                    pma_rp=pma_rp,
+                    pmdn_rp=pmdn_rp,
+                    total_rp=total_rp if total_rp > 0 else (pma_rp + pmdn_rp),
+                    proyek=proyek,
+                    tki=tki,
+                    tka=tka,
+                    target_rp=target_rp,
+                    percentage=percentage
+                )
         
         return results
 def load_excel_file(file_path: str | Path) -> Dict:
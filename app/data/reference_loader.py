@@ -12,19 +12,40 @@ Key Business Rules:
 - PB OSS counts all permits (not unique NIB)
 """
 
+import hashlib
+import numpy as np
 import pandas as pd
 import re
-import math
+import warnings
 from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 
 from app.config import NAMA_BULAN, TRIWULAN_KE_BULAN
+from app.data.loader import EXCEL_ENGINE
 
 
-@dataclass
+def _sum_months_by_key(by_key: Dict[str, Dict[str, Any]], months: List[str]) -> Dict[str, Any]:
+    """Sum a Key → Month → value mapping over the given months, per key."""
+    zeros = [0] * len(months)
+    return {key: sum(map(month_data.get, months, zeros)) for key, month_data in by_key.items()}
+
+
+def _sum_keys_over_months(by_month: Dict[str, Dict[str, Any]], months: List[str]) -> Dict[str, Any]:
+    """Sum a Month → Key → value mapping over the given months, per key."""
+    result = {}
+    for month in months:
+        month_data = by_month.get(month)
+        if month_data:
+            for key, value in month_data.items():
+                result[key] = result.get(key, 0) + value
+    return result
+
+
+@dataclass(slots=True)
 class NIBReferenceData:
     """Data structure for NIB reference file data."""
     year: int
@@ -36,6 +57,9 @@ class NIBReferenceData:
     # Detailed breakdowns for cross-tabulation (Kab/Kota → Month → Category → Count)
     kab_pm_monthly: Dict[str, Dict[str, Dict[str, int]]] = field(default_factory=dict)
     kab_skala_monthly: Dict[str, Dict[str, Dict[str, int]]] = field(default_factory=dict)
+    # Load status set by the app's cached loaders (parse vs disk cache)
+    _cache_status: Optional[str] = field(default=None, repr=False, compare=False)
+    _load_seconds: Optional[float] = field(default=None, repr=False, compare=False)
     
     def get_period_total(self, months: List[str]) -> int:
         """Get total NIB for specified months."""
@@ -43,27 +67,18 @@ class NIBReferenceData:
     
     def get_period_by_kab_kota(self, months: List[str]) -> Dict[str, int]:
         """Get Kab/Kota totals for specified months."""
-        result = {}
-        for kab, month_data in self.by_kab_kota.items():
-            result[kab] = sum(month_data.get(m, 0) for m in months)
-        return result
+        return _sum_months_by_key(self.by_kab_kota, months)
     
     def get_period_by_pm_status(self, months: List[str]) -> Dict[str, int]:
         """Get PM status totals for specified months."""
-        result = {}
-        for pm, month_data in self.by_pm_status.items():
-            result[pm] = sum(month_data.get(m, 0) for m in months)
-        return result
+        return _sum_months_by_key(self.by_pm_status, months)
     
     def get_period_by_skala_usaha(self, months: List[str]) -> Dict[str, int]:
         """Get skala usaha totals for specified months."""
-        result = {}
-        for skala, month_data in self.by_skala_usaha.items():
-            result[skala] = sum(month_data.get(m, 0) for m in months)
-        return result
+        return _sum_months_by_key(self.by_skala_usaha, months)
 
 
-@dataclass
+@dataclass(slots=True)
 class PBOSSReferenceData:
     """Data structure for PB OSS reference file data."""
     year: int
@@ -76,69 +91,37 @@ class PBOSSReferenceData:
     monthly_kewenangan: Dict[str, Dict[str, int]] = field(default_factory=dict)  # Month → Kewenangan → count
     monthly_permits: Dict[str, int] = field(default_factory=dict)  # Month → permit count
     total_permits: int = 0
+    # Load status set by the app's cached loaders (parse vs disk cache)
+    _cache_status: Optional[str] = field(default=None, repr=False, compare=False)
+    _load_seconds: Optional[float] = field(default=None, repr=False, compare=False)
     
     def get_period_risk(self, months: List[str]) -> Dict[str, int]:
         """Get risk distribution for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_risk:
-                for risk, count in self.monthly_risk[month].items():
-                    result[risk] = result.get(risk, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_risk, months)
     
     def get_period_sector(self, months: List[str]) -> Dict[str, int]:
         """Get sector distribution for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_sector:
-                for sector, count in self.monthly_sector[month].items():
-                    result[sector] = result.get(sector, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_sector, months)
     
     def get_period_by_kab_kota(self, months: List[str]) -> Dict[str, int]:
         """Get permits by Kab/Kota for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_by_kab_kota:
-                for kab, count in self.monthly_by_kab_kota[month].items():
-                    result[kab] = result.get(kab, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_by_kab_kota, months)
     
     def get_period_status_pm(self, months: List[str]) -> Dict[str, int]:
         """Get Status PM distribution for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_status_pm:
-                for status, count in self.monthly_status_pm[month].items():
-                    result[status] = result.get(status, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_status_pm, months)
     
     def get_period_jenis_perizinan(self, months: List[str]) -> Dict[str, int]:
         """Get Jenis Perizinan distribution for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_jenis_perizinan:
-                for jenis, count in self.monthly_jenis_perizinan[month].items():
-                    result[jenis] = result.get(jenis, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_jenis_perizinan, months)
     
     def get_period_status_perizinan(self, months: List[str]) -> Dict[str, int]:
         """Get Status Perizinan distribution for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_status_perizinan:
-                for status, count in self.monthly_status_perizinan[month].items():
-                    result[status] = result.get(status, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_status_perizinan, months)
     
     def get_period_kewenangan(self, months: List[str]) -> Dict[str, int]:
         """Get Kewenangan distribution for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_kewenangan:
-                for kew, count in self.monthly_kewenangan[month].items():
-                    result[kew] = result.get(kew, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_kewenangan, months)
     
     def get_period_permits(self, months: List[str]) -> int:
         """Get total permits for specified months."""
@@ -169,7 +152,7 @@ class PBOSSReferenceData:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ProyekReferenceData:
     """Data structure for PROYEK reference file data."""
     year: int
@@ -186,6 +169,9 @@ class ProyekReferenceData:
     monthly_by_skala_usaha: Dict[str, Dict[str, int]] = field(default_factory=dict)  # Month → Skala → project count
     monthly_labor_by_wilayah: Dict[str, Dict[str, int]] = field(default_factory=dict)  # Month → Wilayah → labor count (TKI+TKA)
     monthly_projects_by_wilayah: Dict[str, Dict[str, int]] = field(default_factory=dict)  # Month → Wilayah → project count
+    # Load status set by the app's cached loaders (parse vs disk cache)
+    _cache_status: Optional[str] = field(default=None, repr=False, compare=False)
+    _load_seconds: Optional[float] = field(default=None, repr=False, compare=False)
     
     def get_period_investment(self, months: List[str]) -> float:
         """Get total investment for specified months."""
@@ -221,39 +207,19 @@ class ProyekReferenceData:
     
     def get_period_by_wilayah(self, months: List[str]) -> Dict[str, float]:
         """Get investment by wilayah for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_by_wilayah:
-                for wilayah, investment in self.monthly_by_wilayah[month].items():
-                    result[wilayah] = result.get(wilayah, 0) + investment
-        return result
+        return _sum_keys_over_months(self.monthly_by_wilayah, months)
     
     def get_period_by_skala_usaha(self, months: List[str]) -> Dict[str, int]:
         """Get project count by skala usaha for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_by_skala_usaha:
-                for skala, count in self.monthly_by_skala_usaha[month].items():
-                    result[skala] = result.get(skala, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_by_skala_usaha, months)
     
     def get_period_labor_by_wilayah(self, months: List[str]) -> Dict[str, int]:
         """Get total labor (TKI+TKA) by wilayah for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_labor_by_wilayah:
-                for wilayah, count in self.monthly_labor_by_wilayah[month].items():
-                    result[wilayah] = result.get(wilayah, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_labor_by_wilayah, months)
     
     def get_period_projects_by_wilayah(self, months: List[str]) -> Dict[str, int]:
         """Get project count by wilayah for specified months."""
-        result = {}
-        for month in months:
-            if month in self.monthly_projects_by_wilayah:
-                for wilayah, count in self.monthly_projects_by_wilayah[month].items():
-                    result[wilayah] = result.get(wilayah, 0) + count
-        return result
+        return _sum_keys_over_months(self.monthly_projects_by_wilayah, months)
 
 
 class ReferenceDataLoader:
@@ -270,11 +236,16 @@ class ReferenceDataLoader:
         5: "Mei", 6: "Juni", 7: "Juli", 8: "Agustus",
         9: "September", 10: "Oktober", 11: "November", 12: "Desember"
     }
+    # '_month' columns use this dtype: 12 ordered categories in calendar order
+    MONTH_DTYPE = pd.CategoricalDtype(NAMA_BULAN, ordered=True)
     INDO_MONTHS = {
         'Januari': 1, 'Februari': 2, 'Maret': 3, 'April': 4,
         'Mei': 5, 'Juni': 6, 'Juli': 7, 'Agustus': 8,
         'September': 9, 'Oktober': 10, 'November': 11, 'Desember': 12
     }
+    # "DD Month YYYY" with an Indonesian month name (any case), compiled once
+    INDO_DATE_RE = re.compile(r'(\d{1,2})\s+(' + '|'.join(INDO_MONTHS) + r')\s+(\d{4})', re.IGNORECASE)
+    INDO_MONTH_INDEX = {name.lower(): idx for name, idx in INDO_MONTHS.items()}
     
     # Risk level mapping
     RISK_MAP = {
@@ -284,50 +255,97 @@ class ReferenceDataLoader:
         'T': 'Tinggi'
     }
     
+    # Column name patterns per loader (matched by _find_column on the header);
+    # only the columns they find are read from the sheet
+    NIB_COLUMN_PATTERNS = {
+        'nib': ['nib'],
+        'date': ['tanggal_terbit', 'tanggal', 'day of tanggal'],
+        'kab': ['kab_kota', 'kab kota', 'kabupaten'],
+        'pm': ['status_penanaman_modal', 'status pm', 'penanaman_modal'],
+        'skala': ['uraian_skala_usaha', 'skala_usaha', 'skala usaha'],
+    }
+    PB_OSS_COLUMN_PATTERNS = {
+        'nib': ['nib'],
+        'date': ['day of tgl_izin', 'tanggal', 'tgl', 'date'],
+        'risk': ['risiko', 'risk', 'kd_resiko', 'uraian risiko'],
+        'sector': ['sektor', 'sector', 'judul_kbli', 'uraian_sektor'],
+        'kab_kota': ['kab_kota', 'kab kota', 'kabupaten', 'kota'],
+        'status_pm': ['status pm', 'status_pm'],
+        'jenis_perizinan': ['uraian_jenis_perizinan', 'jenis_perizinan', 'jenis perizinan'],
+        'status_perizinan': ['status perizinan', 'status_perizinan'],
+    }
+    PROYEK_COLUMN_PATTERNS = {
+        'date': ['tanggal_pengajuan_proyek', 'tanggal_pengajuan', 'tanggal pengajuan'],
+        'investment': ['jumlah investasi', 'jumlah_investasi', 'investasi'],
+        'pm': ['status pm', 'status_pm', 'penanaman modal'],
+        'wilayah': ['kab kota usaha', 'kab_kota_usaha', 'kab kota', 'kabupaten'],
+        'tki': ['tki'],
+        'tka': ['tka'],
+        'skala': ['uraian_skala_usaha', 'skala_usaha', 'skala usaha'],
+        'kewenangan': ['kewenangan'],
+        'id': ['id_proyek', 'id proyek', 'nomor_proyek', 'kode_proyek', 'nib'],
+        'name': ['nama_perusahaan', 'nama perusahaan', 'nama_perseroan', 'pelaku_usaha'],
+    }
+    
     def __init__(self):
+        # Parsed results keyed by (loader, content hash, filename, year)
         self.data_cache = {}
     
-    def detect_file_type(self, file_bytes: BytesIO, filename: str) -> Optional[str]:
+    def _data_cache_key(self, kind: str, file_bytes, filename: str, year: Optional[int]) -> Optional[Tuple]:
+        """Content-based data_cache key, or None when the raw bytes are not available."""
+        if isinstance(file_bytes, (bytes, bytearray)):
+            content = file_bytes
+        elif hasattr(file_bytes, 'getvalue'):
+            content = file_bytes.getvalue()
+        else:
+            return None
+        return (kind, hashlib.blake2b(content, digest_size=16).hexdigest(), filename, year)
+    
+    def detect_file_type(self, file_bytes: BytesIO, filename: str) -> Tuple[Optional[str], Optional[pd.ExcelFile]]:
         """
         Detect file type from sheet names and structure.
         
-        Returns: 'NIB', 'PB_OSS', 'PROYEK', or None
+        Returns: ('NIB', 'PB_OSS', 'PROYEK' or None, opened ExcelFile). Pass
+        the ExcelFile to the matching load_* method as xl= so the workbook
+        is not opened a second time; it is None if the file could not be read.
         """
         try:
-            xl = pd.ExcelFile(file_bytes)
-            sheet_names = [s.upper() for s in xl.sheet_names]
-            
-            # Check for PROYEK indicators
-            if len(xl.sheet_names) == 1:
-                df = pd.read_excel(xl, sheet_name=xl.sheet_names[0], nrows=5)
-                cols = [str(c).upper() for c in df.columns]
-                if any('PROYEK' in c or 'INVESTASI' in c for c in cols):
-                    return 'PROYEK'
-                if any('JUMLAH INVESTASI' in c for c in cols):
-                    return 'PROYEK'
-            
-            # Check for PB OSS indicators (has RISIKO or SEKTOR sheets)
-            if any('RISIKO' in s for s in sheet_names) or any('SEKTOR' in s for s in sheet_names):
-                return 'PB_OSS'
-            
-            # Check for NIB indicators (has SKALA USAHA or PM sheets)
-            if any('SKALA' in s for s in sheet_names) or any('JENIS PERUSAHAAN' in s for s in sheet_names):
-                return 'NIB'
-            
-            # Fallback: check filename
-            filename_upper = filename.upper()
-            if 'NIB' in filename_upper:
-                return 'NIB'
-            if 'PB' in filename_upper or 'PERIZINAN' in filename_upper:
-                return 'PB_OSS'
-            if 'PROYEK' in filename_upper:
-                return 'PROYEK'
-            
-            return None
-            
+            xl = pd.ExcelFile(file_bytes, engine=EXCEL_ENGINE)
+            return self._detect_file_type(xl, filename), xl
         except Exception as e:
             print(f"Error detecting file type: {e}")
-            return None
+            return None, None
+    
+    def _detect_file_type(self, xl: pd.ExcelFile, filename: str) -> Optional[str]:
+        """Detect file type of an opened workbook."""
+        sheet_names = [s.upper() for s in xl.sheet_names]
+        
+        # Check for PROYEK indicators
+        if len(xl.sheet_names) == 1:
+            cols = [str(c).upper() for c in pd.read_excel(xl, sheet_name=xl.sheet_names[0], nrows=0).columns]
+            if any('PROYEK' in c or 'INVESTASI' in c for c in cols):
+                return 'PROYEK'
+            if any('JUMLAH INVESTASI' in c for c in cols):
+                return 'PROYEK'
+        
+        # Check for PB OSS indicators (has RISIKO or SEKTOR sheets)
+        if any('RISIKO' in s for s in sheet_names) or any('SEKTOR' in s for s in sheet_names):
+            return 'PB_OSS'
+        
+        # Check for NIB indicators (has SKALA USAHA or PM sheets)
+        if any('SKALA' in s for s in sheet_names) or any('JENIS PERUSAHAAN' in s for s in sheet_names):
+            return 'NIB'
+        
+        # Fallback: check filename
+        filename_upper = filename.upper()
+        if 'NIB' in filename_upper:
+            return 'NIB'
+        if 'PB' in filename_upper or 'PERIZINAN' in filename_upper:
+            return 'PB_OSS'
+        if 'PROYEK' in filename_upper:
+            return 'PROYEK'
+        
+        return None
     
     def extract_year_from_filename(self, filename: str) -> Optional[int]:
         """Extract year from filename."""
@@ -336,105 +354,30 @@ class ReferenceDataLoader:
             return int(match.group(1))
         return None
     
-    def _parse_date_to_month(self, date_val) -> Optional[str]:
-        """Parse a date value to month name."""
-        if pd.isna(date_val):
-            return None
-        
-        try:
-            # If standard datetime object
-            if isinstance(date_val, datetime):
-                return self.MONTH_MAP.get(date_val.month)
-            
-            # If string
-            if isinstance(date_val, str):
-                date_str = date_val.strip()
-                
-                # Check for "Day Month Year" format (e.g., "18 November 2025")
-                # This format often appears in the Excel files
-                try:
-                    # Try English parsing first
-                    dt = datetime.strptime(date_str, '%d %B %Y')
-                    return self.MONTH_MAP.get(dt.month)
-                except ValueError:
-                    pass
-                
-                # Try handling Indonesian month names manually
-                # Map Indo month -> English month for parsing, or direct to index
-                for indo, idx in self.INDO_MONTHS.items():
-                    if indo in date_str:
-                        return self.MONTH_MAP.get(idx)
-                
-                # Try standard numeric formats
-                for fmt in ['%m/%d/%Y', '%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                    try:
-                        dt = datetime.strptime(date_str, fmt)
-                        return self.MONTH_MAP.get(dt.month)
-                    except ValueError:
-                        continue
-                        
-            return None
-        except Exception:
-            return None
-
-    def _parse_date_obj(self, date_val) -> Optional[datetime]:
-        """Parse a date value to datetime object."""
-        if pd.isna(date_val):
-            return None
-        
-        try:
-            # If standard datetime object
-            if isinstance(date_val, (datetime, pd.Timestamp)):
-                return date_val
-
-            if isinstance(date_val, (int, float)) and not math.isnan(float(date_val)):
-                parsed = pd.to_datetime(date_val, unit='D', origin='1899-12-30', errors='coerce')
-                if not pd.isna(parsed):
-                    return parsed.to_pydatetime()
-            
-            # If string
-            if isinstance(date_val, str):
-                date_str = date_val.strip()
-                
-                # Check for "Day Month Year" format (e.g., "18 November 2025")
-                try:
-                    # Try English parsing first
-                    return datetime.strptime(date_str, '%d %B %Y')
-                except ValueError:
-                    pass
-                
-                # Check for Indonesian month names manually
-                # Check if string contains any Indo month
-                for indo, idx in self.INDO_MONTHS.items():
-                    if indo.lower() in date_str.lower():
-                        # Try to replace indo month with english or parse manually
-                        # Simple regex to extract Day and Year if format is "DD Month YYYY"
-                        import re
-                        match = re.search(r'(\d{1,2})\s+([a-zA-Z]+)\s+(\d{4})', date_str)
-                        if match:
-                            d, m, y = match.groups()
-                            if m.lower() == indo.lower():
-                                return datetime(int(y), idx, int(d))
-                
-                # Try standard numeric formats
-                for fmt in ['%m/%d/%Y', '%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                    try:
-                        return datetime.strptime(date_str, fmt)
-                    except ValueError:
-                        continue
-                        
-            return None
-        except Exception:
-            return None
-
     def _parse_date_series(self, series: pd.Series) -> pd.Series:
-        """Parse a date Series with vectorized pandas parsing plus Indonesian fallback."""
+        """
+        Parse a date Series to datetimes without a per-row Python fallback.
+        
+        Handles datetimes, Excel serial numbers, anything pd.to_datetime
+        infers, "DD Month YYYY" with Indonesian month names, and the
+        English/numeric formats of _parse_date_text.
+        Unparseable values become NaT.
+        """
         if pd.api.types.is_datetime64_any_dtype(series):
             return pd.to_datetime(series, errors='coerce')
 
         parsed = pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
-        numeric_values = pd.to_numeric(series, errors='coerce')
-        numeric_mask = series.map(lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)) & numeric_values.notna()
+
+        # Excel serial numbers: real numbers only, numeric strings are dates below
+        if pd.api.types.is_bool_dtype(series):
+            numeric_mask = pd.Series(False, index=series.index)
+        else:
+            numeric_values = pd.to_numeric(series, errors='coerce')
+            numeric_mask = numeric_values.notna()
+            if not pd.api.types.is_numeric_dtype(series) and numeric_mask.any():
+                numeric_mask.loc[numeric_mask] = series.loc[numeric_mask].map(
+                    lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)
+                )
         if numeric_mask.any():
             parsed.loc[numeric_mask] = pd.to_datetime(
                 numeric_values.loc[numeric_mask],
@@ -445,48 +388,100 @@ class ReferenceDataLoader:
 
         remaining = parsed.isna() & series.notna()
         if remaining.any():
-            parsed.loc[remaining] = pd.to_datetime(series.loc[remaining], errors='coerce', dayfirst=False)
+            with warnings.catch_warnings():
+                # A day-first first value ("25/03/2025") is still inferred correctly;
+                # pandas only warns that dayfirst=False did not apply to it
+                warnings.filterwarnings('ignore', message='Parsing dates in .* when dayfirst=False', category=UserWarning)
+                parsed.loc[remaining] = pd.to_datetime(series.loc[remaining], errors='coerce', dayfirst=False)
 
-        missing = parsed.isna() & series.notna()
+        missing = parsed.isna() & series.notna() & ~numeric_mask
         if missing.any():
-            parsed.loc[missing] = series.loc[missing].apply(self._parse_date_obj)
+            # Date columns repeat a few hundred distinct values, so the text
+            # formats are parsed once per distinct string
+            codes, uniques = pd.factorize(series.loc[missing].astype(str).str.strip())
+            parsed.loc[missing] = self._parse_date_text(pd.Series(uniques)).to_numpy()[codes]
+        return parsed
+
+    def _parse_date_text(self, text: pd.Series) -> pd.Series:
+        """Parse stripped date strings in the formats to_datetime does not infer; others become NaT."""
+        parsed = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+
+        # "DD Month YYYY" with an Indonesian month name; an invalid day stays NaT
+        parts = text.str.extract(self.INDO_DATE_RE)
+        month_idx = parts[1].str.lower().map(self.INDO_MONTH_INDEX)
+        indo = month_idx.notna()
+        if indo.any():
+            parsed.loc[indo] = pd.to_datetime(
+                pd.DataFrame({
+                    'year': parts.loc[indo, 2].astype(int),
+                    'month': month_idx.loc[indo].astype(int),
+                    'day': parts.loc[indo, 0].astype(int),
+                }),
+                errors='coerce'
+            )
+            text = text.loc[~indo]
+
+        # Explicit formats, first match wins
+        for fmt in ['%d %B %Y', '%m/%d/%Y', '%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
+            if text.empty:
+                break
+            matched = pd.to_datetime(text, format=fmt, errors='coerce')
+            hit = matched.notna()
+            parsed.loc[hit.index[hit]] = matched.loc[hit]
+            text = text.loc[~hit]
         return parsed
 
     def _month_series(self, series: pd.Series) -> pd.Series:
         """Convert a date Series to canonical Indonesian month names."""
         parsed = self._parse_date_series(series)
-        return parsed.dt.month.map(self.MONTH_MAP)
+        return parsed.dt.month.map(self.MONTH_MAP).astype(self.MONTH_DTYPE)
+
+    @staticmethod
+    def _normalized_categorical(values: pd.Series, normalize, sort: bool = False) -> pd.Categorical:
+        """
+        Apply normalize once per distinct value of values, as a Categorical.
+
+        Raw values that normalize to the same label share one category; missing
+        values stay missing. Works on the category codes directly rather than
+        Series.map(..., na_action='ignore'), which pandas 2.0 rejects for
+        categoricals. sort orders the categories like astype('category').
+        """
+        raw = values.astype('category')
+        label_codes, labels = pd.factorize(raw.cat.categories.map(normalize), sort=sort)
+        # Raw code -1 (missing) picks the appended -1
+        codes = np.append(label_codes, -1)[raw.cat.codes.to_numpy()]
+        return pd.Categorical.from_codes(codes, categories=labels)
+
+    # The assign helpers fan a groupby result out into the nested dicts in one
+    # walk over Series.to_dict(); groupby already drops missing keys
+
+    def _risk_name(self, value) -> str:
+        risk_str = str(value).strip().upper()
+        return self.RISK_MAP.get(risk_str, risk_str)
 
     def _assign_count_by_month(self, target: Dict[str, int], counts: pd.Series) -> None:
-        for month, count in counts.items():
-            if pd.notna(month):
-                target[month] = int(count)
+        for month, count in counts.to_dict().items():
+            target[month] = int(count)
 
     def _assign_nested_month_counts(self, target: Dict[str, Dict[str, int]], counts: pd.Series, key_transform=None) -> None:
-        for key, month, count in counts.reset_index().itertuples(index=False, name=None):
-            if pd.isna(key) or pd.isna(month):
-                continue
+        for (key, month), count in counts.to_dict().items():
             key = key_transform(key) if key_transform else key
             target.setdefault(key, {})[month] = int(count)
 
     def _assign_month_nested_counts(self, target: Dict[str, Dict[str, int]], counts: pd.Series, value_transform=None, limit_per_month: Optional[int] = None) -> None:
-        frame = counts.reset_index(name='count')
-        if limit_per_month is not None and not frame.empty:
-            frame = frame.sort_values(['_month', 'count'], ascending=[True, False]).groupby('_month').head(limit_per_month)
-        for month, value, count in frame.itertuples(index=False, name=None):
-            if pd.isna(month) or pd.isna(value):
-                continue
+        if limit_per_month is not None and not counts.empty:
+            counts = counts.groupby(level=0, group_keys=False, observed=True).nlargest(limit_per_month)
+        for (month, value), count in counts.to_dict().items():
             value = value_transform(value) if value_transform else value
             target.setdefault(month, {})[value] = int(count)
 
     def _assign_three_level_counts(self, target: Dict[str, Dict[str, Dict[str, int]]], counts: pd.Series, third_transform=None) -> None:
-        for first, month, third, count in counts.reset_index().itertuples(index=False, name=None):
-            if pd.isna(first) or pd.isna(month) or pd.isna(third):
-                continue
+        for (first, month, third), count in counts.to_dict().items():
             third = third_transform(third) if third_transform else third
             target.setdefault(first, {}).setdefault(month, {})[third] = int(count)
 
-    def load_nib(self, file_bytes: BytesIO, filename: str, year: Optional[int] = None) -> Optional[NIBReferenceData]:
+    def load_nib(self, file_bytes: BytesIO, filename: str, year: Optional[int] = None,
+                 xl: Optional[pd.ExcelFile] = None) -> Optional[NIBReferenceData]:
         """
         Load NIB reference file.
         
@@ -497,8 +492,13 @@ class ReferenceDataLoader:
         - status_penanaman_modal: PMA/PMDN
         - uraian_skala_usaha: Business scale
         """
+        cache_key = self._data_cache_key('nib', file_bytes, filename, year)
+        if cache_key in self.data_cache:
+            return self.data_cache[cache_key]
+        
         try:
-            xl = pd.ExcelFile(file_bytes)
+            if xl is None:
+                xl = pd.ExcelFile(file_bytes, engine=EXCEL_ENGINE)
             
             # Find Sheet 1 or similar raw data sheet
             # Priority: 'Sheet 1' (with space) > 'sheet1' (no space) > last sheet
@@ -517,22 +517,21 @@ class ReferenceDataLoader:
             if not raw_sheet:
                 raw_sheet = xl.sheet_names[-1]  # Fallback to last sheet
             
-            df = pd.read_excel(xl, sheet_name=raw_sheet)
-            
-            # Normalize column names
-            df.columns = [str(c).strip().lower() for c in df.columns]
-            
-            # Find relevant columns
-            nib_col = self._find_column(df, ['nib'])
-            date_col = self._find_column(df, ['tanggal_terbit', 'tanggal', 'day of tanggal'])
-            kab_col = self._find_column(df, ['kab_kota', 'kab kota', 'kabupaten'])
-            pm_col = self._find_column(df, ['status_penanaman_modal', 'status pm', 'penanaman_modal'])
-            skala_col = self._find_column(df, ['uraian_skala_usaha', 'skala_usaha', 'skala usaha'])
+            # Find relevant columns on the header, then read only those
+            header = self._read_header(xl, raw_sheet)
+            columns = self._find_columns(header, self.NIB_COLUMN_PATTERNS)
+            nib_col = columns['nib']
+            date_col = columns['date']
+            kab_col = columns['kab']
+            pm_col = columns['pm']
+            skala_col = columns['skala']
             
             if not nib_col:
                 print(f"NIB column not found in {filename}")
                 return None
             
+            df = self._read_columns(xl, raw_sheet, header, columns.values())
+            
             # Extract year
             if year is None:
                 year = self.extract_year_from_filename(filename) or datetime.now().year
@@ -541,51 +540,69 @@ class ReferenceDataLoader:
                 df['_month'] = self._month_series(df[date_col])
                 df = df[df['_month'].isin(NAMA_BULAN)].copy()
             else:
-                df['_month'] = 'Januari'
+                df['_month'] = pd.Series('Januari', index=df.index, dtype=self.MONTH_DTYPE)
+
+            # Kab/PM/skala each key several groupbys below: hash their values once
+            self._categorize(df, kab_col, skala_col)
+            # Every breakdown counts distinct NIBs: factorize them once so each
+            # nunique below works on small integer codes instead of strings
+            nib_codes = pd.factorize(df[nib_col])[0]
+            df['_nib'] = np.where(nib_codes < 0, np.nan, nib_codes)
 
             result = NIBReferenceData(year=year)
 
-            monthly_counts = df.groupby('_month')[nib_col].nunique()
+            monthly_counts = df.groupby('_month', observed=True)['_nib'].nunique()
             self._assign_count_by_month(result.monthly_totals, monthly_counts)
 
             if kab_col:
-                kab_counts = df.groupby([kab_col, '_month'])[nib_col].nunique()
+                kab_counts = df.groupby([kab_col, '_month'], observed=True)['_nib'].nunique()
                 self._assign_nested_month_counts(result.by_kab_kota, kab_counts)
 
             if pm_col:
-                df['_pm_status'] = df[pm_col].astype(str).str.upper().str.strip()
-                pm_counts = df.groupby(['_pm_status', '_month'])[nib_col].nunique()
+                # Normalized once per distinct status instead of once per row
+                df['_pm_status'] = self._normalized_categorical(
+                    df[pm_col], lambda status: str(status).upper().strip(), sort=True
+                )
+                pm_counts = df.groupby(['_pm_status', '_month'], observed=True)['_nib'].nunique()
                 self._assign_nested_month_counts(result.by_pm_status, pm_counts)
 
             if skala_col:
-                skala_counts = df.groupby([skala_col, '_month'])[nib_col].nunique()
+                skala_counts = df.groupby([skala_col, '_month'], observed=True)['_nib'].nunique()
                 self._assign_nested_month_counts(result.by_skala_usaha, skala_counts)
 
             if kab_col and pm_col:
-                kab_pm = df.groupby([kab_col, '_month', '_pm_status'])[nib_col].nunique()
+                kab_pm = df.groupby([kab_col, '_month', '_pm_status'], observed=True)['_nib'].nunique()
                 self._assign_three_level_counts(result.kab_pm_monthly, kab_pm)
 
             if kab_col and skala_col:
-                kab_skala = df.groupby([kab_col, '_month', skala_col])[nib_col].nunique()
+                kab_skala = df.groupby([kab_col, '_month', skala_col], observed=True)['_nib'].nunique()
                 self._assign_three_level_counts(result.kab_skala_monthly, kab_skala)
             
             # Calculate total (sum of monthly counts)
             result.total_nib = sum(result.monthly_totals.values())
             
+            if cache_key is not None:
+                self.data_cache[cache_key] = result
             return result
             
         except Exception as e:
             print(f"Error loading NIB file: {e}")
             return None
     
-    def load_pb_oss(self, file_bytes: BytesIO, filename: str, year: Optional[int] = None) -> Optional[PBOSSReferenceData]:
+    def load_pb_oss(self, file_bytes: BytesIO, filename: str, year: Optional[int] = None,
+                    xl: Optional[pd.ExcelFile] = None) -> Optional[PBOSSReferenceData]:
         """
         Load PB OSS reference file.
         
         Uses Sheet 1 (raw data) to count all permits by risk/sector.
         """
+        cache_key = self._data_cache_key('pb_oss', file_bytes, filename, year)
+        if cache_key in self.data_cache:
+            return self.data_cache[cache_key]
+        
         try:
-            xl = pd.ExcelFile(file_bytes)
+            if xl is None:
+                xl = pd.ExcelFile(file_bytes, engine=EXCEL_ENGINE)
             
             # Smart sheet detection
             # Find all sheets that look like raw data
@@ -603,17 +620,19 @@ class ReferenceDataLoader:
             max_rows = 0
             best_df = None
             
-            # Evaluate candidates
+            # Evaluate candidates: the header decides whether a sheet
+            # qualifies, and only qualifying sheets are read (used columns only).
+            # Row counts come from that read, not from the sheet's stored
+            # dimension: exports often write a stale or "A1" dimension, which
+            # pandas ignores as well.
             for sheet in candidate_sheets:
                 try:
-                    df = pd.read_excel(xl, sheet_name=sheet)
-                    df.columns = [str(c).strip().lower() for c in df.columns]
+                    header = self._read_header(xl, sheet)
+                    columns = self._find_columns(header, self.PB_OSS_COLUMN_PATTERNS)
                     
                     # Check for critical columns
-                    has_risk = self._find_column(df, ['risiko', 'risk', 'kd_resiko', 'uraian risiko'])
-                    has_nib = self._find_column(df, ['nib'])
-                    
-                    if has_risk or has_nib:
+                    if columns['risk'] or columns['nib']:
+                        df = self._read_columns(xl, sheet, header, [*columns.values(), *self._kewenangan_columns(header)])
                         if len(df) > max_rows:
                             max_rows = len(df)
                             best_sheet = sheet
@@ -628,9 +647,9 @@ class ReferenceDataLoader:
             df = best_df
             
             # Find relevant columns
-            date_col = self._find_column(df, ['day of tgl_izin', 'tanggal', 'tgl', 'date'])
-            risk_col = self._find_column(df, ['risiko', 'risk', 'kd_resiko', 'uraian risiko'])
-            sector_col = self._find_column(df, ['sektor', 'sector', 'judul_kbli', 'uraian_sektor'])
+            date_col = self._find_column(df, self.PB_OSS_COLUMN_PATTERNS['date'])
+            risk_col = self._find_column(df, self.PB_OSS_COLUMN_PATTERNS['risk'])
+            sector_col = self._find_column(df, self.PB_OSS_COLUMN_PATTERNS['sector'])
             
             if year is None:
                 year = self.extract_year_from_filename(filename) or datetime.now().year
@@ -639,38 +658,26 @@ class ReferenceDataLoader:
                 df['_month'] = self._month_series(df[date_col])
             else:
                 # If no date, put all in first month
-                df['_month'] = 'Januari'
+                df['_month'] = pd.Series('Januari', index=df.index, dtype=self.MONTH_DTYPE)
             df = df[df['_month'].isin(NAMA_BULAN)].copy()
             
             result = PBOSSReferenceData(year=year)
             
             # Find additional columns for new breakdowns
-            kab_kota_col = self._find_column(df, ['kab_kota', 'kab kota', 'kabupaten', 'kota'])
-            status_pm_col = self._find_column(df, ['status pm', 'status_pm'])
-            jenis_perizinan_col = self._find_column(df, ['uraian_jenis_perizinan', 'jenis_perizinan', 'jenis perizinan'])
-            status_perizinan_col = self._find_column(df, ['status perizinan', 'status_perizinan'])
-            
-            # Find kewenangan columns - strict detection first
-            uraian_kewenangan_col = self._find_exact_column(df, 'uraian_kewenangan')
-            kewenangan_col = self._find_exact_column(df, 'kewenangan')
-            
-            # Fallback to fuzzy search if exact match not found
-            if not kewenangan_col or not uraian_kewenangan_col:
-                for col in df.columns:
-                    col_lower = str(col).lower().strip()
-                    if not uraian_kewenangan_col and col_lower == 'uraian_kewenangan':
-                        uraian_kewenangan_col = col
-                    elif not kewenangan_col and 'kewenangan' in col_lower and 'uraian' not in col_lower:
-                        kewenangan_col = col
+            kab_kota_col = self._find_column(df, self.PB_OSS_COLUMN_PATTERNS['kab_kota'])
+            status_pm_col = self._find_column(df, self.PB_OSS_COLUMN_PATTERNS['status_pm'])
+            jenis_perizinan_col = self._find_column(df, self.PB_OSS_COLUMN_PATTERNS['jenis_perizinan'])
+            status_perizinan_col = self._find_column(df, self.PB_OSS_COLUMN_PATTERNS['status_perizinan'])
+            uraian_kewenangan_col, kewenangan_col = self._kewenangan_columns(df)
             
 
             
             if kewenangan_col:
-                kew_counts = df.groupby(['_month', kewenangan_col]).size()
+                kew_counts = df.groupby(['_month', kewenangan_col], observed=True).size()
                 self._assign_month_nested_counts(result.monthly_kewenangan, kew_counts)
 
             if status_perizinan_col:
-                status_counts = df.groupby(['_month', status_perizinan_col]).size()
+                status_counts = df.groupby(['_month', status_perizinan_col], observed=True).size()
                 self._assign_month_nested_counts(result.monthly_status_perizinan, status_counts)
             
             # Now apply Gubernur filter for remaining breakdowns
@@ -681,41 +688,45 @@ class ReferenceDataLoader:
                 gubernur_mask = df[kewenangan_col].astype(str).str.upper().str.contains('GUBERNUR', na=False)
                 df = df[gubernur_mask].copy()
 
-            self._assign_count_by_month(result.monthly_permits, df.groupby('_month').size())
+            self._assign_count_by_month(result.monthly_permits, df.groupby('_month', observed=True).size())
 
             if risk_col:
-                risk_counts = df.groupby(['_month', risk_col]).size()
-                def risk_name(value):
-                    risk_str = str(value).strip().upper()
-                    return self.RISK_MAP.get(risk_str, risk_str)
-                self._assign_month_nested_counts(result.monthly_risk, risk_counts, risk_name)
+                # Normalize risk codes once per distinct value (R -> Rendah, ...)
+                df[risk_col] = self._normalized_categorical(df[risk_col], self._risk_name)
+
+            if risk_col:
+                risk_counts = df.groupby(['_month', risk_col], observed=True).size()
+                self._assign_month_nested_counts(result.monthly_risk, risk_counts)
 
             if sector_col:
-                sector_counts = df.groupby(['_month', sector_col]).size()
+                sector_counts = df.groupby(['_month', sector_col], observed=True).size()
                 self._assign_month_nested_counts(result.monthly_sector, sector_counts)
 
             if kab_kota_col:
-                kab_counts = df.groupby(['_month', kab_kota_col]).size()
+                kab_counts = df.groupby(['_month', kab_kota_col], observed=True).size()
                 self._assign_month_nested_counts(result.monthly_by_kab_kota, kab_counts)
 
             if status_pm_col:
-                pm_counts = df.groupby(['_month', status_pm_col]).size()
+                pm_counts = df.groupby(['_month', status_pm_col], observed=True).size()
                 self._assign_month_nested_counts(result.monthly_status_pm, pm_counts)
 
             if jenis_perizinan_col:
-                jenis_counts = df.groupby(['_month', jenis_perizinan_col]).size()
+                jenis_counts = df.groupby(['_month', jenis_perizinan_col], observed=True).size()
                 self._assign_month_nested_counts(result.monthly_jenis_perizinan, jenis_counts, limit_per_month=15)
             
             # Calculate total permits (from Gubernur-filtered data)
             result.total_permits = len(df)
             
+            if cache_key is not None:
+                self.data_cache[cache_key] = result
             return result
             
         except Exception as e:
             print(f"Error loading PB OSS file: {e}")
             return None
     
-    def load_proyek(self, file_bytes: BytesIO, filename: str, year: Optional[int] = None) -> Optional[ProyekReferenceData]:
+    def load_proyek(self, file_bytes: BytesIO, filename: str, year: Optional[int] = None,
+                    xl: Optional[pd.ExcelFile] = None) -> Optional[ProyekReferenceData]:
         """
         Load PROYEK reference file.
         
@@ -726,22 +737,27 @@ class ReferenceDataLoader:
         - Kab Kota Usaha: Location
         - TKI, TKA: Labor counts
         """
+        cache_key = self._data_cache_key('proyek', file_bytes, filename, year)
+        if cache_key in self.data_cache:
+            return self.data_cache[cache_key]
+        
         try:
-            xl = pd.ExcelFile(file_bytes)
+            if xl is None:
+                xl = pd.ExcelFile(file_bytes, engine=EXCEL_ENGINE)
             
-            # Use first/only sheet
+            # Use first/only sheet; find relevant columns on the header, then read only those
             raw_sheet = xl.sheet_names[0]
-            df = pd.read_excel(xl, sheet_name=raw_sheet)
-            df.columns = [str(c).strip().lower() for c in df.columns]
-            
-            # Find relevant columns
-            date_col = self._find_column(df, ['tanggal_pengajuan_proyek', 'tanggal_pengajuan', 'tanggal pengajuan'])
-            investment_col = self._find_column(df, ['jumlah investasi', 'jumlah_investasi', 'investasi'])
-            pm_col = self._find_column(df, ['status pm', 'status_pm', 'penanaman modal'])
-            wilayah_col = self._find_column(df, ['kab kota usaha', 'kab_kota_usaha', 'kab kota', 'kabupaten'])
-            tki_col = self._find_column(df, ['tki'])
-            tka_col = self._find_column(df, ['tka'])
-            skala_col = self._find_column(df, ['uraian_skala_usaha', 'skala_usaha', 'skala usaha'])
+            header = self._read_header(xl, raw_sheet)
+            columns = self._find_columns(header, self.PROYEK_COLUMN_PATTERNS)
+            df = self._read_columns(xl, raw_sheet, header, columns.values())
+            
+            date_col = columns['date']
+            investment_col = columns['investment']
+            pm_col = columns['pm']
+            wilayah_col = columns['wilayah']
+            tki_col = columns['tki']
+            tka_col = columns['tka']
+            skala_col = columns['skala']
             
             if year is None:
                 year = self.extract_year_from_filename(filename) or datetime.now().year
@@ -754,15 +770,15 @@ class ReferenceDataLoader:
                     df = df[df['_date_obj'].dt.year == year].copy()
                 
                 # Then extract month names from the filtered data
-                df['_month'] = df['_date_obj'].dt.month.map(self.MONTH_MAP)
+                df['_month'] = df['_date_obj'].dt.month.map(self.MONTH_MAP).astype(self.MONTH_DTYPE)
             else:
-                df['_month'] = 'Januari'
+                df['_month'] = pd.Series('Januari', index=df.index, dtype=self.MONTH_DTYPE)
             df = df[df['_month'].isin(NAMA_BULAN)].copy()
             
             result = ProyekReferenceData(year=year)
             
             # Filter by Kewenangan = Gubernur
-            kewenangan_col = self._find_column(df, ['kewenangan'])
+            kewenangan_col = columns['kewenangan']
             if kewenangan_col:
                 gubernur_mask = df[kewenangan_col].astype(str).str.upper().str.contains('GUBERNUR', na=False)
                 df = df[gubernur_mask].copy()
@@ -775,41 +791,61 @@ class ReferenceDataLoader:
                 df[tka_col] = pd.to_numeric(df[tka_col], errors='coerce').fillna(0)
             
             # Try to find a Project ID column for deduplication (to fix inflated labor counts)
-            id_col = self._find_column(df, ['id_proyek', 'id proyek', 'nomor_proyek', 'kode_proyek', 'nib'])
+            id_col = columns['id']
 
+            # Wilayah keys the investment, project and labor groupbys below
+            self._categorize(df, wilayah_col)
+
+            # Monthly project counts and investment/labor sums in one groupby
+            sums = {name: (col, 'sum') for name, col in (('investment', investment_col), ('tki', tki_col), ('tka', tka_col)) if col}
+            monthly = df.groupby('_month', observed=True).agg(projects=('_month', 'size'), **sums)
+            self._assign_count_by_month(result.monthly_projects, monthly['projects'])
             if investment_col:
-                for month, value in df.groupby('_month')[investment_col].sum().items():
-                    result.monthly_investment[month] = float(value)
+                result.monthly_investment.update(monthly['investment'].astype(float).to_dict())
+            if tki_col:
+                self._assign_count_by_month(result.monthly_tki, monthly['tki'])
+            if tka_col:
+                self._assign_count_by_month(result.monthly_tka, monthly['tka'])
 
-                if wilayah_col:
-                    wilayah_sums = df.groupby(['_month', wilayah_col])[investment_col].sum().reset_index(name='investment')
-                    for month, wilayah, investment in wilayah_sums.itertuples(index=False, name=None):
+            # Likewise per (month, wilayah)
+            if wilayah_col:
+                wilayah_sums = {'investment': (investment_col, 'sum')} if investment_col else {}
+                by_wilayah = df.groupby(['_month', wilayah_col], observed=True).agg(projects=('_month', 'size'), **wilayah_sums)
+                if investment_col:
+                    for (month, wilayah), investment in by_wilayah['investment'].to_dict().items():
                         result.monthly_by_wilayah.setdefault(month, {})[wilayah] = float(investment)
+                self._assign_month_nested_counts(result.monthly_projects_by_wilayah, by_wilayah['projects'])
 
             if pm_col:
-                pm_upper = df[pm_col].astype(str).str.upper()
-                pma_invest_mask = pm_upper.str.contains('PMA', na=False)
-                pmdn_mask = pm_upper.str.contains('PMDN', na=False)
-                pma_project_mask = pma_invest_mask & ~pmdn_mask
+                # PMA/PMDN flags are matched on the distinct status labels only.
+                # A label holding both (e.g. "PMA/PMDN") adds to both investment
+                # sums but is counted as a PMDN project.
+                codes, labels = pd.factorize(df[pm_col].astype(str).str.upper())
+                df['_is_pma'] = np.array([*('PMA' in label for label in labels), False])[codes]
+                df['_is_pmdn'] = np.array([*('PMDN' in label for label in labels), False])[codes]
+
+                # One groupby over (month, flags); the PM splits are read off its few rows
+                pm_groups = df.groupby(['_month', '_is_pma', '_is_pmdn'], observed=True)
+                pm_totals = pm_groups.size().to_frame('projects')
+                if investment_col:
+                    pm_totals['investment'] = pm_groups[investment_col].sum()
+                pm_totals = pm_totals.reset_index()
+                pma_totals = pm_totals[pm_totals['_is_pma']]
+                pmdn_totals = pm_totals[pm_totals['_is_pmdn']]
 
                 if investment_col:
-                    for month, value in df.loc[pma_invest_mask].groupby('_month')[investment_col].sum().items():
+                    for month, value in pma_totals.groupby('_month', observed=True)['investment'].sum().items():
                         result.monthly_pma[month] = float(value)
-                    for month, value in df.loc[pmdn_mask].groupby('_month')[investment_col].sum().items():
+                    for month, value in pmdn_totals.groupby('_month', observed=True)['investment'].sum().items():
                         result.monthly_pmdn[month] = float(value)
 
-                self._assign_count_by_month(result.monthly_pma_projects, df.loc[pma_project_mask].groupby('_month').size())
-                self._assign_count_by_month(result.monthly_pmdn_projects, df.loc[pmdn_mask].groupby('_month').size())
-
-            if tki_col:
-                self._assign_count_by_month(result.monthly_tki, df.groupby('_month')[tki_col].sum())
-            if tka_col:
-                self._assign_count_by_month(result.monthly_tka, df.groupby('_month')[tka_col].sum())
+                pma_project_totals = pma_totals[~pma_totals['_is_pmdn']]
+                self._assign_count_by_month(result.monthly_pma_projects, pma_project_totals.groupby('_month', observed=True)['projects'].sum())
+                self._assign_count_by_month(result.monthly_pmdn_projects, pmdn_totals.groupby('_month', observed=True)['projects'].sum())
 
-            self._assign_count_by_month(result.monthly_projects, df.groupby('_month').size())
 
             if skala_col:
-                skala_counts = df.groupby(['_month', skala_col]).size()
+                skala_counts = df.groupby(['_month', skala_col], observed=True).size()
                 self._assign_month_nested_counts(result.monthly_by_skala_usaha, skala_counts)
 
             if wilayah_col and (tki_col or tka_col):
@@ -817,7 +853,7 @@ class ReferenceDataLoader:
                     dedup_cols = ['_month', wilayah_col, id_col]
                 else:
                     dedup_cols = ['_month', wilayah_col]
-                    name_col = self._find_column(df, ['nama_perusahaan', 'nama perusahaan', 'nama_perseroan', 'pelaku_usaha'])
+                    name_col = columns['name']
                     if name_col:
                         dedup_cols.append(name_col)
                     if investment_col:
@@ -830,28 +866,82 @@ class ReferenceDataLoader:
                 if tka_col:
                     calc_df['_labor_total'] += calc_df[tka_col]
 
-                labor_sums = calc_df.groupby(['_month', wilayah_col])['_labor_total'].sum().reset_index(name='labor')
+                labor_sums = calc_df.groupby(['_month', wilayah_col], observed=True)['_labor_total'].sum().reset_index(name='labor')
                 for month, wilayah, labor in labor_sums.itertuples(index=False, name=None):
                     result.monthly_labor_by_wilayah.setdefault(month, {})[wilayah] = int(labor)
-
-            if wilayah_col:
-                project_counts = df.groupby(['_month', wilayah_col]).size()
-                self._assign_month_nested_counts(result.monthly_projects_by_wilayah, project_counts)
             
+            if cache_key is not None:
+                self.data_cache[cache_key] = result
             return result
             
         except Exception as e:
             print(f"Error loading PROYEK file: {e}")
             return None
     
+    def _categorize(self, df: pd.DataFrame, *columns: Optional[str]) -> None:
+        """Store found grouping columns as category (group with observed=True)."""
+        for col in columns:
+            if col:
+                df[col] = df[col].astype('category')
+    
+    def _read_header(self, xl: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
+        """Read only the header row of a sheet, with normalized column names."""
+        header = pd.read_excel(xl, sheet_name=sheet_name, nrows=0)
+        header.columns = [str(c).strip().lower() for c in header.columns]
+        return header
+    
+    def _read_columns(self, xl: pd.ExcelFile, sheet_name: str, header: pd.DataFrame, columns) -> pd.DataFrame:
+        """
+        Read the given header columns of a sheet, with normalized column names.
+        
+        Falls back to the whole sheet when no column was found, so row
+        counts still come from the data.
+        """
+        wanted = {col for col in columns if col}
+        usecols = [i for i, col in enumerate(header.columns) if col in wanted] or None
+        df = pd.read_excel(xl, sheet_name=sheet_name, usecols=usecols)
+        df.columns = [str(c).strip().lower() for c in df.columns]
+        return df
+    
+    def _find_columns(self, df: pd.DataFrame, column_patterns: Dict[str, List[str]]) -> Dict[str, Optional[str]]:
+        """Find the column for each pattern list of a loader, lower-casing the names once."""
+        names = [(col, str(col).lower()) for col in df.columns]
+        return {key: self._match_column(names, patterns) for key, patterns in column_patterns.items()}
+    
+    def _kewenangan_columns(self, df: pd.DataFrame) -> Tuple[Optional[str], Optional[str]]:
+        """Find the (uraian_kewenangan, kewenangan) columns of a PB OSS sheet."""
+        # Strict detection first
+        uraian_kewenangan_col = self._find_exact_column(df, 'uraian_kewenangan')
+        kewenangan_col = self._find_exact_column(df, 'kewenangan')
+        
+        # Fallback to fuzzy search if exact match not found
+        if not kewenangan_col or not uraian_kewenangan_col:
+            for col in df.columns:
+                col_lower = str(col).lower().strip()
+                if not uraian_kewenangan_col and col_lower == 'uraian_kewenangan':
+                    uraian_kewenangan_col = col
+                elif not kewenangan_col and 'kewenangan' in col_lower and 'uraian' not in col_lower:
+                    kewenangan_col = col
+        return uraian_kewenangan_col, kewenangan_col
+    
     def _find_column(self, df: pd.DataFrame, patterns: List[str]) -> Optional[str]:
         """Find column matching any of the patterns."""
-        for col in df.columns:
-            col_lower = str(col).lower()
-            for pattern in patterns:
-                if pattern.lower() in col_lower:
-                    return col
-        return None
+        return self._match_column([(col, str(col).lower()) for col in df.columns], patterns)
+    
+    def _match_column(self, names: List[Tuple[Any, str]], patterns: List[str]) -> Optional[str]:
+        """First column whose lower-cased name contains any of the patterns."""
+        matcher = self._column_matcher(tuple(patterns))
+        return next((col for col, col_lower in names if matcher.search(col_lower)), None)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _column_matcher(patterns: Tuple[str, ...]) -> re.Pattern:
+        """
+        One compiled alternation of plain-substring patterns.
+        
+        Memoized per pattern list, which are the loaders' fixed class tables.
+        """
+        return re.compile('|'.join(re.escape(pattern.lower()) for pattern in patterns))
     
     def _find_exact_column(self, df: pd.DataFrame, column_name: str) -> Optional[str]:
         """Find column with exact name match (case-insensitive)."""
@@ -863,12 +953,12 @@ class ReferenceDataLoader:
     def get_months_for_period(self, period_type: str, period: str) -> List[str]:
         """Get list of months for a given period."""
         if period_type == "Tahunan":
-            return NAMA_BULAN
+            return list(NAMA_BULAN)
         elif period_type == "Triwulan":
-            return TRIWULAN_KE_BULAN.get(period, [])
+            return list(TRIWULAN_KE_BULAN.get(period, ()))
         elif period_type == "Semester":
             if period == "Semester I":
-                return NAMA_BULAN[:6]
+                return list(NAMA_BULAN[:6])
             else:
-                return NAMA_BULAN[6:]
-        return NAMA_BULAN
+                return list(NAMA_BULAN[6:])
+        return list(NAMA_BULAN)
@@ -1,5 +1,14 @@
 # Export module for DPMPTSP Reporting System
-from .pdf_exporter import EnhancedPDFExporter as PDFExporter
-from .docx_exporter import WordExporter
-
+# Exporters are imported on first access so a Word export does not load
+# ReportLab and a PDF export does not load python-docx.
 __all__ = ["PDFExporter", "WordExporter"]
+
+
+def __getattr__(name):
+    if name == "PDFExporter":
+        from .pdf_exporter import EnhancedPDFExporter as PDFExporter
+        return PDFExporter
+    if name == "WordExporter":
+        from .docx_exporter import WordExporter
+        return WordExporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
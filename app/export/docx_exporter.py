@@ -8,10 +8,14 @@ using python-docx library.
 import io
 import html
 import re
+import zipfile
+from xml.sax.saxutils import escape
 from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
 
+from app.config import NAMA_BULAN
+
 # Try to import Word generation library
 try:
     from docx import Document
@@ -19,11 +23,51 @@ try:
     from docx.enum.text import WD_ALIGN_PARAGRAPH
     from docx.enum.table import WD_TABLE_ALIGNMENT
     from docx.enum.style import WD_STYLE_TYPE
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
+    from docx.oxml.ns import nsdecls
+    from docx.oxml import OxmlElement, parse_xml
+    from docx.oxml.shape import CT_Inline
+    from docx.opc.pkgwriter import PackageWriter
     DOCX_AVAILABLE = True
+    # Font sizes used by the helpers below; Length values are immutable ints
+    _PT_10, _PT_11, _PT_12, _PT_14, _PT_16, _PT_24, _PT_36 = (Pt(10), Pt(11), Pt(12), Pt(14), Pt(16), Pt(24), Pt(36))
+    _DOCX_COLORS = {
+        'primary': RGBColor(30, 58, 95),
+        'secondary': RGBColor(61, 126, 166),
+        'white': RGBColor(255, 255, 255),
+    }
 except ImportError:
     DOCX_AVAILABLE = False
+    # export_report raises before any color is read
+    _DOCX_COLORS = {}
+
+# Indonesian thousands separator: 1,234 -> 1.234 in one translate pass
+_COMMA_TO_DOT = str.maketrans(',', '.')
+
+# Table run text: tabs and line breaks become their own elements, as in
+# python-docx's Run.text setter
+_RUN_BREAKS = re.compile(r'([\t\n\r])')
+
+# Private PackageWriter steps _save_document repeats from PackageWriter.write
+_PACKAGE_WRITER_STEPS = ('_write_content_types_stream', '_write_pkg_rels', '_write_parts')
+
+
+class _DocxZipWriter:
+    """
+    Physical package writer for PackageWriter: XML parts are deflated,
+    images are stored as-is since PNG/JPEG data is already compressed.
+    """
+    
+    _STORED_EXTS = frozenset(('png', 'jpg', 'jpeg', 'gif'))
+    
+    def __init__(self, stream):
+        self._zipf = zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED)
+    
+    def write(self, pack_uri, blob):
+        compress_type = zipfile.ZIP_STORED if pack_uri.ext in self._STORED_EXTS else zipfile.ZIP_DEFLATED
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=compress_type)
+    
+    def close(self):
+        self._zipf.close()
 
 
 class WordExporter:
@@ -37,15 +81,71 @@ class WordExporter:
     - Narrative sections with formatting
     """
     
-    # Color scheme (RGB tuples)
-    COLORS = {
-        'primary': RGBColor(30, 58, 95) if DOCX_AVAILABLE else None,
-        'secondary': RGBColor(61, 126, 166) if DOCX_AVAILABLE else None,
-        'white': RGBColor(255, 255, 255) if DOCX_AVAILABLE else None,
-    }
+    # Color scheme (RGBColor values; empty without python-docx)
+    COLORS = _DOCX_COLORS
+    
+    # Subsections of sections 2 and 3, in order: (title, (chart key, width)
+    # before the narrative, narrative attribute, (chart key, width) after it,
+    # trigger chart keys). A subsection is added when one of its trigger
+    # charts is present; without explicit triggers, when any of its charts
+    # or its narrative is.
+    _PROYEK_SUBSECTIONS = (
+        ("2.1 Rekapitulasi Data Proyek Berdasarkan Periode dan Kabupaten/Kota",
+         (('proyek_monthly', 5), ('proyek_kab_kota', 5.5), ('proyek_total_yoy', 4.5), ('proyek_total_qoq', 4.5)),
+         'proyek_rekapitulasi', (), None),
+        ("2.2 Rekapitulasi Proyek Berdasarkan Status Penanaman Modal",
+         (('proyek_pm', 4), ('proyek_pm_yoy', 4), ('proyek_pm_qoq', 4)),
+         'proyek_status_pm', (), None),
+        ("2.3 Proyek Berdasarkan Skala Usaha",
+         (('skala_usaha', 5), ('skala_usaha_yoy', 5), ('skala_usaha_qoq', 5)),
+         'proyek_skala_usaha', (), None),
+        ("2.4 Investasi per Kabupaten/Kota",
+         (('inv_wilayah', 5),), 'investasi_wilayah', (('inv_table', 6),), ('inv_wilayah',)),
+        ("2.5 Penyerapan Tenaga Kerja",
+         (('inv_labor', 5),), 'investasi_tenaga_kerja', (), ('inv_labor',)),
+    )
+    _PB_SUBSECTIONS = (
+        ("3.1 Rekapitulasi Berdasarkan Periode dan Lokasi Usaha di Kabupaten/Kota",
+         (('pb_monthly', 5), ('pb_kab_kota', 5.5), ('pb_total_yoy', 4.5), ('pb_total_qoq', 4.5)),
+         'pb_periode_lokasi', (('pb_kab_table', 6),), None),
+        ("3.2 Rekapitulasi Berdasarkan Status Penanaman Modal",
+         (('pb_pm_monthly', 5), ('pb_pm', 4), ('pb_pm_yoy', 4), ('pb_pm_qoq', 4)),
+         'pb_status_pm', (('pb_pm_table', 6),), None),
+        ("3.3 Rekapitulasi Berdasarkan Tingkat Risiko",
+         (('pb_risk', 5), ('pb_risk_yoy', 4.5), ('pb_risk_qoq', 4.5)),
+         'pb_risiko', (('pb_risk_table', 6),), None),
+        ("3.4 Top 10 Sektor Perizinan",
+         (('pb_sector', 5),), 'pb_sektor', (('pb_sector_table', 6),), None),
+        ("3.5 Rekapitulasi Jenis Perizinan",
+         (('pb_jenis', 5),), 'pb_jenis', (('pb_jenis_table', 6),), None),
+        ("3.6 Rekapitulasi Status Respon",
+         (('pb_status_respon', 5),), 'pb_status_respon', (('pb_status_respon_table', 6),), None),
+        ("3.7 Rekapitulasi Kewenangan",
+         (('pb_kewenangan', 5),), 'pb_kewenangan', (('pb_kewenangan_table', 6),), None),
+    )
+    
+    # Column alignment of the top-locations table; Kabupaten/Kota left-aligned
+    _DATA_TABLE_ALIGN = ('center', 'left', 'center', 'center')
+    
+    # (label, sektor_risiko key) pairs for the sektor & risiko narrative
+    _RISK_KEYS = (
+        ('Rendah', 'risiko_rendah'),
+        ('Menengah Rendah', 'risiko_menengah_rendah'),
+        ('Menengah Tinggi', 'risiko_menengah_tinggi'),
+        ('Tinggi', 'risiko_tinggi'),
+    )
+    _SECTOR_KEYS = (
+        ('Perindustrian', 'sektor_perindustrian'),
+        ('Kelautan & Perikanan', 'sektor_kelautan'),
+        ('Pertanian', 'sektor_pertanian'),
+    )
+    
+    # Saved blank document with styles and margins (see _template_bytes)
+    _TEMPLATE_BYTES: Optional[bytes] = None
     
     def __init__(self, logo_path: Optional[Path] = None):
         self.logo_path = logo_path
+        self._chart_images = {}
     
     def is_available(self) -> bool:
         """Check if Word export is available."""
@@ -75,26 +175,18 @@ class WordExporter:
         if not DOCX_AVAILABLE:
             raise ImportError("python-docx is not installed. Please install it with: pip install python-docx")
         
-        # Create document
-        doc = Document()
-        
-        # Set up document styles
-        self._setup_styles(doc)
-        
-        # Set page margins
-        for section in doc.sections:
-            section.top_margin = Cm(2)
-            section.bottom_margin = Cm(2)
-            section.left_margin = Cm(2)
-            section.right_margin = Cm(2)
+        # Create document from the styled, margin-set template
+        doc = Document(io.BytesIO(self._template_bytes()))
+        # Chart PNG bytes -> (rId, Image) of its image part in this document
+        self._chart_images = {}
         
         # 1. Cover Page
         self._add_cover_page(doc, report)
-        doc.add_page_break()
+        self._add_page_break(doc)
         
         # 2. Table of Contents
         self._add_table_of_contents(doc)
-        doc.add_page_break()
+        self._add_page_break(doc)
         
         # Add metrics summary table
         self._add_metrics_table(doc, stats)
@@ -130,7 +222,7 @@ class WordExporter:
         self._add_data_table(doc, stats)
         
         # Section 4: Status PM
-        doc.add_page_break()
+        self._add_page_break(doc)
         self._add_section_title(doc, "1.3 Status Penanaman Modal")
         
         if 'pm' in charts:
@@ -172,172 +264,31 @@ class WordExporter:
             self._add_paragraph(doc, sektor_narrative)
         
         # ============== SECTION 2: INVESTASI/PROYEK ==============
-        doc.add_page_break()
+        self._add_page_break(doc)
         self._add_section_title(doc, "2. Rekapitulasi Data Investasi dan Proyek")
         
-        # 2.1 Rekapitulasi proyek berdasarkan periode dan lokasi
-        if any(k in charts for k in ['proyek_monthly', 'proyek_kab_kota', 'proyek_total_yoy', 'proyek_total_qoq']) or getattr(narratives, 'proyek_rekapitulasi', ''):
-            self._add_subsection_title(doc, "2.1 Rekapitulasi Data Proyek Berdasarkan Periode dan Kabupaten/Kota")
-            if 'proyek_monthly' in charts:
-                self._add_chart_image(doc, charts['proyek_monthly'], width=5)
-            if 'proyek_kab_kota' in charts:
-                self._add_chart_image(doc, charts['proyek_kab_kota'], width=5.5)
-            if 'proyek_total_yoy' in charts:
-                self._add_chart_image(doc, charts['proyek_total_yoy'], width=4.5)
-            if 'proyek_total_qoq' in charts:
-                self._add_chart_image(doc, charts['proyek_total_qoq'], width=4.5)
-            if getattr(narratives, 'proyek_rekapitulasi', ''):
-                self._add_paragraph(doc, narratives.proyek_rekapitulasi)
-
-        # 2.2 PMA/PMDN Proyek
-        if any(k in charts for k in ['proyek_pm', 'proyek_pm_yoy', 'proyek_pm_qoq']) or getattr(narratives, 'proyek_status_pm', ''):
-            self._add_subsection_title(doc, "2.2 Rekapitulasi Proyek Berdasarkan Status Penanaman Modal")
-            if 'proyek_pm' in charts:
-                self._add_chart_image(doc, charts['proyek_pm'], width=4)
-            
-            if 'proyek_pm_yoy' in charts:
-                self._add_chart_image(doc, charts['proyek_pm_yoy'], width=4)
-            
-            if 'proyek_pm_qoq' in charts:
-                self._add_chart_image(doc, charts['proyek_pm_qoq'], width=4)
-            if getattr(narratives, 'proyek_status_pm', ''):
-                self._add_paragraph(doc, narratives.proyek_status_pm)
-        
-        # 2.3 Skala Usaha
-        if any(k in charts for k in ['skala_usaha', 'skala_usaha_yoy', 'skala_usaha_qoq']) or getattr(narratives, 'proyek_skala_usaha', ''):
-            self._add_subsection_title(doc, "2.3 Proyek Berdasarkan Skala Usaha")
-            if 'skala_usaha' in charts:
-                self._add_chart_image(doc, charts['skala_usaha'], width=5)
-            
-            if 'skala_usaha_yoy' in charts:
-                self._add_chart_image(doc, charts['skala_usaha_yoy'], width=5)
-            
-            if 'skala_usaha_qoq' in charts:
-                self._add_chart_image(doc, charts['skala_usaha_qoq'], width=5)
-            if getattr(narratives, 'proyek_skala_usaha', ''):
-                self._add_paragraph(doc, narratives.proyek_skala_usaha)
-        
-        # 2.4 Investasi per Wilayah
-        if 'inv_wilayah' in charts:
-            self._add_subsection_title(doc, "2.4 Investasi per Kabupaten/Kota")
-            self._add_chart_image(doc, charts['inv_wilayah'], width=5)
-            if hasattr(narratives, 'investasi_wilayah') and narratives.investasi_wilayah:
-                self._add_paragraph(doc, narratives.investasi_wilayah)
-
-            if 'inv_table' in charts:
-                self._add_chart_image(doc, charts['inv_table'], width=6)
-
-        # 2.5 Tenaga Kerja
-        if 'inv_labor' in charts:
-            self._add_subsection_title(doc, "2.5 Penyerapan Tenaga Kerja")
-            self._add_chart_image(doc, charts['inv_labor'], width=5)
-            if hasattr(narratives, 'investasi_tenaga_kerja') and narratives.investasi_tenaga_kerja:
-                self._add_paragraph(doc, narratives.investasi_tenaga_kerja)
+        for subsection in self._PROYEK_SUBSECTIONS:
+            self._add_planned_subsection(doc, charts, narratives, *subsection)
         
         # ============== SECTION 3: PERIZINAN BERUSAHA ==============
-        doc.add_page_break()
+        self._add_page_break(doc)
         self._add_section_title(doc, "3. Perizinan Berusaha Berbasis Risiko")
         
-        # 3.1 Kab/Kota PB
-        if any(k in charts for k in ['pb_monthly', 'pb_kab_kota', 'pb_total_yoy', 'pb_total_qoq', 'pb_kab_table']) or getattr(narratives, 'pb_periode_lokasi', ''):
-            self._add_subsection_title(doc, "3.1 Rekapitulasi Berdasarkan Periode dan Lokasi Usaha di Kabupaten/Kota")
-            if 'pb_monthly' in charts:
-                self._add_chart_image(doc, charts['pb_monthly'], width=5)
-            if 'pb_kab_kota' in charts:
-                self._add_chart_image(doc, charts['pb_kab_kota'], width=5.5)
-            if 'pb_total_yoy' in charts:
-                self._add_chart_image(doc, charts['pb_total_yoy'], width=4.5)
-            if 'pb_total_qoq' in charts:
-                self._add_chart_image(doc, charts['pb_total_qoq'], width=4.5)
-            if getattr(narratives, 'pb_periode_lokasi', ''):
-                self._add_paragraph(doc, narratives.pb_periode_lokasi)
-            if 'pb_kab_table' in charts:
-                self._add_chart_image(doc, charts['pb_kab_table'], width=6)
-        
-        # 3.2 Status PM PB
-        if any(k in charts for k in ['pb_pm_monthly', 'pb_pm', 'pb_pm_yoy', 'pb_pm_qoq', 'pb_pm_table']) or getattr(narratives, 'pb_status_pm', ''):
-            self._add_subsection_title(doc, "3.2 Rekapitulasi Berdasarkan Status Penanaman Modal")
-            if 'pb_pm_monthly' in charts:
-                self._add_chart_image(doc, charts['pb_pm_monthly'], width=5)
-            if 'pb_pm' in charts:
-                self._add_chart_image(doc, charts['pb_pm'], width=4)
-            
-            if 'pb_pm_yoy' in charts:
-                self._add_chart_image(doc, charts['pb_pm_yoy'], width=4)
-            
-            if 'pb_pm_qoq' in charts:
-                self._add_chart_image(doc, charts['pb_pm_qoq'], width=4)
-            if getattr(narratives, 'pb_status_pm', ''):
-                self._add_paragraph(doc, narratives.pb_status_pm)
-            if 'pb_pm_table' in charts:
-                self._add_chart_image(doc, charts['pb_pm_table'], width=6)
-        
-        # 3.3 Risk Level PB
-        if any(k in charts for k in ['pb_risk', 'pb_risk_yoy', 'pb_risk_qoq', 'pb_risk_table']) or getattr(narratives, 'pb_risiko', ''):
-            self._add_subsection_title(doc, "3.3 Rekapitulasi Berdasarkan Tingkat Risiko")
-            if 'pb_risk' in charts:
-                self._add_chart_image(doc, charts['pb_risk'], width=5)
-            if 'pb_risk_yoy' in charts:
-                self._add_chart_image(doc, charts['pb_risk_yoy'], width=4.5)
-            if 'pb_risk_qoq' in charts:
-                self._add_chart_image(doc, charts['pb_risk_qoq'], width=4.5)
-            if getattr(narratives, 'pb_risiko', ''):
-                self._add_paragraph(doc, narratives.pb_risiko)
-            if 'pb_risk_table' in charts:
-                self._add_chart_image(doc, charts['pb_risk_table'], width=6)
-        
-        # 3.4 Sector PB
-        if any(k in charts for k in ['pb_sector', 'pb_sector_table']) or getattr(narratives, 'pb_sektor', ''):
-            self._add_subsection_title(doc, "3.4 Top 10 Sektor Perizinan")
-            if 'pb_sector' in charts:
-                self._add_chart_image(doc, charts['pb_sector'], width=5)
-            if hasattr(narratives, 'pb_sektor') and narratives.pb_sektor:
-                self._add_paragraph(doc, narratives.pb_sektor)
-            if 'pb_sector_table' in charts:
-                self._add_chart_image(doc, charts['pb_sector_table'], width=6)
-
-        # 3.5 Jenis Perizinan
-        if any(k in charts for k in ['pb_jenis', 'pb_jenis_table']) or getattr(narratives, 'pb_jenis', ''):
-            self._add_subsection_title(doc, "3.5 Rekapitulasi Jenis Perizinan")
-            if 'pb_jenis' in charts:
-                self._add_chart_image(doc, charts['pb_jenis'], width=5)
-            if hasattr(narratives, 'pb_jenis') and narratives.pb_jenis:
-                self._add_paragraph(doc, narratives.pb_jenis)
-            if 'pb_jenis_table' in charts:
-                self._add_chart_image(doc, charts['pb_jenis_table'], width=6)
-
-        # 3.6 Status Respon
-        if any(k in charts for k in ['pb_status_respon', 'pb_status_respon_table']) or getattr(narratives, 'pb_status_respon', ''):
-            self._add_subsection_title(doc, "3.6 Rekapitulasi Status Respon")
-            if 'pb_status_respon' in charts:
-                self._add_chart_image(doc, charts['pb_status_respon'], width=5)
-            if hasattr(narratives, 'pb_status_respon') and narratives.pb_status_respon:
-                self._add_paragraph(doc, narratives.pb_status_respon)
-            if 'pb_status_respon_table' in charts:
-                self._add_chart_image(doc, charts['pb_status_respon_table'], width=6)
-
-        # 3.7 Kewenangan
-        if any(k in charts for k in ['pb_kewenangan', 'pb_kewenangan_table']) or getattr(narratives, 'pb_kewenangan', ''):
-            self._add_subsection_title(doc, "3.7 Rekapitulasi Kewenangan")
-            if 'pb_kewenangan' in charts:
-                self._add_chart_image(doc, charts['pb_kewenangan'], width=5)
-            if hasattr(narratives, 'pb_kewenangan') and narratives.pb_kewenangan:
-                self._add_paragraph(doc, narratives.pb_kewenangan)
-            if 'pb_kewenangan_table' in charts:
-                self._add_chart_image(doc, charts['pb_kewenangan_table'], width=6)
+        for subsection in self._PB_SUBSECTIONS:
+            self._add_planned_subsection(doc, charts, narratives, *subsection)
         
         # Section 7: Kesimpulan
-        doc.add_page_break()
+        self._add_page_break(doc)
         self._add_section_title(doc, "Kesimpulan")
         self._add_paragraph(doc, narratives.kesimpulan)
         
         # 8. Closing Page
-        doc.add_page_break()
+        self._add_page_break(doc)
         self._add_closing_page(doc)
         
         # Save to buffer
         buffer = io.BytesIO()
-        doc.save(buffer)
+        self._save_document(doc, buffer)
         docx_bytes = buffer.getvalue()
         buffer.close()
         
@@ -348,6 +299,27 @@ class WordExporter:
         
         return docx_bytes
     
+    def _add_planned_subsection(self, doc, charts: Dict[str, bytes], narratives, title: str,
+                                before, narrative_attr: str, after, triggers):
+        """Add one subsection from a section plan (see _PROYEK_SUBSECTIONS)."""
+        narrative = getattr(narratives, narrative_attr, '')
+        if triggers is None:
+            present = narrative or any(key in charts for key, _ in (*before, *after))
+        else:
+            present = any(key in charts for key in triggers)
+        if not present:
+            return
+        
+        self._add_subsection_title(doc, title)
+        for key, width in before:
+            if key in charts:
+                self._add_chart_image(doc, charts[key], width=width)
+        if narrative:
+            self._add_paragraph(doc, narrative)
+        for key, width in after:
+            if key in charts:
+                self._add_chart_image(doc, charts[key], width=width)
+    
     def _add_cover_page(self, doc, report):
         """Add cover page with logo, title, and metadata."""
         # Add logo if available
@@ -362,15 +334,14 @@ class WordExporter:
                 pass
         
         # Add spacer
-        for _ in range(3):
-            doc.add_paragraph()
+        self._add_blank_paragraphs(doc, 3)
         
         # Main title
         title = doc.add_paragraph()
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = title.add_run("LAPORAN REKAPITULASI\nDATA NOMOR INDUK BERUSAHA (NIB)")
         run.bold = True
-        run.font.size = Pt(24)
+        run.font.size = _PT_24
         run.font.color.rgb = self.COLORS['primary']
         
         doc.add_paragraph()
@@ -380,18 +351,18 @@ class WordExporter:
         subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = subtitle.add_run(f"PERIODE {report.period_name} TAHUN {report.year}")
         run.bold = True
-        run.font.size = Pt(16)
+        run.font.size = _PT_16
         run.font.color.rgb = self.COLORS['secondary']
         
         # Add spacer
-        for _ in range(5):
-            doc.add_paragraph()
+        self._add_blank_paragraphs(doc, 5)
         
-        # Metadata table
+        # Metadata table; Indonesian month names without going through the locale
+        today = datetime.now()
         metadata = [
             ("Tim Pengolah Data", "DPMPTSP Provinsi Lampung"),
             ("Sumber Data", "OSS-RBA (Online Single Submission)"),
-            ("Tanggal Penarikan Data", datetime.now().strftime("%d %B %Y")),
+            ("Tanggal Penarikan Data", f"{today.day:02d} {NAMA_BULAN[today.month - 1]} {today.year}"),
         ]
         
         for label, value in metadata:
@@ -399,9 +370,9 @@ class WordExporter:
             p.alignment = WD_ALIGN_PARAGRAPH.CENTER
             run1 = p.add_run(f"{label}: ")
             run1.bold = True
-            run1.font.size = Pt(11)
+            run1.font.size = _PT_11
             run2 = p.add_run(value)
-            run2.font.size = Pt(11)
+            run2.font.size = _PT_11
     
     def _add_table_of_contents(self, doc):
         """Add table of contents page."""
@@ -409,7 +380,7 @@ class WordExporter:
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = title.add_run("DAFTAR ISI")
         run.bold = True
-        run.font.size = Pt(16)
+        run.font.size = _PT_16
         run.font.color.rgb = self.COLORS['primary']
         
         doc.add_paragraph()
@@ -441,24 +412,22 @@ class WordExporter:
         for item in toc_items:
             p = doc.add_paragraph()
             run = p.add_run(item)
-            run.font.size = Pt(12)
+            run.font.size = _PT_12
     
     def _add_closing_page(self, doc):
         """Add closing page with thank you message and contact info."""
         # Spacer
-        for _ in range(6):
-            doc.add_paragraph()
+        self._add_blank_paragraphs(doc, 6)
         
         # Thank you message
         p = doc.add_paragraph()
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = p.add_run("TERIMA KASIH")
         run.bold = True
-        run.font.size = Pt(36)
+        run.font.size = _PT_36
         run.font.color.rgb = self.COLORS['primary']
         
-        doc.add_paragraph()
-        doc.add_paragraph()
+        self._add_blank_paragraphs(doc, 2)
         
         # Add logo if available
         if self.logo_path and self.logo_path.exists():
@@ -485,34 +454,20 @@ class WordExporter:
             p = doc.add_paragraph()
             p.alignment = WD_ALIGN_PARAGRAPH.CENTER
             run = p.add_run(line)
-            run.font.size = Pt(10)
+            run.font.size = _PT_10
     
     def _generate_sektor_risiko_narrative(self, sektor_risiko_data: dict) -> str:
         """Generate narrative for Sektor & Risiko section."""
-        total_risiko = (
-            sektor_risiko_data.get('risiko_rendah', 0) +
-            sektor_risiko_data.get('risiko_menengah_rendah', 0) +
-            sektor_risiko_data.get('risiko_menengah_tinggi', 0) +
-            sektor_risiko_data.get('risiko_tinggi', 0)
-        )
+        risk_levels = {label: sektor_risiko_data.get(key, 0) for label, key in self._RISK_KEYS}
+        total_risiko = sum(risk_levels.values())
         
         if total_risiko == 0:
             return "Data perizinan berdasarkan risiko belum tersedia."
         
-        risk_levels = {
-            'Rendah': sektor_risiko_data.get('risiko_rendah', 0),
-            'Menengah Rendah': sektor_risiko_data.get('risiko_menengah_rendah', 0),
-            'Menengah Tinggi': sektor_risiko_data.get('risiko_menengah_tinggi', 0),
-            'Tinggi': sektor_risiko_data.get('risiko_tinggi', 0),
-        }
         dominant_risk = max(risk_levels, key=risk_levels.get)
-        dominant_pct = (risk_levels[dominant_risk] / total_risiko * 100) if total_risiko > 0 else 0
+        dominant_pct = risk_levels[dominant_risk] / total_risiko * 100
         
-        sectors = {
-            'Perindustrian': sektor_risiko_data.get('sektor_perindustrian', 0),
-            'Kelautan & Perikanan': sektor_risiko_data.get('sektor_kelautan', 0),
-            'Pertanian': sektor_risiko_data.get('sektor_pertanian', 0),
-        }
+        sectors = {label: sektor_risiko_data.get(key, 0) for label, key in self._SECTOR_KEYS}
         sectors_filtered = {k: v for k, v in sectors.items() if v > 0}
         
         if sectors_filtered:
@@ -521,16 +476,67 @@ class WordExporter:
         else:
             sector_text = ""
         
-        narrative = f'Berdasarkan tingkat risiko, perizinan dengan kategori "{dominant_risk}" mendominasi dengan {risk_levels[dominant_risk]:,} perizinan ({dominant_pct:.1f}%). {sector_text}'
+        dominant_count = format(risk_levels[dominant_risk], ',').translate(_COMMA_TO_DOT)
+        return f'Berdasarkan tingkat risiko, perizinan dengan kategori "{dominant_risk}" mendominasi dengan {dominant_count} perizinan ({dominant_pct:.1f}%). {sector_text}'
+    
+    @staticmethod
+    def _save_document(doc, stream):
+        """
+        Save doc like doc.save(stream), without re-deflating embedded images.
         
-        return narrative.replace(',', '.')
+        Uses python-docx's private PackageWriter steps; if a python-docx
+        release renames or changes them, falls back to a plain doc.save.
+        """
+        if not all(hasattr(PackageWriter, step) for step in _PACKAGE_WRITER_STEPS):
+            doc.save(stream)
+            return
+        package = doc.part.package
+        parts = package.parts
+        # Written to a private buffer so a failed attempt leaves stream untouched
+        buffer = io.BytesIO()
+        for part in parts:
+            part.before_marshal()
+        writer = _DocxZipWriter(buffer)
+        try:
+            PackageWriter._write_content_types_stream(writer, parts)
+            PackageWriter._write_pkg_rels(writer, package.rels)
+            PackageWriter._write_parts(writer, parts)
+        except (AttributeError, TypeError):
+            writer.close()  # finish the discarded partial archive
+            doc.save(stream)
+            return
+        writer.close()
+        stream.write(buffer.getvalue())
     
-    def _setup_styles(self, doc):
+    @classmethod
+    def _template_bytes(cls) -> bytes:
+        """
+        Blank document with styles and page margins applied, saved once per
+        process; every export opens a copy instead of redoing the setup.
+        """
+        if cls._TEMPLATE_BYTES is None:
+            doc = Document()
+            cls._setup_styles(doc)
+            
+            # Set page margins
+            for section in doc.sections:
+                section.top_margin = Cm(2)
+                section.bottom_margin = Cm(2)
+                section.left_margin = Cm(2)
+                section.right_margin = Cm(2)
+            
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            cls._TEMPLATE_BYTES = buffer.getvalue()
+        return cls._TEMPLATE_BYTES
+    
+    @staticmethod
+    def _setup_styles(doc):
         """Setup document styles."""
         # Modify Normal style
         style = doc.styles['Normal']
         style.font.name = 'Arial'
-        style.font.size = Pt(11)
+        style.font.size = _PT_11
     
     def _add_header(self, doc, report):
         """Add header with logo and title."""
@@ -550,14 +556,14 @@ class WordExporter:
         
         run = title.add_run("LAPORAN REKAPITULASI DATA NIB")
         run.bold = True
-        run.font.size = Pt(16)
+        run.font.size = _PT_16
         run.font.color.rgb = self.COLORS['primary']
         
         title.add_run("\n")
         
         run2 = title.add_run(f"PERIODE {report.period_name} TAHUN {report.year}")
         run2.bold = True
-        run2.font.size = Pt(14)
+        run2.font.size = _PT_14
         run2.font.color.rgb = self.COLORS['primary']
         
         doc.add_paragraph()  # Spacer
@@ -568,74 +574,111 @@ class WordExporter:
         pm_dist = stats.get('pm_distribution', {})
         pelaku = stats.get('pelaku_usaha_distribution', {})
         
-        table = doc.add_table(rows=2, cols=4)
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        
-        # Header row
+        # Header and value rows
         headers = ['Total NIB', 'PMDN', 'PMA', 'UMK']
         values = [
-            f"{total_nib:,}".replace(',', '.'),
-            f"{pm_dist.get('PMDN', 0):,}".replace(',', '.'),
-            f"{pm_dist.get('PMA', 0):,}".replace(',', '.'),
-            f"{pelaku.get('UMK', 0):,}".replace(',', '.')
+            format(total_nib, ',').translate(_COMMA_TO_DOT),
+            format(pm_dist.get('PMDN', 0), ',').translate(_COMMA_TO_DOT),
+            format(pm_dist.get('PMA', 0), ',').translate(_COMMA_TO_DOT),
+            format(pelaku.get('UMK', 0), ',').translate(_COMMA_TO_DOT)
         ]
         
-        for i, header in enumerate(headers):
-            cell = table.rows[0].cells[i]
-            cell.text = header
-            self._set_cell_shading(cell, "1e3a5f")
-            for paragraph in cell.paragraphs:
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                for run in paragraph.runs:
-                    run.bold = True
-                    run.font.color.rgb = self.COLORS['white']
-        
-        for i, value in enumerate(values):
-            cell = table.rows[1].cells[i]
-            cell.text = value
-            self._set_cell_shading(cell, "f8f9fa")
-            for paragraph in cell.paragraphs:
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                for run in paragraph.runs:
-                    run.font.size = Pt(12)
+        table = self._add_table(doc, cols=4)
+        self._append_table_row(table, [(header, "1e3a5f", 'center', True, None) for header in headers])
+        self._append_table_row(table, [(value, "f8f9fa", 'center', False, 24) for value in values])
         
         doc.add_paragraph()  # Spacer
     
-    def _set_cell_shading(self, cell, color: str):
-        """Set cell background color."""
-        shading_elm = OxmlElement('w:shd')
-        shading_elm.set(qn('w:fill'), color)
-        cell._tc.get_or_add_tcPr().append(shading_elm)
+    def _add_table(self, doc, cols: int):
+        """Add an empty centered table; rows are appended with _append_table_row."""
+        table = doc.add_table(rows=0, cols=cols)
+        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        return table
     
-    def _add_section_title(self, doc, text: str):
-        """Add a section title."""
-        paragraph = doc.add_paragraph()
-        run = paragraph.add_run(text)
-        run.bold = True
-        run.font.size = Pt(14)
-        run.font.color.rgb = self.COLORS['primary']
+    def _append_table_row(self, table, cells):
+        """
+        Append one row built as a single XML fragment.
         
-        # Add bottom border
-        paragraph.paragraph_format.space_after = Pt(10)
+        cells: (text, fill, align, header, size) per column. fill is a hex
+        shading color or None; header rows are bold white; size is in
+        half-points or None.
+        """
+        widths = [grid_col.w.twips for grid_col in table._tbl.tblGrid.gridCol_lst]
+        xml = [f'<w:tr {nsdecls("w")}>']
+        for width, (text, fill, align, header, size) in zip(widths, cells):
+            shading = f'<w:shd w:fill="{fill}"/>' if fill else ''
+            run_props = ('<w:b/><w:color w:val="FFFFFF"/>' if header else '') + (f'<w:sz w:val="{size}"/>' if size else '')
+            xml.append(
+                f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>{shading}</w:tcPr>'
+                f'<w:p><w:pPr><w:jc w:val="{align}"/></w:pPr>'
+                f'<w:r><w:rPr>{run_props}</w:rPr>{self._run_text_xml(str(text))}</w:r></w:p></w:tc>'
+            )
+        xml.append('</w:tr>')
+        table._tbl.append(parse_xml(''.join(xml)))
+    
+    def _run_text_xml(self, text: str) -> str:
+        """Run content XML for text (w:t, with w:tab/w:br for tabs and line breaks)."""
+        parts = []
+        for piece in _RUN_BREAKS.split(text):
+            if piece == '\t':
+                parts.append('<w:tab/>')
+            elif piece in ('\n', '\r'):
+                parts.append('<w:br/>')
+            elif piece:
+                preserve = ' xml:space="preserve"' if piece.strip() != piece else ''
+                parts.append(f'<w:t{preserve}>{escape(piece)}</w:t>')
+        return ''.join(parts)
+    
+    def _add_page_break(self, doc):
+        """Add a paragraph holding only a page break, built as one XML fragment."""
+        doc.element.body._insert_p(parse_xml(f'<w:p {nsdecls("w")}><w:r><w:br w:type="page"/></w:r></w:p>'))
+    
+    def _add_blank_paragraphs(self, doc, count: int):
+        """Add count empty spacer paragraphs with one insertion before the body's sectPr."""
+        body = doc.element.body
+        blanks = [OxmlElement('w:p') for _ in range(count)]
+        if body.sectPr is None:
+            body.extend(blanks)
+        else:
+            position = body.index(body.sectPr)
+            body[position:position] = blanks
+    
+    def _add_section_title(self, doc, text: str):
+        """Add a section title (bold 14pt primary, 10pt space after)."""
+        self._add_text_paragraph(
+            doc, text, f'<w:b/><w:color w:val="{self.COLORS["primary"]}"/><w:sz w:val="28"/>',
+            paragraph_props='<w:spacing w:after="200"/>',
+        )
     
     def _add_subsection_title(self, doc, text: str):
-        """Add a subsection title."""
-        paragraph = doc.add_paragraph()
-        run = paragraph.add_run(text)
-        run.bold = True
-        run.font.size = Pt(12)
-        run.font.color.rgb = self.COLORS['secondary']
+        """Add a subsection title (bold 12pt secondary)."""
+        self._add_text_paragraph(
+            doc, text, f'<w:b/><w:color w:val="{self.COLORS["secondary"]}"/><w:sz w:val="24"/>'
+        )
     
     def _add_paragraph(self, doc, text: str):
-        """Add a body paragraph."""
+        """Add a body paragraph (justified 11pt, 12pt space after)."""
         text = self._clean_text(text)
         if not text:
             return
-        paragraph = doc.add_paragraph()
-        paragraph.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        run = paragraph.add_run(text)
-        run.font.size = Pt(11)
-        paragraph.paragraph_format.space_after = Pt(12)
+        self._add_text_paragraph(
+            doc, text, '<w:sz w:val="22"/>',
+            paragraph_props='<w:spacing w:after="240"/><w:jc w:val="both"/>',
+        )
+    
+    def _add_text_paragraph(self, doc, text: str, run_props: str, paragraph_props: str = ''):
+        """
+        Add a single-run paragraph built as one XML fragment, with its
+        formatting written directly instead of set through run/font proxies.
+        
+        run_props / paragraph_props: w:rPr / w:pPr children in schema order;
+        sizes in half-points, spacing in twips.
+        """
+        paragraph_xml = f'<w:pPr>{paragraph_props}</w:pPr>' if paragraph_props else ''
+        doc.element.body._insert_p(parse_xml(
+            f'<w:p {nsdecls("w")}>{paragraph_xml}'
+            f'<w:r><w:rPr>{run_props}</w:rPr>{self._run_text_xml(text)}</w:r></w:p>'
+        ))
 
     def _clean_text(self, text: str) -> str:
         """Convert lightweight HTML/Markdown-ish narrative text to plain Word text."""
@@ -651,11 +694,18 @@ class WordExporter:
     
     def _add_chart_image(self, doc, chart_bytes: bytes, width: float = 6):
         """Add a chart image to the document."""
-        img_buffer = io.BytesIO(chart_bytes)
+        # Each distinct PNG is parsed and stored once; repeats reuse its rId
+        cached = self._chart_images.get(chart_bytes)
+        if cached is None:
+            cached = doc.part.get_or_add_image(io.BytesIO(chart_bytes))
+            self._chart_images[chart_bytes] = cached
+        rId, image = cached
+        cx, cy = image.scaled_dimensions(Inches(width), None)
+        
         paragraph = doc.add_paragraph()
         paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = paragraph.add_run()
-        run.add_picture(img_buffer, width=Inches(width))
+        run._r.add_drawing(CT_Inline.new_pic_inline(doc.part.next_id, rId, image.filename, cx, cy))
         doc.add_paragraph()  # Spacer
     
     def _add_data_table(self, doc, stats: Dict):
@@ -666,21 +716,11 @@ class WordExporter:
         
         total_nib = stats.get('total_nib', 1)
         
-        table = doc.add_table(rows=len(top_5) + 1, cols=4)
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        table = self._add_table(doc, cols=4)
         
         # Header row
         headers = ['No', 'Kabupaten/Kota', 'Total NIB', 'Persentase']
-        for i, header in enumerate(headers):
-            cell = table.rows[0].cells[i]
-            cell.text = header
-            self._set_cell_shading(cell, "1e3a5f")
-            for paragraph in cell.paragraphs:
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                for run in paragraph.runs:
-                    run.bold = True
-                    run.font.color.rgb = self.COLORS['white']
-                    run.font.size = Pt(10)
+        self._append_table_row(table, [(header, "1e3a5f", 'center', True, 20) for header in headers])
         
         # Data rows
         for row_idx, loc in enumerate(top_5, 1):
@@ -688,22 +728,14 @@ class WordExporter:
             row_data = [
                 str(row_idx),
                 loc['Kabupaten/Kota'],
-                f"{loc['Total']:,}".replace(',', '.'),
+                format(loc['Total'], ',').translate(_COMMA_TO_DOT),
                 f"{pct:.1f}%"
             ]
-            
-            for col_idx, value in enumerate(row_data):
-                cell = table.rows[row_idx].cells[col_idx]
-                cell.text = value
-                # Alternate row colors
-                if row_idx % 2 == 0:
-                    self._set_cell_shading(cell, "f8f9fa")
-                for paragraph in cell.paragraphs:
-                    if col_idx == 1:  # Kabupaten/Kota left-aligned
-                        paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                    else:
-                        paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    for run in paragraph.runs:
-                        run.font.size = Pt(10)
+            # Alternate row colors
+            fill = "f8f9fa" if row_idx % 2 == 0 else None
+            self._append_table_row(table, [
+                (value, fill, align, False, 20)
+                for value, align in zip(row_data, self._DATA_TABLE_ALIGN)
+            ])
         
         doc.add_paragraph()  # Spacer
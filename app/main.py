@@ -9,10 +9,12 @@ Main entry point for the web application that allows users to:
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 from pathlib import Path
 import sys
 import io
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add app directory to path
@@ -944,6 +946,39 @@ def _cached_load_proyek(file_content: bytes, filename: str, year: int):
     return result.data
 
 
+def _load_reference_files(tahun: int) -> dict:
+    """Load every uploaded reference file in parallel.
+
+    The NIB, PB OSS and PROYEK files (and their previous-year uploads) are
+    independent, so they are parsed concurrently. Returns a dict of
+    session key -> completed Future; result() re-raises any loader error
+    so each section keeps its own error handling.
+    """
+    loads = [
+        ('nib_ref_file', _cached_load_nib, tahun),
+        ('nib_prev_ref_file', _cached_load_nib, tahun - 1),
+        ('pb_oss_ref_file', _cached_load_pb_oss, tahun),
+        ('pb_oss_prev_ref_file', _cached_load_pb_oss, tahun - 1),
+        ('proyek_ref_file', _cached_load_proyek, tahun),
+        ('proyek_prev_ref_file', _cached_load_proyek, tahun - 1),
+    ]
+    uploads = []
+    for key, load, year in loads:
+        file = st.session_state.get(key)
+        # Previous-year files are only used alongside a current-year upload
+        if file and st.session_state.get(key.replace('_prev', '')):
+            uploads.append((key, file, load, year))
+    if not uploads:
+        return {}
+    
+    # Workers get this script run's context, so the st.cache_data wrappers
+    # see a ScriptRunContext instead of logging that it is missing
+    with ThreadPoolExecutor(max_workers=len(uploads), initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx())) as executor:
+        return {key: executor.submit(load, file.getvalue(), file.name, year)
+                for key, file, load, year in uploads}
+
+
 def _show_load_status(label: str, data):
     """Show lightweight load timing feedback when available."""
     status = getattr(data, "_cache_status", None)
@@ -972,19 +1007,21 @@ def process_data(uploaded_files, jenis_periode: str, periode: str, tahun: int):
         st.session_state.aggregator = aggregator
         return False
     
+    reference_loads = _load_reference_files(tahun)
+    
     # 1. Process NIB Data (if uploaded)
     nib_file = st.session_state.get('nib_ref_file')
     if nib_file:
         try:
-            # Use cached loader for performance
-            nib_data = _cached_load_nib(nib_file.getvalue(), nib_file.name, tahun)
+            # Loaded in parallel by _load_reference_files (cached loaders)
+            nib_data = reference_loads['nib_ref_file'].result()
             st.session_state.current_nib_data = nib_data
             _show_load_status("NIB", nib_data)
             
             # Pre-load previous year NIB if available
             nib_prev_file = st.session_state.get('nib_prev_ref_file')
             if nib_prev_file:
-                 st.session_state.prev_nib_data = _cached_load_nib(nib_prev_file.getvalue(), nib_prev_file.name, tahun - 1)
+                 st.session_state.prev_nib_data = reference_loads['nib_prev_ref_file'].result()
                  _show_load_status("NIB tahun sebelumnya", st.session_state.prev_nib_data)
             
             if nib_data:
@@ -1062,15 +1099,15 @@ def process_data(uploaded_files, jenis_periode: str, periode: str, tahun: int):
     pb_file = st.session_state.get('pb_oss_ref_file')
     if pb_file:
         try:
-            # Use cached loader for performance
-            pb_data = _cached_load_pb_oss(pb_file.getvalue(), pb_file.name, tahun)
+            # Loaded in parallel by _load_reference_files (cached loaders)
+            pb_data = reference_loads['pb_oss_ref_file'].result()
             st.session_state.current_pb_data = pb_data
             _show_load_status("PB OSS", pb_data)
 
             # Pre-load previous year PB OSS if available
             pb_prev_file = st.session_state.get('pb_oss_prev_ref_file')
             if pb_prev_file:
-                 st.session_state.prev_pb_data = _cached_load_pb_oss(pb_prev_file.getvalue(), pb_prev_file.name, tahun - 1)
+                 st.session_state.prev_pb_data = reference_loads['pb_oss_prev_ref_file'].result()
                  _show_load_status("PB OSS tahun sebelumnya", st.session_state.prev_pb_data)
             
             
@@ -1103,15 +1140,15 @@ def process_data(uploaded_files, jenis_periode: str, periode: str, tahun: int):
     proyek_file = st.session_state.get('proyek_ref_file')
     if proyek_file:
         try:
-            # Use cached loader for performance
-            proyek_data = _cached_load_proyek(proyek_file.getvalue(), proyek_file.name, tahun)
+            # Loaded in parallel by _load_reference_files (cached loaders)
+            proyek_data = reference_loads['proyek_ref_file'].result()
             st.session_state.current_proyek_data = proyek_data
             _show_load_status("PROYEK", proyek_data)
             
             # Pre-load previous year Proyek if available
             proyek_prev_file = st.session_state.get('proyek_prev_ref_file')
             if proyek_prev_file:
-                st.session_state.prev_proyek_data = _cached_load_proyek(proyek_prev_file.getvalue(), proyek_prev_file.name, tahun - 1)
+                st.session_state.prev_proyek_data = reference_loads['proyek_prev_ref_file'].result()
                 _show_load_status("PROYEK tahun sebelumnya", st.session_state.prev_proyek_data)
             
             
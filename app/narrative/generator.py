@@ -6,12 +6,17 @@ for NIB data reports. Designed to be insight-focused and easy to understand
 for general audiences.
 """
 
+import heapq
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import sys
 sys.path.append('..')
 from app.data.aggregator import PeriodReport
 
+# Investment value of an InvestmentData row, fetched in one C-level call
+_JUMLAH_RP = attrgetter('jumlah_rp')
+
 
 @dataclass
 class Narrative:
@@ -539,13 +544,13 @@ Data ini mencerminkan dinamika investasi di wilayah Lampung dan menjadi indikato
         if not investment_data:
             return ""
         
-        # Sort by value
-        sorted_data = sorted(investment_data, key=lambda x: x.jumlah_rp, reverse=True)
+        # Only the top two are named; no need to sort the whole list
+        sorted_data = heapq.nlargest(2, investment_data, key=_JUMLAH_RP)
         if not sorted_data:
             return ""
         
         top_wilayah = sorted_data[0]
-        total = sum(d.jumlah_rp for d in sorted_data)
+        total = sum(map(_JUMLAH_RP, investment_data))
         top_pct = (top_wilayah.jumlah_rp / total * 100) if total > 0 else 0
         
         # Format value
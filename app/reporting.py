@@ -2,16 +2,11 @@
 
 from typing import Any, Callable, Dict, Iterable, Optional
 
-from app.config import NAMA_BULAN, TRIWULAN_KE_BULAN
+from app.config import NAMA_BULAN, SEMESTER_KE_BULAN, TRIWULAN_KE_BULAN
 
 
 TRIWULAN_ORDER = ["TW I", "TW II", "TW III", "TW IV"]
 
-SEMESTER_KE_BULAN = {
-    "Semester I": TRIWULAN_KE_BULAN["TW I"] + TRIWULAN_KE_BULAN["TW II"],
-    "Semester II": TRIWULAN_KE_BULAN["TW III"] + TRIWULAN_KE_BULAN["TW IV"],
-}
-
 
 def build_comparison_context(period_type: str, period_name: str, year: int) -> Dict[str, Any]:
     """Build canonical month ranges and labels for YoY/QoQ comparisons."""
@@ -30,7 +25,7 @@ def build_comparison_context(period_type: str, period_name: str, year: int) -> D
     }
 
     if period_type == "Triwulan":
-        context["main_target_months"] = TRIWULAN_KE_BULAN.get(period_name, [])
+        context["main_target_months"] = list(TRIWULAN_KE_BULAN.get(period_name, ()))
         context["yoy_curr_months"] = context["main_target_months"]
         context["yoy_prev_months"] = context["main_target_months"]
         context["yoy_curr_label"] = f"{period_name} {year}"
@@ -42,12 +37,12 @@ def build_comparison_context(period_type: str, period_name: str, year: int) -> D
             context["qoq_curr_label"] = f"{period_name} {year}"
             prev_period = TRIWULAN_ORDER[current_idx - 1] if current_idx > 0 else "TW IV"
             prev_year = year if current_idx > 0 else year - 1
-            context["qoq_prev_months"] = TRIWULAN_KE_BULAN[prev_period]
+            context["qoq_prev_months"] = list(TRIWULAN_KE_BULAN[prev_period])
             context["qoq_prev_label"] = f"{prev_period} {prev_year}"
             context["qoq_prev_year_required"] = current_idx == 0
 
     elif period_type == "Semester":
-        context["main_target_months"] = SEMESTER_KE_BULAN.get(period_name, [])
+        context["main_target_months"] = list(SEMESTER_KE_BULAN.get(period_name, ()))
         if period_name == "Semester I":
             current_tw = "TW II"
             previous_tw = "TW I"
@@ -55,23 +50,23 @@ def build_comparison_context(period_type: str, period_name: str, year: int) -> D
             current_tw = "TW IV"
             previous_tw = "TW III"
 
-        context["yoy_curr_months"] = TRIWULAN_KE_BULAN[current_tw]
-        context["yoy_prev_months"] = TRIWULAN_KE_BULAN[current_tw]
+        context["yoy_curr_months"] = list(TRIWULAN_KE_BULAN[current_tw])
+        context["yoy_prev_months"] = list(TRIWULAN_KE_BULAN[current_tw])
         context["yoy_curr_label"] = f"{current_tw} {year}"
         context["yoy_prev_label"] = f"{current_tw} {year - 1}"
-        context["qoq_curr_months"] = TRIWULAN_KE_BULAN[current_tw]
-        context["qoq_prev_months"] = TRIWULAN_KE_BULAN[previous_tw]
+        context["qoq_curr_months"] = list(TRIWULAN_KE_BULAN[current_tw])
+        context["qoq_prev_months"] = list(TRIWULAN_KE_BULAN[previous_tw])
         context["qoq_curr_label"] = f"{current_tw} {year}"
         context["qoq_prev_label"] = f"{previous_tw} {year}"
 
     elif period_type == "Tahunan":
         context["main_target_months"] = list(NAMA_BULAN)
-        context["yoy_curr_months"] = SEMESTER_KE_BULAN["Semester II"]
-        context["yoy_prev_months"] = SEMESTER_KE_BULAN["Semester II"]
+        context["yoy_curr_months"] = list(SEMESTER_KE_BULAN["Semester II"])
+        context["yoy_prev_months"] = list(SEMESTER_KE_BULAN["Semester II"])
         context["yoy_curr_label"] = f"Semester II {year}"
         context["yoy_prev_label"] = f"Semester II {year - 1}"
-        context["qoq_curr_months"] = SEMESTER_KE_BULAN["Semester II"]
-        context["qoq_prev_months"] = SEMESTER_KE_BULAN["Semester I"]
+        context["qoq_curr_months"] = list(SEMESTER_KE_BULAN["Semester II"])
+        context["qoq_prev_months"] = list(SEMESTER_KE_BULAN["Semester I"])
         context["qoq_curr_label"] = f"Semester II {year}"
         context["qoq_prev_label"] = f"Semester I {year}"
 
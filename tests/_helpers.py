@@ -0,0 +1,31 @@
+import io
+import tempfile
+from pathlib import Path
+
+import openpyxl
+
+import app.cache as cache_module
+
+
+class TempCacheDirMixin:
+    """Point app.cache.CACHE_DIR at a fresh temporary directory for each test."""
+
+    def setUp(self):
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.addCleanup(setattr, cache_module, "CACHE_DIR", cache_module.CACHE_DIR)
+        self.cache_dir = cache_module.CACHE_DIR = Path(tmpdir.name)
+
+
+def workbook_bytes(sheets):
+    """Return .xlsx bytes with one sheet per (title, rows) item of sheets, in order."""
+    workbook = openpyxl.Workbook()
+    for index, (title, rows) in enumerate(sheets.items()):
+        sheet = workbook.active if index == 0 else workbook.create_sheet()
+        sheet.title = title
+        for row in rows:
+            sheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
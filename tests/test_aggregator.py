@@ -0,0 +1,133 @@
+import unittest
+
+from app.data.aggregator import AggregatedNIBData, DataAggregator
+from app.data.loader import DataLoader, NIBData
+
+
+def _month_data(month, year, rows):
+    loader = DataLoader()
+    nib = [NIBData(kabupaten_kota=kab, pma=pma, pmdn=pmdn, usaha_mikro=mikro, usaha_besar=besar, total=pma + pmdn)
+           for kab, pma, pmdn, mikro, besar in rows]
+    return {
+        "month": month,
+        "year": year,
+        "nib": nib,
+        "nib_frame": loader.build_nib_frame(nib, month),
+    }
+
+
+class AggregatedNIBDataTests(unittest.TestCase):
+    def test_counter_attributes_read_and_write_the_counts_array(self):
+        agg = AggregatedNIBData(kabupaten_kota="Kota Metro")
+        agg.pma_total += 2
+        agg.usaha_kecil_total = 5
+        agg.usaha_besar_total += 1
+
+        self.assertEqual(agg.counts.tolist(), [2, 0, 0, 5, 0, 1, 0])
+        self.assertEqual(agg.umk_total, 5)
+        self.assertEqual(agg.non_umk_total, 1)
+        self.assertIsInstance(agg.pma_total, int)
+
+
+class PeriodAggregationTests(unittest.TestCase):
+    def setUp(self):
+        self.aggregator = DataAggregator()
+        self.aggregator.loaded_data = {
+            "Januari_2025": _month_data("Januari", 2025, [
+                ("Kota Metro", 2, 8, 9, 1),
+                ("Kab. Mesuji", 0, 5, 5, 0),
+            ]),
+            "Februari_2025": _month_data("Februari", 2025, [
+                ("Kota Metro", 1, 3, 4, 0),
+                ("Kab. Pesawaran", 0, 0, 0, 0),
+            ]),
+            "Oktober_2024": _month_data("Oktober", 2024, [
+                ("Kota Metro", 0, 4, 4, 0),
+            ]),
+        }
+
+    def test_triwulan_sums_locations_across_months(self):
+        report = self.aggregator.aggregate_triwulan("TW I", 2025)
+        metro = report.data_by_location["Kota Metro"]
+
+        self.assertEqual(metro.pma_total, 3)
+        self.assertEqual(metro.pmdn_total, 11)
+        self.assertEqual(metro.grand_total, 14)
+        self.assertEqual(metro.umk_total, 13)
+        self.assertEqual(metro.period_data, {"Januari": 10, "Februari": 4})
+        self.assertEqual(report.monthly_totals, {"Januari": 15, "Februari": 4})
+        self.assertEqual(report.total_nib, 19)
+        self.assertEqual(report.total_pma, 3)
+        self.assertEqual(report.total_pmdn, 16)
+        self.assertEqual(report.total_umk, 18)
+        self.assertEqual(report.total_non_umk, 1)
+
+    def test_duplicate_location_rows_in_one_month_are_summed(self):
+        self.aggregator.loaded_data["Maret_2025"] = _month_data("Maret", 2025, [
+            ("Tanpa Lokasi", 1, 2, 3, 0),
+            ("Tanpa Lokasi", 0, 4, 4, 0),
+        ])
+
+        report = self.aggregator.aggregate_triwulan("TW I", 2025)
+        df = self.aggregator.to_dataframe(report).set_index("Kabupaten/Kota")
+
+        self.assertEqual(report.data_by_location["Tanpa Lokasi"].period_data, {"Maret": 7})
+        self.assertEqual(df.loc["Tanpa Lokasi", "Maret"], 7)
+        self.assertEqual(df.loc["Tanpa Lokasi", "Total"], 7)
+
+    def test_dataframe_and_summary_rank_locations_by_total(self):
+        report = self.aggregator.aggregate_triwulan("TW I", 2025)
+        df = self.aggregator.to_dataframe(report)
+        stats = self.aggregator.get_summary_stats(report)
+
+        self.assertEqual(df["Kabupaten/Kota"].tolist(), ["Kota Metro", "Kab. Mesuji", "Kab. Pesawaran"])
+        self.assertEqual(df["Januari"].tolist(), [10, 5, 0])
+        self.assertEqual(df["Maret"].tolist(), [0, 0, 0])
+        self.assertEqual(stats["top_5_locations"][0], {"Kabupaten/Kota": "Kota Metro", "Total": 14})
+        self.assertEqual(stats["pm_distribution"]["PMDN"], 16)
+
+    def test_qoq_comparison_uses_previous_year_for_tw_i(self):
+        current, previous, change = self.aggregator.get_qoq_comparison("TW I", 2025)
+
+        self.assertEqual(previous.total_nib, 4)
+        self.assertEqual(current.prev_period_total, 4)
+        self.assertAlmostEqual(change, 375.0)
+
+    def test_qoq_comparison_leaves_cached_aggregate_unchanged(self):
+        self.aggregator.get_qoq_comparison("TW I", 2025)
+        report = self.aggregator.aggregate_triwulan("TW I", 2025)
+
+        self.assertIsNone(report.prev_period_total)
+        self.assertIsNone(self.aggregator.get_summary_stats(report)["change_percentage"])
+
+    def test_qoq_comparison_skips_unloaded_previous_quarter(self):
+        current, previous, change = self.aggregator.get_qoq_comparison("TW IV", 2024)
+
+        self.assertEqual(current.total_nib, 4)
+        self.assertIsNone(previous)
+        self.assertIsNone(change)
+        self.assertNotIn(("Triwulan", "TW III", 2024), self.aggregator._report_cache)
+
+    def test_repeated_aggregation_is_memoized_until_cache_is_cleared(self):
+        first = self.aggregator.aggregate_triwulan("TW I", 2025)
+
+        self.assertIs(self.aggregator.aggregate_triwulan("TW I", 2025), first)
+
+        self.aggregator.loaded_data["Maret_2025"] = _month_data("Maret", 2025, [("Kota Metro", 0, 1, 1, 0)])
+        self.aggregator.clear_cache()
+        refreshed = self.aggregator.aggregate_triwulan("TW I", 2025)
+
+        self.assertIsNot(refreshed, first)
+        self.assertEqual(refreshed.total_nib, first.total_nib + 1)
+
+    def test_missing_period_produces_empty_report(self):
+        report = self.aggregator.aggregate_semester("Semester II", 2025)
+
+        self.assertEqual(report.data_by_location, {})
+        self.assertEqual(report.monthly_totals, {})
+        self.assertEqual(report.total_nib, 0)
+        self.assertEqual(self.aggregator.get_summary_stats(report), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
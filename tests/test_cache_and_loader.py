@@ -1,19 +1,22 @@
-import tempfile
+import io
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import pandas as pd
 
 from app.cache import CACHE_VERSION, get_cache_key, load_or_build
+from app.data.loader import DataLoader
 from app.data.reference_loader import (
     NIBReferenceData,
     PBOSSReferenceData,
     ProyekReferenceData,
     ReferenceDataLoader,
 )
+from tests._helpers import TempCacheDirMixin, workbook_bytes
 
 
-class PersistentCacheTests(unittest.TestCase):
+class PersistentCacheTests(TempCacheDirMixin, unittest.TestCase):
     def test_cache_key_is_stable_and_versioned(self):
         content = b"same file bytes"
 
@@ -25,30 +28,30 @@ class PersistentCacheTests(unittest.TestCase):
         self.assertNotEqual(key_one, key_new_version)
 
     def test_cache_miss_then_hit_preserves_reference_object_methods(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import app.cache as cache_module
+        calls = []
 
-            old_cache_dir = cache_module.CACHE_DIR
-            cache_module.CACHE_DIR = Path(tmpdir)
-            calls = []
+        def builder(content, filename, year):
+            calls.append((content, filename, year))
+            data = NIBReferenceData(year=year)
+            data.monthly_totals = {"Januari": 3, "Februari": 4}
+            return data
 
-            def builder(content, filename, year):
-                calls.append((content, filename, year))
-                data = NIBReferenceData(year=year)
-                data.monthly_totals = {"Januari": 3, "Februari": 4}
-                return data
-
-            try:
-                first = load_or_build("nib", b"nib-bytes", "NIB 2025.xlsx", 2025, builder)
-                second = load_or_build("nib", b"nib-bytes", "NIB 2025.xlsx", 2025, builder)
-            finally:
-                cache_module.CACHE_DIR = old_cache_dir
+        first = load_or_build("nib", b"nib-bytes", "NIB 2025.xlsx", 2025, builder)
+        second = load_or_build("nib", b"nib-bytes", "NIB 2025.xlsx", 2025, builder)
 
         self.assertEqual(first.status, "parsed")
         self.assertEqual(second.status, "cache")
         self.assertEqual(len(calls), 1)
         self.assertEqual(second.data.get_period_total(["Januari", "Februari"]), 7)
 
+    def test_failed_cache_write_is_a_miss_not_an_error(self):
+        with mock.patch.object(Path, "replace", side_effect=FileNotFoundError("raced")):
+            result = load_or_build("nib", b"nib-bytes", "NIB 2025.xlsx", 2025, lambda *args: {"rows": 3})
+
+        self.assertEqual(result.status, "parsed")
+        self.assertEqual(result.data, {"rows": 3})
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
     def test_cached_pb_and_proyek_objects_keep_breakdown_methods(self):
         pb = PBOSSReferenceData(year=2025)
         pb.monthly_permits = {"Januari": 5}
@@ -64,6 +67,19 @@ class PersistentCacheTests(unittest.TestCase):
         self.assertEqual(proyek.get_period_by_wilayah(["Januari"]), {"Kota Metro": 1000.0})
 
 
+class DataLoaderSheetCacheTests(TempCacheDirMixin, unittest.TestCase):
+    def test_identical_workbook_bytes_are_parsed_once(self):
+        content = workbook_bytes({"NIB": [["Kota Metro", 1, 2]]})
+
+        loader = DataLoader()
+        first = loader.load_file_from_bytes(io.BytesIO(content), "NIB JANUARI 2025.xlsx")
+        with mock.patch.object(loader, "_read_sheets", side_effect=AssertionError("re-parsed")):
+            second = loader.load_file_from_bytes(io.BytesIO(content), "NIB JANUARI 2025.xlsx")
+
+        self.assertEqual(list(second), ["NIB"])
+        pd.testing.assert_frame_equal(first["NIB"], second["NIB"])
+
+
 class ReferenceLoaderDateTests(unittest.TestCase):
     def test_vectorized_date_parsing_supports_existing_formats(self):
         loader = ReferenceDataLoader()
@@ -78,6 +94,78 @@ class ReferenceLoaderDateTests(unittest.TestCase):
 
         self.assertEqual(parsed_months, ["Januari", "Februari", "Maret", "April", "Agustus"])
 
+    def test_unparseable_dates_become_missing_months(self):
+        loader = ReferenceDataLoader()
+        parsed_months = loader._month_series(pd.Series(["25/03/2025", "garbage", "31 April 2025", None])).tolist()
+
+        self.assertEqual(parsed_months[0], "Maret")
+        self.assertTrue(all(pd.isna(month) for month in parsed_months[1:]))
+
+
+class ReferenceLoaderTests(unittest.TestCase):
+    def test_nib_counts_unique_nib_per_month_and_breakdown(self):
+        content = workbook_bytes({"Sheet 1": [
+            ["nib", "Day of tanggal_terbit_oss", "kab_kota", "status_penanaman_modal", "uraian_skala_usaha"],
+            ["1", "2025-01-05", "Kota Metro", "PMA", "Usaha Mikro"],
+            ["1", "2025-01-20", "Kota Metro", "PMA", "Usaha Mikro"],
+            ["2", "2025-01-07", "Kota Metro", "pmdn ", "Usaha Besar"],
+            ["1", "2025-02-03", "Kab. Mesuji", "PMA", "Usaha Mikro"],
+        ]})
+
+        data = ReferenceDataLoader().load_nib(io.BytesIO(content), "NIB 2025.xlsx")
+
+        self.assertEqual(data.total_nib, 3)
+        self.assertEqual(data.monthly_totals, {"Februari": 1, "Januari": 2})
+        self.assertEqual(list(data.monthly_totals), ["Januari", "Februari"])
+        self.assertEqual(data.by_kab_kota, {"Kab. Mesuji": {"Februari": 1}, "Kota Metro": {"Januari": 2}})
+        self.assertEqual(data.get_period_by_pm_status(["Januari", "Februari"]), {"PMA": 2, "PMDN": 1})
+        self.assertEqual(data.kab_pm_monthly["Kota Metro"], {"Januari": {"PMA": 1, "PMDN": 1}})
+        self.assertEqual(data.kab_skala_monthly["Kab. Mesuji"], {"Februari": {"Usaha Mikro": 1}})
+
+    def test_pb_oss_risk_codes_are_normalized_before_counting(self):
+        content = workbook_bytes({"Sheet1": [
+            ["nib", "Day of tgl_izin", "kd_resiko"],
+            [1, "2025-01-05", "R"],
+            [2, "2025-01-06", "r "],
+            [3, "2025-01-07", "MT"],
+            [4, "2025-02-01", "Tinggi"],
+        ]})
+
+        data = ReferenceDataLoader().load_pb_oss(io.BytesIO(content), "PB OSS 2025.xlsx")
+
+        self.assertEqual(data.monthly_risk, {"Januari": {"Menengah Tinggi": 1, "Rendah": 2}, "Februari": {"TINGGI": 1}})
+        self.assertEqual(data.total_permits, 4)
+
+    def test_repeated_upload_is_served_from_data_cache(self):
+        content = workbook_bytes({"Sheet": [
+            ["tanggal_pengajuan_proyek", "Jumlah Investasi", "Status PM", "Kab Kota Usaha"],
+            ["2025-03-05", 1000, "PMA", "Kota Metro"],
+        ]})
+
+        loader = ReferenceDataLoader()
+        first = loader.load_proyek(io.BytesIO(content), "DATA 2025.xlsx")
+        with mock.patch("pandas.ExcelFile", side_effect=AssertionError("reparsed")):
+            second = loader.load_proyek(io.BytesIO(content), "DATA 2025.xlsx")
+
+        self.assertIs(second, first)
+        self.assertEqual(first.monthly_investment, {"Maret": 1000.0})
+
+    def test_detected_workbook_is_reused_by_the_loader(self):
+        content = workbook_bytes({"Sheet": [
+            ["tanggal_pengajuan_proyek", "Jumlah Investasi", "Status PM", "Kab Kota Usaha", "TKI", "TKA"],
+            ["2025-01-05", 1000, "PMA", "Kota Metro", 3, 1],
+            ["2025-02-05", 500, "PMDN", "Kota Metro", 2, 0],
+        ]})
+
+        loader = ReferenceDataLoader()
+        file_type, xl = loader.detect_file_type(io.BytesIO(content), "DATA 2025.xlsx")
+        with mock.patch("pandas.ExcelFile", side_effect=AssertionError("reopened")):
+            data = loader.load_proyek(None, "DATA 2025.xlsx", xl=xl)
+
+        self.assertEqual(file_type, "PROYEK")
+        self.assertEqual(data.monthly_pma, {"Januari": 1000.0})
+        self.assertEqual(data.get_period_tki(["Januari", "Februari"]), 5)
+
 
 if __name__ == "__main__":
     unittest.main()
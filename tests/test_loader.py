@@ -0,0 +1,180 @@
+import io
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from app.data.loader import DataLoader, NIBData
+from tests._helpers import TempCacheDirMixin, workbook_bytes
+
+
+class SheetParserTests(unittest.TestCase):
+    def setUp(self):
+        self.loader = DataLoader()
+
+    def test_nib_sheet_skips_summaries_and_relabels_null_rows_with_data(self):
+        df = pd.DataFrame([
+            ["REKAP NIB", None, None, None, None, None, None, None],
+            ["KABUPATEN/KOTA", "PMA", "PMDN", "UB", "UK", "UM", "UMI", "JUMLAH"],
+            ["Kota Metro", 2, "8", 1, 3.0, None, 6, 10],
+            ["Kab. Mesuji", 0, 5, 0, 0, 0, 5, None],
+            ["Null", 1, 0, 0, 0, 0, 1, 1],
+            ["-", 0, 0, 0, 0, 0, 0, 0],
+            ["JUMLAH", 3, 13, 1, 3, 0, 12, 16],
+        ])
+
+        rows = self.loader.parse_nib_sheet(df)
+
+        self.assertEqual([r.kabupaten_kota for r in rows], ["Kota Metro", "Kab. Mesuji", "Tanpa Lokasi"])
+        metro = rows[0]
+        self.assertEqual(
+            (metro.pma, metro.pmdn, metro.usaha_besar, metro.usaha_kecil, metro.usaha_menengah, metro.usaha_mikro, metro.total),
+            (2, 8, 1, 3, 0, 6, 10),
+        )
+        self.assertEqual(rows[1].total, 5)  # Falls back to PMA + PMDN
+
+    def test_perizinan_berusaha_sheet_reads_total_from_last_filled_column(self):
+        df = pd.DataFrame([
+            ["KAB/KOTA", "PMA", "PMDN", "LAIN", "JUMLAH", None],
+            ["Kota Metro", 1, 2, "x", 9, None],
+            ["Kab. Pesawaran", 4, 1, None, None, None],
+            ["TOTAL", 5, 3, None, 9, None],
+        ])
+
+        rows = self.loader.parse_perizinan_berusaha_sheet(df)
+
+        self.assertEqual([(r.kabupaten_kota, r.pma, r.pmdn, r.total) for r in rows], [
+            ("Kota Metro", 1, 2, 9),
+            ("Kab. Pesawaran", 4, 1, 5),
+        ])
+
+    def test_investment_sheet_skips_summaries_and_rows_without_value(self):
+        df = pd.DataFrame([
+            ["REALISASI PMA TW I", None, None, None, None, None],
+            ["NO", "WILAYAH", "JUMLAH", "PROYEK", "TKI", "TKA"],
+            [None, None, "(Rp.)", None, None, None],
+            [1, " Kota Metro ", 1500.5, "3", 10.0, None],
+            [2, "Kab. Mesuji", None, 2, "x", 1],
+            [3, "Kab. Pesawaran", 0, 0, 4, 0],
+            [None, None, 99, 9, 9, 9],
+            [None, "JUMLAH", 1500.5, 5, 10, 1],
+        ])
+
+        rows = self.loader._parse_investment_sheet(df)
+
+        self.assertEqual([(r.name, r.jumlah_rp, r.proyek, r.tki, r.tka) for r in rows], [
+            ("Kota Metro", 1500.5, 3, 10, 0),
+            ("Kab. Mesuji", 0.0, 2, 0, 1),
+        ])
+
+    def test_merge_nib_data_sums_shared_locations_in_first_seen_order(self):
+        merged = self.loader._merge_nib_data(
+            [NIBData("Kota Metro", pma=1, pmdn=2, total=3), NIBData("Kab. Mesuji", pmdn=1, total=1)],
+            [NIBData("Kab. Pesawaran", pma=5, total=5), NIBData("Kota Metro", pmdn=1, usaha_mikro=4, total=1)],
+        )
+
+        self.assertEqual([(r.kabupaten_kota, r.pma, r.pmdn, r.usaha_mikro, r.total) for r in merged], [
+            ("Kota Metro", 1, 3, 4, 4),
+            ("Kab. Mesuji", 0, 1, 0, 1),
+            ("Kab. Pesawaran", 5, 0, 0, 5),
+        ])
+
+
+class QuarterlyFileTests(TempCacheDirMixin, unittest.TestCase):
+    def _workbook_bytes(self):
+        return workbook_bytes({
+            "PERIZINAN BERUSAHA JANUARI": [
+                ["KAB/KOTA", "PMA", "PMDN", "JUMLAH"],
+                ["Kota Metro", 1, 2, 3],
+                ["JUMLAH", 1, 2, 3],
+            ],
+            "SEKTOR RESIKO FEBRUARI": [
+                ["KABUPATEN", "MR", "MT", "R", "T"] + ["SEKTOR"] * 8 + ["TOTAL"],
+                ["Kab. Mesuji"] + [1] * 12 + [9],
+            ],
+            "REKAP": [],
+        })
+
+    def test_quarterly_months_prefer_pb_sheets_and_fall_back_to_sektor_resiko(self):
+        monthly = DataLoader().load_quarterly_file(io.BytesIO(self._workbook_bytes()), "DATA TW I 2025.xlsx")
+
+        self.assertEqual(sorted(monthly), ["Februari", "Januari"])
+        januari = monthly["Januari"]["nib"][0]
+        self.assertEqual((januari.kabupaten_kota, januari.pma, januari.pmdn, januari.total), ("Kota Metro", 1, 2, 3))
+        februari = monthly["Februari"]["nib_frame"]
+        self.assertEqual(februari["kabupaten_kota"].tolist(), ["Kab. Mesuji"])
+        self.assertEqual(februari["total"].tolist(), [9])
+        self.assertEqual(februari["pma"].tolist(), [0])
+        self.assertEqual(set(februari["month"]), {"Februari"})
+
+    def test_load_from_bytes_parses_quarterly_months_from_one_read(self):
+        result = DataLoader().load_from_bytes(io.BytesIO(self._workbook_bytes()), "DATA TW I 2025.xlsx")
+
+        self.assertTrue(result["is_quarterly"])
+        self.assertEqual(result["year"], 2025)
+        self.assertEqual(sorted(result["sheets"]), ["PERIZINAN BERUSAHA JANUARI", "SEKTOR RESIKO FEBRUARI"])
+        self.assertEqual(sorted(result["monthly_data"]), ["Februari", "Januari"])
+
+
+class RealisasiInvestasiTests(TempCacheDirMixin, unittest.TestCase):
+    def test_sektor_sheets_set_totals_and_wilayah_sheets_fill_in(self):
+        sheets = {"REALISASI INVESTASI 2025": []}
+        for title, rows in [
+            ("PMA WILAYAH TW I", [("Kota Metro", 100.0, 2, 5, 1)]),
+            ("PMA SEKTOR TW I", [("Industri", 60.0, 1, 3, 0), ("Perdagangan", 50.0, 2, 4, 1)]),
+            ("PMDN WILAYAH TWII", [("Kab. Mesuji", 70.0, 3, 8, 0)]),
+        ]:
+            sheets[title] = [
+                ["NO", "WILAYAH" if "WILAYAH" in title else "SEKTOR", "JUMLAH", "PROYEK", "TKI", "TKA"],
+                [None, None, "(Rp.)"],
+                *([number, *row] for number, row in enumerate(rows, 1)),
+            ]
+        content = workbook_bytes(sheets)
+
+        reports = DataLoader().load_realisasi_investasi(io.BytesIO(content), "REALISASI INVESTASI 2025.xlsx")
+
+        self.assertEqual(sorted(reports), ["TW I", "TW II"])
+        tw1 = reports["TW I"]
+        self.assertEqual([d.name for d in tw1.pma_by_wilayah], ["Kota Metro"])
+        self.assertEqual((tw1.pma_total, tw1.pma_proyek, tw1.pma_tki, tw1.pma_tka), (110.0, 3, 7, 1))
+        tw2 = reports["TW II"]
+        self.assertEqual((tw2.year, tw2.pmdn_total, tw2.pmdn_proyek, tw2.pmdn_tki), (2025, 70.0, 3, 8))
+
+    def test_repeated_workbook_reuses_parsed_reports(self):
+        content = workbook_bytes({"PMDN SEKTOR TW III": [
+            ["NO", "SEKTOR", "JUMLAH", "PROYEK", "TKI", "TKA"],
+            [None, None, "(Rp.)"],
+            [1, "Industri", 40.0, 2, 6, 0],
+        ]})
+
+        loader = DataLoader()
+        first = loader.load_realisasi_investasi(io.BytesIO(content), "REALISASI INVESTASI 2025.xlsx")
+        with mock.patch.object(loader, "_parse_investment_rows", side_effect=AssertionError("re-parsed")):
+            second = loader.load_realisasi_investasi(io.BytesIO(content), "REALISASI INVESTASI 2025.xlsx")
+
+        self.assertEqual(second, first)
+        # Only the parsed reports are cached, not the sheets they came from
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+        self.assertIsNot(second["TW III"], first["TW III"])
+
+    def test_summary_sheet_reads_values_relative_to_periode_column(self):
+        content = workbook_bytes({"REALISASI INVESTASI 2024": [
+            ["TARGET", 5000],
+            ["NO", "TARGET", "PERIODE", "PMA", "PMDN", "JUMLAH", "%", "PROYEK", "TKI", "TKA"],
+            [1, None, "TW I", 100, 50.5, None, 3.5, "4", 10.9, "x"],
+            [2, None, "TW II", 0, 0, 0, 0, 0, 0, 0],
+            [3, "TW III"],
+        ]})
+
+        summary = DataLoader().parse_investment_summary(io.BytesIO(content), "REALISASI 2024.xlsx")
+
+        self.assertEqual(list(summary), ["TW I"])
+        tw1 = summary["TW I"]
+        self.assertEqual(
+            (tw1.year, tw1.pma_rp, tw1.pmdn_rp, tw1.total_rp, tw1.percentage, tw1.proyek, tw1.tki, tw1.tka, tw1.target_rp),
+            (2024, 100.0, 50.5, 150.5, 3.5, 4, 10, 0, 5000.0),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
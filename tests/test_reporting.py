@@ -31,13 +31,13 @@ class ReportingHelperTests(unittest.TestCase):
         semester = build_comparison_context("Semester", "Semester I", 2025)
         tahunan = build_comparison_context("Tahunan", "2025", 2025)
 
-        self.assertEqual(semester["main_target_months"], TRIWULAN_KE_BULAN["TW I"] + TRIWULAN_KE_BULAN["TW II"])
+        self.assertEqual(semester["main_target_months"], list(TRIWULAN_KE_BULAN["TW I"] + TRIWULAN_KE_BULAN["TW II"]))
         self.assertEqual(semester["qoq_curr_label"], "TW II 2025")
         self.assertEqual(semester["qoq_prev_label"], "TW I 2025")
-        self.assertEqual(semester["qoq_prev_months"], TRIWULAN_KE_BULAN["TW I"])
-        self.assertEqual(tahunan["main_target_months"], NAMA_BULAN)
+        self.assertEqual(semester["qoq_prev_months"], list(TRIWULAN_KE_BULAN["TW I"]))
+        self.assertEqual(tahunan["main_target_months"], list(NAMA_BULAN))
         self.assertEqual(tahunan["yoy_curr_label"], "Semester II 2025")
-        self.assertEqual(tahunan["qoq_prev_months"], TRIWULAN_KE_BULAN["TW I"] + TRIWULAN_KE_BULAN["TW II"])
+        self.assertEqual(tahunan["qoq_prev_months"], list(TRIWULAN_KE_BULAN["TW I"] + TRIWULAN_KE_BULAN["TW II"]))
 
     def test_nib_month_sum_does_not_regress_to_lowercase_keys(self):
         context = build_comparison_context("Triwulan", "TW III", 2025)
@@ -1,10 +1,14 @@
 import io
 import struct
+import subprocess
+import sys
 import unittest
 import zipfile
 import zlib
 import xml.etree.ElementTree as ET
+from datetime import datetime
 from types import SimpleNamespace
+from unittest import mock
 
 from app.export.docx_exporter import DOCX_AVAILABLE, WordExporter
 from app.narrative.generator import Narrative
@@ -149,6 +153,57 @@ class WordExporterParityTests(unittest.TestCase):
         self.assertIn("Kesimpulan", text)
         self.assertEqual(media, [])
 
+    def test_top_locations_table_lists_each_location(self):
+        stats = _base_stats()
+        stats["top_5_locations"] = [
+            {"Kabupaten/Kota": "Kota Metro", "Total": 1234},
+            {"Kabupaten/Kota": "Kab. Mesuji & Tulang Bawang", "Total": 5},
+        ]
+
+        docx_bytes = self.exporter.export_report(_base_report(), stats, _base_narrative(), {})
+        text, _ = _docx_text_and_media(docx_bytes)
+        with zipfile.ZipFile(io.BytesIO(docx_bytes)) as docx:
+            document_xml = docx.read("word/document.xml").decode("utf-8")
+
+        self.assertIn("Persentase\n1\nKota Metro\n1.234\n12340.0%", text)
+        self.assertIn("Kab. Mesuji & Tulang Bawang", text)
+        self.assertEqual(document_xml.count('w:fill="f8f9fa"'), 4 + 4)
+
+    def test_images_are_stored_and_xml_parts_deflated(self):
+        docx_bytes = self.export(_chart_images(["monthly", "pm"]))
+
+        with zipfile.ZipFile(io.BytesIO(docx_bytes)) as docx:
+            compression = {info.filename: info.compress_type for info in docx.infolist()}
+
+        self.assertEqual(compression["word/media/image1.png"], zipfile.ZIP_STORED)
+        self.assertEqual(compression["word/document.xml"], zipfile.ZIP_DEFLATED)
+
+    def test_save_falls_back_to_doc_save_when_package_writer_changes(self):
+        charts = _chart_images(["monthly"])
+        with mock.patch("app.export.docx_exporter._DocxZipWriter.write", side_effect=TypeError("signature")):
+            docx_bytes = self.export(charts)
+
+        with zipfile.ZipFile(io.BytesIO(docx_bytes)) as docx:
+            compression = docx.getinfo("word/media/image1.png").compress_type
+        text, media = _docx_text_and_media(docx_bytes)
+
+        self.assertEqual(compression, zipfile.ZIP_DEFLATED)
+        self.assertIn("Kesimpulan", text)
+        self.assertEqual(len(media), 1)
+
+        with mock.patch("app.export.docx_exporter._PACKAGE_WRITER_STEPS", ("_write_renamed_step",)):
+            text, media = _docx_text_and_media(self.export(charts))
+
+        self.assertIn("Kesimpulan", text)
+        self.assertEqual(len(media), 1)
+
+    def test_cover_date_uses_indonesian_month_names(self):
+        with mock.patch("app.export.docx_exporter.datetime") as fake_datetime:
+            fake_datetime.now.return_value = datetime(2025, 8, 5)
+            text, _ = _docx_text_and_media(self.export({}))
+
+        self.assertIn("Tanggal Penarikan Data: \n05 Agustus 2025", text)
+
     def test_export_narrative_html_is_cleaned_for_word_text(self):
         narratives = _base_narrative(
             proyek_skala_usaha="<b>Skala Usaha</b><br>Naik &amp; terkendali."
@@ -161,5 +216,29 @@ class WordExporterParityTests(unittest.TestCase):
         self.assertNotIn("<b>", text)
 
 
+class SektorRisikoNarrativeTests(unittest.TestCase):
+    def test_only_numbers_use_dot_thousands_separator(self):
+        narrative = WordExporter()._generate_sektor_risiko_narrative({
+            "risiko_rendah": 1234,
+            "risiko_tinggi": 5,
+            "sektor_pertanian": 3,
+        })
+
+        self.assertIn("Berdasarkan tingkat risiko, perizinan", narrative)
+        self.assertIn("mendominasi dengan 1.234 perizinan (99.6%)", narrative)
+        self.assertIn("Sektor Pertanian", narrative)
+
+
+class ExportPackageImportTests(unittest.TestCase):
+    def test_word_exporter_import_does_not_load_reportlab(self):
+        loaded = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, app.export.docx_exporter; print('reportlab' in sys.modules)"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+
+        self.assertEqual(loaded, "False")
+
+
 if __name__ == "__main__":
     unittest.main()